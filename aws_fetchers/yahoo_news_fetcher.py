@@ -5,35 +5,83 @@ S3 + DynamoDB에 저장된 Yahoo Finance 뉴스를 불러오는 유틸
 - DynamoDB 테이블: kubig-YahoofinanceNews
 - S3 버킷: kubig-yahoofinancenews
 - 각 Item에는 ticker, pk, path, et_iso 등이 포함되어 있다고 가정
+
+티커별 조회는 역색인 테이블(kubig-YahoofinanceNews-ByTicker)을 Query합니다.
+- 파티션 키 ticker, 정렬 키 sort_key = "{et_iso}#{pk}" → 최신순 Query + Limit
+- 뉴스 한 건이 여러 티커에 걸리므로(tickers 리스트) 원본 테이블의 GSI 대신
+  쓰기 시점에 티커마다 한 행씩 기록 (index_news_item / backfill_ticker_index)
+- 역색인 테이블을 쓸 수 없을 때만 원본 테이블 전체 Scan으로 폴백
+  (여러 티커는 Segment/TotalSegments 병렬 Scan 한 번으로 티커별로 나눔)
+- DYNAMODB_ENDPOINT_URL로 로컬 DynamoDB(DynamoDB Local 등)에 붙여 테스트 가능
+
+S3 원문은 sec_filings.db의 news_articles 테이블에 pk 기준으로 캐시합니다.
+(다음 실행이나 여러 티커에 걸친 같은 기사는 S3에서 다시 받지 않음)
+티커별로 마지막으로 받은 뉴스(news_fetch_state)를 기억해 그 이후 뉴스만 조회하고,
+결과는 로컬 캐시에서 최신순으로 읽습니다. (정상 상태의 수집량 = 새 뉴스 수)
 """
 
 from __future__ import annotations
 
-import json
-from datetime import datetime
-from pathlib import Path
-from typing import Dict, List, Optional
+import argparse
+import heapq
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import boto3
-from boto3.dynamodb.conditions import Attr
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from src.db import SECDatabase
+
+# 역색인 행에 복사하는 속성 (S3 원문 조회와 정렬에 필요한 것만)
+_INDEX_ATTRIBUTES = ("pk", "path", "et_iso", "title", "source")
 
 
 class YahooNewsFetcher:
+    # S3 원문 동시 다운로드 수 (boto3 연결 풀 크기도 같이 맞춤)
+    MAX_WORKERS = int(os.getenv("NEWS_DOWNLOAD_WORKERS", "8"))
+    # 역색인 없이 여러 티커를 받을 때 원본 테이블 병렬 Scan 구간 수
+    SCAN_SEGMENTS = int(os.getenv("NEWS_SCAN_SEGMENTS", "8"))
+
     def __init__(
         self,
         table_name: str = "kubig-YahoofinanceNews",
         bucket_name: str = "kubig-yahoofinancenews",
-        output_dir: str = "aws_results",
         region_name: Optional[str] = "ap-northeast-2",
+        index_table_name: Optional[str] = os.getenv("NEWS_TICKER_INDEX_TABLE", "kubig-YahoofinanceNews-ByTicker"),
+        endpoint_url: Optional[str] = os.getenv("DYNAMODB_ENDPOINT_URL"),
+        max_workers: Optional[int] = None,
+        db: Optional[SECDatabase] = None,
     ):
+        """
+        Args:
+            index_table_name: 티커 역색인 테이블 (None/빈 문자열이면 Query 없이 Scan만 사용)
+            endpoint_url: DynamoDB 엔드포인트 (로컬 DynamoDB 테스트용, None이면 AWS)
+            max_workers: S3 원문 동시 다운로드 수 (기본 NEWS_DOWNLOAD_WORKERS)
+            db: 원문 캐시(news_articles)를 둘 데이터베이스 (기본 sec_filings.db)
+        """
         self.table_name = table_name
         self.bucket_name = bucket_name
-        self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.db = db or SECDatabase()
 
         session = boto3.Session(region_name=region_name) if region_name else boto3.Session()
-        self.dynamo = session.resource("dynamodb").Table(table_name)
-        self.s3 = session.client("s3")
+        dynamodb = session.resource("dynamodb", endpoint_url=endpoint_url)
+        self._session = session
+        self._endpoint_url = endpoint_url
+        self.dynamo = dynamodb.Table(table_name)
+        self.ticker_index = dynamodb.Table(index_table_name) if index_table_name else None
+        self.max_workers = max(1, max_workers or self.MAX_WORKERS)
+        # 워커마다 연결을 하나씩 쓸 수 있도록 연결 풀 크기 지정 (기본 10개)
+        self.s3 = session.client("s3", config=Config(max_pool_connections=self.max_workers))
+        self._download_log: List[Dict] = []  # 객체별 {key, bytes, latency_ms, ok}
+        self._cache_stats = {"hits": 0, "misses": 0}
+        self._log_lock = threading.Lock()
 
     def fetch(
         self,
@@ -41,40 +89,287 @@ class YahooNewsFetcher:
         limit: int = 10,
     ) -> List[Dict]:
         """
-        DynamoDB에서 ticker에 해당하는 최신 뉴스 limit개를 가져오고,
-        S3에서 원문을 내려받아 JSON 파일로 저장합니다.
+        ticker의 최신 뉴스 limit개를 반환합니다.
+        지난 수집 이후 새로 올라온 뉴스만 DynamoDB/S3에서 받아 로컬 캐시에 합칩니다.
+        """
+        return self.fetch_many([ticker], limit=limit).get(ticker.upper(), [])
+
+    def fetch_many(
+        self,
+        tickers: List[str],
+        limit: int = 10,
+    ) -> Dict[str, List[Dict]]:
+        """
+        여러 티커의 최신 뉴스를 limit개씩 반환합니다.
+
+        1. 티커별 high-water mark(news_fetch_state) 이후의 뉴스만 DynamoDB에서 조회
+           (로컬에 limit개가 아직 없으면 mark 없이 최신 limit개)
+           역색인을 쓸 수 없으면 원본 테이블을 티커 수와 관계없이 한 번만 병렬 Scan
+        2. 캐시(news_articles)에 없는 원문만 모든 티커를 합친 하나의 다운로드 단계에서
+           스레드 풀로 병렬로 받고 캐시에 저장, 티커에 연결한 뒤 mark 갱신
+        3. 결과는 로컬 캐시에서 티커별 최신 limit개를 읽음
+
+        Returns:
+            {티커: [기사 (et_iso 최신순)]}
+        """
+        afters: Dict[str, Optional[Tuple[str, str]]] = {}
+        for ticker in dict.fromkeys(t.upper() for t in tickers):
+            state = self.db.get_news_fetch_state(ticker)
+            after = None
+            if state and state.get("last_et_iso") and self.db.count_news_articles(ticker) >= limit:
+                after = (state["last_et_iso"], state.get("last_pk") or "")
+            afters[ticker] = after
+        selected = self._select_new_items(afters, limit)
+
+        # pk별 (항목, S3 키) - 여러 티커에 걸친 같은 기사는 한 번만
+        wanted: Dict[str, Tuple[Dict, str]] = {}
+        for items in selected.values():
+            for item in items:
+                key = self._s3_key(item)
+                if key:
+                    wanted.setdefault(item["pk"], (item, key))
+
+        stored = set(self.db.get_news_articles(wanted))
+        missing = {pk: key for pk, (_, key) in wanted.items() if pk not in stored}
+        downloaded = self._download_objects(list(dict.fromkeys(missing.values())))
+        new_articles = []
+        for pk, key in missing.items():
+            body = downloaded.get(key)
+            if body is None:
+                continue
+            stored.add(pk)
+            item = wanted[pk][0]
+            new_articles.append({
+                "pk": pk,
+                "ticker": item.get("ticker"),
+                "title": item.get("title"),
+                "source": item.get("source"),
+                "published_at": item.get("et_iso"),
+                "path": item.get("path"),
+                "s3_key": key,
+                "body": body,
+            })
+        self.db.save_news_articles(new_articles)
+
+        with self._log_lock:
+            self._cache_stats["hits"] += len(wanted) - len(missing)
+            self._cache_stats["misses"] += len(missing)
+        if wanted:
+            print(f"📦 뉴스 원문 캐시 적중 {len(wanted) - len(missing)}/{len(wanted)}건 (S3 다운로드 {len(downloaded)}건)")
+
+        results: Dict[str, List[Dict]] = {}
+        for ticker, items in selected.items():
+            synced = [item for item in items if item.get("pk") in stored]
+            self.db.link_news_articles(ticker, [{"pk": item["pk"], "published_at": item.get("et_iso")} for item in synced])
+            mark = self._high_water_mark(items, stored)
+            self.db.update_news_fetch_state(
+                ticker,
+                last_et_iso=mark.get("et_iso") if mark else None,
+                last_pk=mark.get("pk") if mark else None,
+                last_success_run=datetime.now(timezone.utc),
+            )
+            # 순서는 et_iso 최신순 (로컬 인덱스 순서)
+            articles = [self._build_article(row) for row in self.db.get_recent_news_articles(ticker, limit)]
+            print(f"✅ {ticker} 뉴스 {len(articles)}건 준비 (새 뉴스 {len(synced)}/{len(items)}건 수집)")
+            results[ticker] = articles
+        return results
+
+    def get_cache_stats(self) -> Dict:
+        """원문 캐시 적중/미스 건수와 적중률 (생성 이후 누적, 기사 pk 기준)"""
+        with self._log_lock:
+            hits, misses = self._cache_stats["hits"], self._cache_stats["misses"]
+        total = hits + misses
+        return {"hits": hits, "misses": misses, "hit_rate": round(hits / total, 3) if total else 0.0}
+
+    def get_download_log(self) -> List[Dict]:
+        """S3 객체별 다운로드 기록 [{key, bytes, latency_ms, ok}] (생성 이후 누적)"""
+        with self._log_lock:
+            return list(self._download_log)
+
+    def get_download_metrics(self) -> Dict:
+        """S3 다운로드 건수 / 실패 / 바이트 / 지연 시간(p50, p95, max ms) 요약"""
+        log = self.get_download_log()
+        latencies = sorted(entry["latency_ms"] for entry in log)
+
+        def percentile(p: float) -> float:
+            return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else 0.0
+
+        return {
+            "objects": len(log),
+            "errors": sum(1 for entry in log if not entry["ok"]),
+            "bytes": sum(entry["bytes"] for entry in log),
+            "latency_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "max": latencies[-1] if latencies else 0.0},
+        }
+
+    def _select_new_items(
+        self,
+        afters: Dict[str, Optional[Tuple[str, str]]],
+        limit: int,
+    ) -> Dict[str, List[Dict]]:
+        """
+        티커별로 after(et_iso, pk)보다 새로운 뉴스를 최신순으로 최대 limit개씩 고릅니다.
+        역색인 Query를 우선 쓰고, Query가 안 되는 티커들은 한꺼번에 Scan합니다.
         """
-        ticker_upper = ticker.upper()
-        items = self._scan_ticker(ticker_upper)
-        if not items:
-            print(f"⚠️  DynamoDB에 해당 티커({ticker_upper}) 뉴스가 없습니다.")
+        selected: Dict[str, List[Dict]] = {}
+        fallback: List[str] = []
+        for ticker, after in afters.items():
+            # 한 번 Query가 안 되면 (테이블 없음/권한 없음) 나머지 티커도 Scan으로
+            items = None if fallback else self._query_ticker(ticker, limit, after)
+            if items is None:
+                fallback.append(ticker)
+                continue
+            selected[ticker] = self._trim_new_items(ticker, items, limit, after)
+
+        if len(fallback) == 1:
+            ticker = fallback[0]
+            after = afters[ticker]
+            items = self._scan_ticker(ticker, after[0] if after else None)
+            selected[ticker] = self._trim_new_items(ticker, items, limit, after)
+        elif fallback:
+            buckets = self._scan_tickers({ticker: afters[ticker] for ticker in fallback}, limit)
+            for ticker in fallback:
+                selected[ticker] = self._trim_new_items(ticker, buckets[ticker], limit, afters[ticker])
+        return {ticker: selected[ticker] for ticker in afters}
+
+    @staticmethod
+    def _trim_new_items(
+        ticker: str,
+        items: List[Dict],
+        limit: int,
+        after: Optional[Tuple[str, str]],
+    ) -> List[Dict]:
+        """after보다 새로운 항목만 최신순으로 limit개 (after가 None이면 최신 limit개)"""
+        if after:
+            items = [item for item in items if _sort_position(item) > after]
+        elif not items:
+            print(f"⚠️  DynamoDB에 해당 티커({ticker}) 뉴스가 없습니다.")
             return []
 
-        # 최신순 정렬 (et_iso 기준)
-        sorted_items = sorted(
-            items,
-            key=lambda x: x.get("et_iso", ""),
-            reverse=True,
-        )[:limit]
+        # 최신순 정렬 (et_iso, pk 기준 = 역색인 sort_key 순서)
+        return sorted(items, key=_sort_position, reverse=True)[:limit]
+
+    @staticmethod
+    def _high_water_mark(items: List[Dict], stored: set) -> Optional[Dict]:
+        """
+        저장에 성공한 항목 중 새 mark가 될 항목
+        (오래된 쪽부터 연속으로 저장된 구간까지만 → 실패한 뉴스는 다음 실행에서 다시 받음)
+        """
+        mark = None
+        for item in sorted(items, key=_sort_position):
+            if item.get("pk") not in stored:
+                break
+            mark = item
+        return mark
+
+    def _query_ticker(
+        self,
+        ticker: str,
+        limit: int,
+        after: Optional[Tuple[str, str]] = None,
+    ) -> Optional[List[Dict]]:
+        """
+        티커 역색인 테이블에서 최신순으로 limit개만 Query합니다.
+        (읽는 항목 수 = 반환 항목 수이므로 RCU도 limit개 분량만 소모)
+        after(et_iso, pk)가 있으면 sort_key가 그보다 큰 새 뉴스만 읽습니다.
+
+        Returns:
+            뉴스 항목 리스트 또는 None (역색인 테이블 미설정/없음/권한 없음 → Scan 폴백)
+        """
+        if self.ticker_index is None:
+            return None
+        items: List[Dict] = []
+        condition = Key("ticker").eq(ticker)
+        if after:
+            condition = condition & Key("sort_key").gt(f"{after[0]}#{after[1]}")
+        kwargs = {
+            "KeyConditionExpression": condition,
+            "ScanIndexForward": False,  # sort_key(et_iso#pk) 내림차순 = 최신순
+            "Limit": limit,
+        }
+        try:
+            while len(items) < limit:
+                response = self.ticker_index.query(**kwargs)
+                items.extend(response.get("Items", []))
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    break
+                kwargs["ExclusiveStartKey"] = last_key
+                kwargs["Limit"] = limit - len(items)
+        except ClientError as exc:
+            code = exc.response.get("Error", {}).get("Code")
+            print(f"⚠️  티커 역색인 Query 실패 ({code}) - 전체 Scan으로 대체")
+            return None
+        return items[:limit]
+
+    def index_news_item(self, item: Dict, batch=None) -> int:
+        """
+        원본 테이블에 뉴스를 쓸 때 함께 호출하여 티커별 역색인 행을 기록합니다.
+
+        Args:
+            item: 원본 테이블 항목 (pk, path, et_iso, tickers 또는 ticker 포함)
+            batch: Table.batch_writer() (여러 건을 쓸 때 재사용)
+
+        Returns:
+            기록한 역색인 행 수
+        """
+        if self.ticker_index is None or not item.get("pk") or not item.get("et_iso"):
+            return 0
+        tickers = _item_tickers(item)
+        writer = batch or self.ticker_index
+        for ticker in tickers:
+            row = {key: item[key] for key in _INDEX_ATTRIBUTES if item.get(key) is not None}
+            row["ticker"] = ticker
+            row["sort_key"] = f"{item['et_iso']}#{item['pk']}"
+            writer.put_item(Item=row)
+        return len(tickers)
 
-        saved = []
-        for idx, item in enumerate(sorted_items, 1):
-            article = self._download_article(item)
-            if article:
-                filename = self._save_article(ticker_upper, article, idx)
-                saved.append({"filepath": str(filename), **article})
+    def backfill_ticker_index(self) -> int:
+        """원본 테이블을 한 번 Scan하여 역색인 테이블을 채웁니다 (최초 1회 / 복구용)."""
+        if self.ticker_index is None:
+            return 0
+        written = 0
+        kwargs: Dict = {}
+        with self.ticker_index.batch_writer(overwrite_by_pkeys=["ticker", "sort_key"]) as batch:
+            while True:
+                response = self.dynamo.scan(**kwargs)
+                for item in response.get("Items", []):
+                    written += self.index_news_item(item, batch=batch)
+                last_key = response.get("LastEvaluatedKey")
+                if not last_key:
+                    break
+                kwargs["ExclusiveStartKey"] = last_key
+        print(f"✅ 티커 역색인 {written}행 기록")
+        return written
 
-        print(f"✅ {ticker_upper} 뉴스 {len(saved)}/{len(sorted_items)}건 저장")
-        return saved
+    def create_ticker_index_table(self) -> None:
+        """역색인 테이블 생성 (로컬 DynamoDB 테스트 / 최초 배포용)"""
+        client = self.ticker_index.meta.client
+        client.create_table(
+            TableName=self.ticker_index.name,
+            KeySchema=[
+                {"AttributeName": "ticker", "KeyType": "HASH"},
+                {"AttributeName": "sort_key", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "ticker", "AttributeType": "S"},
+                {"AttributeName": "sort_key", "AttributeType": "S"},
+            ],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        client.get_waiter("table_exists").wait(TableName=self.ticker_index.name)
 
-    def _scan_ticker(self, ticker: str) -> List[Dict]:
+    def _scan_ticker(self, ticker: str, since_et_iso: Optional[str] = None) -> List[Dict]:
         """
-        ticker attribute를 기준으로 DynamoDB를 스캔.
-        (테이블 설계에 따라 적절히 수정 필요)
+        ticker attribute를 기준으로 DynamoDB를 스캔. (역색인 Query를 쓸 수 없을 때의 폴백)
+        테이블 전체를 읽으므로 모든 항목의 RCU를 소모합니다.
+        (since_et_iso는 반환 항목만 줄이고 읽는 양은 같음)
         """
         items: List[Dict] = []
+        condition = Attr("tickers").contains(ticker)
+        if since_et_iso:
+            condition = condition & Attr("et_iso").gte(since_et_iso)
         kwargs = {
-            "FilterExpression": Attr("tickers").contains(ticker),
+            "FilterExpression": condition,
         }
 
         while True:
@@ -87,40 +382,114 @@ class YahooNewsFetcher:
 
         return items
 
-    def _download_article(self, item: Dict) -> Optional[Dict]:
+    def _scan_tickers(
+        self,
+        afters: Dict[str, Optional[Tuple[str, str]]],
+        limit: int,
+    ) -> Dict[str, List[Dict]]:
+        """
+        원본 테이블을 Segment/TotalSegments로 나눠 스레드별로 한 번만 Scan하고,
+        각 항목의 tickers를 펼쳐 추적 중인 티커별 최신 limit개로 나눕니다.
+        (티커마다 Scan하면 티커 수 × 테이블 전체를 읽음)
+        """
+        total = max(1, self.SCAN_SEGMENTS)
+        # boto3 resource는 스레드 간 공유하면 안 되므로 구간마다 따로 만듦
+        tables = [
+            self._session.resource("dynamodb", endpoint_url=self._endpoint_url).Table(self.table_name)
+            for _ in range(total)
+        ]
+        with ThreadPoolExecutor(max_workers=total) as executor:
+            parts = list(executor.map(
+                lambda segment: self._scan_segment(tables[segment], segment, total, afters, limit),
+                range(total),
+            ))
+
+        buckets: Dict[str, List[Dict]] = {ticker: [] for ticker in afters}
+        for part in parts:
+            for ticker, items in part.items():
+                buckets[ticker].extend(items)
+        print(f"🔎 DynamoDB 병렬 Scan 1회({total}개 구간)로 {len(afters)}개 티커 뉴스 분류")
+        return buckets
+
+    @staticmethod
+    def _scan_segment(
+        table,
+        segment: int,
+        total: int,
+        afters: Dict[str, Optional[Tuple[str, str]]],
+        limit: int,
+    ) -> Dict[str, List[Dict]]:
+        """Scan 구간 하나를 읽으며 티커별 최신 limit개만 힙으로 유지"""
+        # (정렬 키, 일련번호, 항목) - 정렬 키가 같아도(pk 누락/중복) 딕셔너리끼리 비교하지 않도록 일련번호를 둠
+        heaps: Dict[str, List[Tuple[Tuple[str, str], int, Dict]]] = {ticker: [] for ticker in afters}
+        sequence = itertools.count()
+        kwargs: Dict = {"Segment": segment, "TotalSegments": total}
+        while True:
+            response = table.scan(**kwargs)
+            for item in response.get("Items", []):
+                position = _sort_position(item)
+                for ticker in _item_tickers(item):
+                    heap = heaps.get(ticker)
+                    if heap is None:
+                        continue
+                    after = afters[ticker]
+                    if after and position <= after:
+                        continue
+                    if len(heap) < limit:
+                        heapq.heappush(heap, (position, next(sequence), item))
+                    elif position > heap[0][0]:
+                        heapq.heapreplace(heap, (position, next(sequence), item))
+            last_key = response.get("LastEvaluatedKey")
+            if not last_key:
+                break
+            kwargs["ExclusiveStartKey"] = last_key
+        return {ticker: [item for _, _, item in heap] for ticker, heap in heaps.items()}
+
+    def _s3_key(self, item: Dict) -> Optional[str]:
         pk = item.get("pk")
         path = item.get("path")
         if not pk or not path:
             print(f"⚠️  pk/path 정보가 없어 스킵: {item}")
             return None
+        return self._build_s3_key(path, pk)
 
-        key = self._build_s3_key(path, pk)
+    def _download_objects(self, keys: List[str]) -> Dict[str, str]:
+        """S3 객체들을 스레드 풀에서 병렬로 받음 (실패한 키는 결과에서 제외)"""
+        if not keys:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(keys))) as executor:
+            bodies = executor.map(self._get_object, keys)
+            return {key: body for key, body in zip(keys, bodies) if body is not None}
 
+    def _get_object(self, key: str) -> Optional[str]:
+        started = time.monotonic()
+        body = None
+        nbytes = 0
         try:
             obj = self.s3.get_object(Bucket=self.bucket_name, Key=key)
-            body = obj["Body"].read().decode("utf-8")
+            raw = obj["Body"].read()
+            nbytes = len(raw)
+            body = raw.decode("utf-8")
         except Exception as exc:
             print(f"❌ S3 다운로드 실패 ({key}): {exc}")
-            return None
+        latency_ms = round((time.monotonic() - started) * 1000, 1)
+        with self._log_lock:
+            self._download_log.append({"key": key, "bytes": nbytes, "latency_ms": latency_ms, "ok": body is not None})
+        return body
 
+    @staticmethod
+    def _build_article(row: Dict) -> Dict:
+        """캐시 행 → 에이전트가 쓰는 뉴스 딕셔너리"""
         return {
-            "pk": pk,
-            "path": path,
-            "ticker": item.get("ticker"),
-            "published_at": item.get("et_iso"),
-            "source": item.get("source"),
-            "title": item.get("title"),
-            "article_raw": body,
+            "pk": row["pk"],
+            "path": row.get("path"),
+            "ticker": row["ticker"],
+            "published_at": row.get("published_at"),
+            "source": row.get("source"),
+            "title": row.get("title"),
+            "article_raw": row["body"],
         }
 
-    def _save_article(self, ticker: str, article: Dict, index: int) -> Path:
-        timestamp = article.get("published_at") or datetime.utcnow().isoformat()
-        safe_ts = timestamp.replace(":", "").replace("-", "")
-        filename = self.output_dir / f"{ticker}_{safe_ts}_{index}.json"
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(article, f, ensure_ascii=False, indent=2)
-        return filename
-
     @staticmethod
     def _build_s3_key(path: str, pk: str) -> str:
         """
@@ -134,3 +503,33 @@ class YahooNewsFetcher:
         if not normalized.endswith("/"):
             normalized = f"{normalized}/"
         return f"{normalized}{pk}.xml"
+
+
+def _sort_position(item: Dict) -> Tuple[str, str]:
+    """역색인 sort_key("{et_iso}#{pk}")와 같은 순서의 정렬 키"""
+    return (item.get("et_iso") or "", item.get("pk") or "")
+
+
+def _item_tickers(item: Dict) -> List[str]:
+    """항목의 티커 목록 (tickers는 리스트/집합/쉼표 문자열, 없으면 ticker)"""
+    raw: Iterable = item.get("tickers") or item.get("ticker") or []
+    if isinstance(raw, str):
+        raw = raw.split(",")
+    return sorted({str(t).strip().upper() for t in raw if str(t).strip()})
+
+
+def main():
+    """여러 티커의 뉴스를 한 번에 수집 (야간 배치용)"""
+    parser = argparse.ArgumentParser(description="Yahoo Finance 뉴스 일괄 수집")
+    parser.add_argument("--tickers", nargs="+", required=True, help="수집할 티커 목록")
+    parser.add_argument("--limit", type=int, default=10, help="티커별 최신 뉴스 수")
+    args = parser.parse_args()
+
+    fetcher = YahooNewsFetcher()
+    fetcher.fetch_many(args.tickers, limit=args.limit)
+    print(f"📊 원문 캐시: {fetcher.get_cache_stats()}")
+    print(f"📊 S3 다운로드: {fetcher.get_download_metrics()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,32 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from .base_agent import BaseAgent
 from multiagent.services import AgentToolkit
 from multiagent.prompts import RISK_BLIND_PROMPT, RISK_REBUTTAL_PROMPT
+from src.filing_sections import FilingSectionIndex
 
 
 class RiskManager(BaseAgent):
     """Ray Dalio 스타일 리스크 관리 전문가"""
 
-    def __init__(self, toolkit: AgentToolkit, name: str = "Risk Manager"):
+    def __init__(
+        self,
+        toolkit: AgentToolkit,
+        name: str = "Risk Manager",
+        sections: Optional[FilingSectionIndex] = None,
+    ):
         super().__init__(name=name, role="risk")
         self.toolkit = toolkit
+        self._sections = sections
+
+    @property
+    def sections(self) -> FilingSectionIndex:
+        """수집 시점에 만든 10-K/10-Q 섹션 인덱스 (처음 사용할 때 생성)"""
+        if self._sections is None:
+            self._sections = FilingSectionIndex()
+        return self._sections
 
     def blind_assessment(self, dataset: Dict[str, Any]) -> str:
         """초기 분석: SEC 공시와 뉴스에서 리스크 요인 추출"""
@@ -48,12 +62,8 @@ class RiskManager(BaseAgent):
                 filed = meta.get("filed_date") or meta.get("filed") or "N/A"
                 entity = meta.get("filing_entity", "")
                 text = filing.get("content") or ""
-                # Risk Factors 섹션이 있으면 우선 추출
-                if "risk factors" in text.lower():
-                    risk_section_start = text.lower().find("risk factors")
-                    snippet = text[risk_section_start:risk_section_start+3000]
-                else:
-                    snippet = text[:2000]
+                # Risk Factors(Item 1A) 섹션이 인덱싱되어 있으면 해당 구간만 사용
+                snippet = self._risk_factors(meta) or text[:2000]
                 lines.append(f"[Form {form} | {filed} | {entity}]\n{snippet}")
         else:
             lines.append("=== SEC 공시 데이터 ===\n관련 공시가 없습니다.")
@@ -74,3 +84,15 @@ class RiskManager(BaseAgent):
         
         return "\n\n".join(lines)
 
+    def _risk_factors(self, meta: Dict[str, Any]) -> Optional[str]:
+        """Item 1A (10-Q는 Part II Item 1A) 앞부분 3,000바이트"""
+        accession = meta.get("accession_number")
+        if not accession:
+            return None
+        # 10-Q의 Part I에는 Item 1A가 없으므로 Part II로 지정
+        part = "II" if (meta.get("form") or "").upper().startswith("10-Q") else None
+        try:
+            return self.sections.get_section(accession, "1A", part=part, max_bytes=3000)
+        except Exception as exc:
+            print(f"⚠️  Risk Factors 섹션 조회 실패 ({accession}): {exc}")
+            return None
@@ -21,6 +21,7 @@ from multiagent.agents.sentiment_analyst import SentimentAnalyst
 from multiagent.agents.moderator import Moderator
 from multiagent.prompts import GUIDED_DEBATE_PROMPT, SENTIMENT_GUIDED_PROMPT
 from multiagent.schemas import InvestmentConclusion
+from src.db import SECDatabase
 
 
 class AgentState(TypedDict, total=False):
@@ -281,6 +282,21 @@ def guided_debate_node(state: AgentState) -> AgentState:
             return result
         return f"뉴스 {news_id}번을 찾을 수 없습니다."
     
+    # 공시/뉴스 본문 검색 도구 핸들러 (FTS5 인덱스, 해당 티커 범위)
+    def search_documents_handler(query: str, k: int = 5) -> str:
+        """질의와 관련성이 높은 공시/뉴스 구절 조회"""
+        try:
+            hits = SECDatabase().search(ticker, query, k=min(k or 5, 10))
+        except Exception as exc:
+            return f"검색 실패: {exc}"
+        if not hits:
+            return f"'{query}' 관련 구절을 찾을 수 없습니다."
+        blocks = []
+        for hit in hits:
+            header = f"[{hit['kind']} {hit['doc_date'] or ''}] {hit['title'] or hit['ref']}"
+            blocks.append(f"{header}\n{hit['text'][:800]}")
+        return "\n\n".join(blocks)
+    
     # 각 에이전트에 tool calling 적용
     def get_guided_response(agent_name: str):
         agent = agents[agent_name]
@@ -303,6 +319,25 @@ def guided_debate_node(state: AgentState) -> AgentState:
             },
             handler=get_news_detail_handler
         )
+        toolkit.register_tool(
+            name="search_documents",
+            description="해당 종목의 SEC 공시 본문과 뉴스 기사에서 질의와 가장 관련 있는 구절을 찾습니다. 특정 리스크/사업 내용의 원문 근거가 필요할 때 사용하세요.",
+            parameters={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "검색어 (영문 키워드 권장, 예: 'supply chain risk')"
+                    },
+                    "k": {
+                        "type": "integer",
+                        "description": "반환할 구절 수 (기본 5, 최대 10)"
+                    }
+                },
+                "required": ["query"]
+            },
+            handler=search_documents_handler
+        )
         
         # Sentiment Analyst는 뉴스 필수 프롬프트 사용
         if agent_name == "sentiment":
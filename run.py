@@ -60,8 +60,8 @@ def run_crawling(ticker: str) -> dict:
     print("📥 SEC 크롤링 시작")
     print("=" * 100)
     
-    sec_crawler = SECCrawler()
     db = SECDatabase()
+    sec_crawler = SECCrawler(db=db)
     
     print(f"\n[{ticker}] SEC 공시 크롤링 중...")
     results = sec_crawler.crawl_filings_in_window(
@@ -85,7 +85,19 @@ def run_crawling(ticker: str) -> dict:
     else:
         print(f"  ⚪ 새로운 공시 없음 (기존 데이터 사용)")
     
+    http = sec_crawler.get_http_metrics()
+    stats["http"] = http
+    stats.update(sec_crawler.get_crawl_stats())
+    
     print(f"\n📊 크롤링 결과: {stats['total']}건 (10-K: {'✅' if stats['10-K'] else '❌'}, 10-Q: {'✅' if stats['10-Q'] else '❌'})")
+    print(
+        f"📦 다운로드 {stats['downloaded']}건, 기존 공시 스킵 {stats['skipped_existing']}건, "
+        f"실패 {stats['failed']}건"
+    )
+    print(
+        f"🌐 SEC 요청: {http['requests']}회 (재시도 {http['retries']}회), "
+        f"{http['bytes'] / 1_000_000:.1f}MB, {http['requests_per_sec']} req/s, {http['elapsed_sec']}초"
+    )
     print("=" * 100)
     
     return stats
@@ -168,7 +180,7 @@ def main():
         result = run_analysis(ticker, save=save, output_dir=args.output_dir)
         
         # 3단계: 사용하지 않은 파일만 삭제 (검증용 데이터 유지)
-        cleanup_unused_files(ticker, result)
+        cleanup_unused_files()
     else:
         print("\n⏭️  분석 생략 (--crawl-only)")
         result = None
@@ -182,56 +194,26 @@ def main():
     return result
 
 
-def cleanup_unused_files(ticker: str, result: dict):
-    """임시 파일 정리 (뉴스 전체 삭제 - pk로 DynamoDB 재조회 가능)"""
-    import shutil
-    
-    sources = result.get("sources", {})
-    
-    # 1. 뉴스 파일 전체 삭제 (검증 에이전트는 pk로 DynamoDB 직접 조회)
-    aws_results_dir = Path("aws_results")
-    if aws_results_dir.exists():
-        ticker_files = list(aws_results_dir.glob(f"{ticker}_*.json"))
-        for f in ticker_files:
-            f.unlink()
-        if ticker_files:
-            print(f"\n🧹 뉴스 임시 파일 삭제: {len(ticker_files)}개")
-    
-    # 2. SEC 파일 정리: sources에 있는 파일 + 10-K/10-Q는 항상 유지
-    sec_dir = Path("downloads/sec_filings")
-    if sec_dir.exists():
-        # 새 sources 구조: sources["sources"] 배열에서 type="sec_filing" 추출
-        all_sources = sources.get("sources", [])
-        used_accessions = set()
-        for item in all_sources:
-            if item.get("type") == "sec_filing":
-                acc = item.get("accession_number", "")
-                if acc:
-                    # 0001652044-25-000014 -> 000165204425000014
-                    used_accessions.add(acc.replace("-", ""))
-        
-        kept_count = 0
-        deleted_count = 0
-        
-        for f in sec_dir.glob(f"*{ticker}*") if ticker else sec_dir.glob("*.xml"):
-            stem = f.stem
-            
-            # 10-K/10-Q는 항상 유지 (FilingSummary.xml 포함)
-            if "FilingSummary" in stem:
-                kept_count += 1
-                continue
-            
-            # sources에 있는 파일만 유지
-            is_used = any(acc in stem for acc in used_accessions)
-            
-            if is_used:
-                kept_count += 1
-            else:
-                f.unlink()
-                deleted_count += 1
-        
-        if kept_count > 0 or deleted_count > 0:
-            print(f"🧹 SEC 파일 정리: {kept_count}개 유지, {deleted_count}개 삭제")
+def cleanup_unused_files():
+    """
+    사용하지 않는 SEC 원문 정리 (티커와 관계없이 DB 참조 수 기준)
+    뉴스 원문은 sec_filings.db의 news_articles 캐시에 있으므로 정리할 파일이 없습니다.
+    """
+    # SEC 원문 정리: 원문은 내용 주소 압축 블롭이므로 파일명이 아닌 DB 참조 수로 판단
+    #    (예전 방식의 비압축 파일은 먼저 블롭으로 옮김)
+    from src.blob_store import BlobStore
+    from src.db import SECDatabase
+    db = SECDatabase()
+    blob_store = BlobStore()
+    adopted = blob_store.adopt_legacy_files(db)
+    if adopted["adopted"]:
+        print(f"🗜️  SEC 원문 압축 저장소로 이동: {adopted['adopted']}개 ({adopted['raw_bytes'] / 1_000_000:.1f}MB)")
+    gc_stats = blob_store.collect_garbage(db)
+    if gc_stats["deleted"]:
+        print(
+            f"🧹 SEC 원문 정리: {gc_stats['kept']}개 유지, {gc_stats['deleted']}개 삭제 "
+            f"({gc_stats['freed_bytes'] / 1_000_000:.1f}MB)"
+        )
 
 
 if __name__ == "__main__":
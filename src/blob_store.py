@@ -0,0 +1,160 @@
+"""
+공시 원문 블롭 저장소 모듈
+다운로드한 원문을 SHA-256 내용 주소로 gzip 압축 저장합니다.
+같은 내용(정정 공시에 다시 붙은 동일 첨부 등)은 한 번만 저장되고,
+filings.file_path에는 "blob:<sha256>" 참조가 기록됩니다.
+어떤 공시 행도 참조하지 않는 블롭은 DB 참조 수 기준으로 정리(GC)합니다.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Union
+
+from src.db import BLOB_REF_PREFIX, SECDatabase, is_blob_ref
+
+FileRef = Union[str, Path]
+
+
+class BlobStore:
+    """SHA-256 내용 주소 기반 gzip 압축 원문 저장소"""
+
+    ROOT = os.getenv("SEC_BLOB_DIR", "downloads/sec_blobs")
+    COMPRESS_LEVEL = int(os.getenv("SEC_BLOB_GZIP_LEVEL", "6"))
+    # 방금 저장했지만 아직 DB에 기록되지 않은 블롭을 GC가 지우지 않도록 두는 유예 시간
+    GC_GRACE_SEC = 3600
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Args:
+            root: 블롭 디렉토리 (기본 SEC_BLOB_DIR 또는 downloads/sec_blobs)
+        """
+        self.root = Path(root or self.ROOT)
+
+    @staticmethod
+    def ref_for(sha256: str) -> str:
+        return f"{BLOB_REF_PREFIX}{sha256}"
+
+    @staticmethod
+    def digest(ref: str) -> str:
+        return ref[len(BLOB_REF_PREFIX):]
+
+    def path_for(self, ref: str) -> Path:
+        """블롭 참조 → 저장 경로 (해시 앞 2자리로 디렉토리 분산)"""
+        digest = self.digest(ref)
+        return self.root / digest[:2] / f"{digest}.gz"
+
+    def put_file(self, path: Path, sha256: Optional[str] = None, remove_source: bool = True) -> str:
+        """
+        원문 파일을 압축 저장하고 블롭 참조를 반환합니다.
+        같은 해시의 블롭이 이미 있으면 다시 쓰지 않습니다.
+
+        Args:
+            path: 다운로드한 원문 파일
+            sha256: 다운로드 중 계산한 해시 (None이면 지금 계산)
+            remove_source: 저장 후 원문 파일 삭제 여부
+        """
+        sha256 = sha256 or _file_sha256(path)
+        ref = self.ref_for(sha256)
+        blob_path = self.path_for(ref)
+        if not blob_path.exists():
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            # 임시 파일에 압축 후 원자적으로 rename (동시 저장/중단 시 깨진 블롭 방지)
+            fd, tmp_name = tempfile.mkstemp(dir=blob_path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as raw_out, \
+                        gzip.GzipFile(fileobj=raw_out, mode="wb", compresslevel=self.COMPRESS_LEVEL, mtime=0) as out, \
+                        open(path, "rb") as src:
+                    shutil.copyfileobj(src, out, 1 << 20)
+                os.replace(tmp_name, blob_path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        else:
+            os.utime(blob_path)  # 중복 저장: GC 유예 시간 갱신
+        if remove_source:
+            path.unlink(missing_ok=True)
+        return ref
+
+    def exists(self, ref: Optional[FileRef]) -> bool:
+        """블롭 참조 또는 (예전 방식의) 파일 경로가 실제로 있는지"""
+        if not ref:
+            return False
+        return self._resolve(ref).exists()
+
+    def open(self, ref: FileRef) -> BinaryIO:
+        """원문을 바이너리 스트림으로 엽니다 (블롭은 투명하게 압축 해제)"""
+        if is_blob_ref(ref):
+            return gzip.open(self.path_for(str(ref)), "rb")
+        return open(ref, "rb")
+
+    def read_bytes(self, ref: FileRef) -> bytes:
+        with self.open(ref) as f:
+            return f.read()
+
+    def read_text(self, ref: FileRef) -> str:
+        return self.read_bytes(ref).decode("utf-8", errors="ignore")
+
+    def adopt_legacy_files(self, db: SECDatabase) -> Dict[str, int]:
+        """
+        예전 방식(downloads/sec_filings/ 비압축 파일)으로 저장된 공시를 블롭으로 옮기고
+        filings.file_path를 블롭 참조로 바꿉니다.
+
+        Returns:
+            {"adopted": 옮긴 파일 수, "raw_bytes": 원본 크기 합계}
+        """
+        adopted = 0
+        raw_bytes = 0
+        for row in db.get_legacy_file_rows():
+            path = Path(row["file_path"])
+            if not path.exists():
+                continue
+            size = path.stat().st_size
+            sha256 = row.get("sha256") or _file_sha256(path)
+            ref = self.put_file(path, sha256, remove_source=False)
+            if db.update_filing_file(row["accession_number"], ref, sha256=sha256, file_size=size):
+                path.unlink(missing_ok=True)
+                adopted += 1
+                raw_bytes += size
+        return {"adopted": adopted, "raw_bytes": raw_bytes}
+
+    def collect_garbage(self, db: SECDatabase) -> Dict[str, int]:
+        """
+        filings에서 참조 수가 0인 블롭을 삭제합니다.
+        (최근 GC_GRACE_SEC 이내에 쓴 블롭은 저장 중일 수 있으므로 남김)
+
+        Returns:
+            {"kept": 유지한 블롭 수, "deleted": 삭제한 블롭 수, "freed_bytes": 확보한 바이트}
+        """
+        ref_counts = db.get_blob_ref_counts()
+        cutoff = time.time() - self.GC_GRACE_SEC
+        stats = {"kept": 0, "deleted": 0, "freed_bytes": 0}
+        if not self.root.exists():
+            return stats
+        for blob_path in self.root.glob("*/*.gz"):
+            digest = blob_path.name[:-len(".gz")]
+            stat = blob_path.stat()
+            if ref_counts.get(digest, 0) > 0 or stat.st_mtime > cutoff:
+                stats["kept"] += 1
+                continue
+            blob_path.unlink(missing_ok=True)
+            stats["deleted"] += 1
+            stats["freed_bytes"] += stat.st_size
+        return stats
+
+    def _resolve(self, ref: FileRef) -> Path:
+        return self.path_for(str(ref)) if is_blob_ref(ref) else Path(ref)
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
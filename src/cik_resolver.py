@@ -0,0 +1,163 @@
+"""
+티커 → CIK 변환 모듈
+SEC company_tickers.json을 메모리 + SQLite에 캐싱하고,
+TTL이 지나면 ETag/If-Modified-Since 조건부 요청으로 재검증합니다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional
+
+import requests
+
+from src.db import SECDatabase
+from src.time_utils import parse_iso_datetime
+
+
+class CIKResolver:
+    """티커 → CIK 매핑을 캐싱하여 조회하는 클래스"""
+
+    TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
+    TTL_HOURS = int(os.getenv("SEC_CIK_CACHE_TTL_HOURS", "24"))
+    # 캐시가 비어 있을 때 갱신 실패 후 다시 시도하기까지 기다리는 시간
+    RETRY_AFTER = timedelta(minutes=5)
+
+    def __init__(
+        self,
+        session: requests.Session,
+        db: Optional[SECDatabase] = None,
+        ttl_hours: Optional[int] = None,
+    ):
+        """
+        Args:
+            session: SEC User-Agent가 설정된 requests 세션
+            db: 매핑을 영구 저장할 데이터베이스 (None이면 기본 DB)
+            ttl_hours: 재검증 주기 (시간)
+        """
+        self.session = session
+        self.db = db or SECDatabase()
+        self.ttl = timedelta(hours=ttl_hours if ttl_hours is not None else self.TTL_HOURS)
+        self._map: Dict[str, str] = {}
+        self._checked_at: Optional[datetime] = None
+        self._failed_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    def resolve(self, ticker: str) -> Optional[str]:
+        """
+        티커 하나를 CIK(10자리)로 변환합니다.
+
+        Args:
+            ticker: 주식 티커 심볼 (예: "NVDA")
+
+        Returns:
+            CIK 번호 (문자열) 또는 None
+        """
+        return self.resolve_many([ticker]).get(ticker.upper())
+
+    def resolve_many(self, tickers: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        여러 티커를 한 번에 CIK로 변환합니다.
+        매핑 재검증은 호출당 최대 1회만 수행됩니다.
+
+        Returns:
+            {티커(대문자): CIK 또는 None}
+        """
+        self._ensure_fresh()
+        return {t.upper(): self._map.get(t.upper()) for t in tickers}
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        company_tickers.json을 조건부 요청으로 재검증합니다.
+
+        Args:
+            force: True면 검증자(ETag 등) 없이 전체를 다시 받음
+
+        Returns:
+            매핑이 갱신되었으면 True (304 또는 실패 시 False)
+        """
+        with self._lock:
+            return self._revalidate(force=force)
+
+    def _ensure_fresh(self) -> None:
+        with self._lock:
+            if not self._map:
+                self._map = self.db.get_cik_map()
+                state = self.db.get_http_validators(self.TICKERS_URL)
+                self._checked_at = self._parse_checked_at(state)
+            if self._is_stale() and not self._in_backoff():
+                self._revalidate(force=not self._map)
+
+    def _is_stale(self) -> bool:
+        if not self._map or self._checked_at is None:
+            return True
+        return datetime.now(timezone.utc) - self._checked_at >= self.ttl
+
+    def _in_backoff(self) -> bool:
+        return self._failed_at is not None and datetime.now(timezone.utc) - self._failed_at < self.RETRY_AFTER
+
+    def _revalidate(self, force: bool = False) -> bool:
+        headers: Dict[str, str] = {}
+        state = None if force else self.db.get_http_validators(self.TICKERS_URL)
+        if state:
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
+
+        now = datetime.now(timezone.utc)
+        try:
+            response = self.session.get(self.TICKERS_URL, headers=headers, timeout=30)
+            if response.status_code == 304:
+                self.db.update_http_validators(self.TICKERS_URL, checked_at=now)
+                self._checked_at = now
+                return False
+            response.raise_for_status()
+            companies = response.json()
+        except Exception as e:
+            # 네트워크 오류 시 기존 캐시를 그대로 사용
+            # (캐시가 있으면 다음 TTL까지, 없으면 RETRY_AFTER 동안 다시 요청하지 않음)
+            print(f"CIK 매핑 갱신 중 오류 발생: {e}")
+            if self._map:
+                self._checked_at = now
+            self._failed_at = now
+            return False
+
+        entries = []
+        for entry in companies.values():
+            ticker = (entry.get("ticker") or "").upper()
+            if not ticker:
+                continue
+            entries.append({
+                "ticker": ticker,
+                "cik": str(entry["cik_str"]).zfill(10),  # CIK는 10자리로 패딩
+                "title": entry.get("title"),
+            })
+
+        self.db.replace_cik_map(entries)
+        self.db.update_http_validators(
+            self.TICKERS_URL,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            checked_at=now,
+        )
+        # 동일 티커가 여러 번 나오면 첫 항목 우선 (기존 선형 탐색과 동일)
+        mapping: Dict[str, str] = {}
+        for entry in entries:
+            mapping.setdefault(entry["ticker"], entry["cik"])
+        self._map = mapping
+        self._checked_at = now
+        self._failed_at = None
+        print(f"CIK 매핑 갱신 완료: {len(mapping)}개 티커")
+        return True
+
+    @staticmethod
+    def _parse_checked_at(state: Optional[Dict]) -> Optional[datetime]:
+        if not state:
+            return None
+        checked_at = parse_iso_datetime(state.get("checked_at"))
+        if checked_at and checked_at.tzinfo is None:
+            checked_at = checked_at.replace(tzinfo=timezone.utc)
+        return checked_at
@@ -4,13 +4,14 @@
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from dotenv import load_dotenv
 
 from src.db import SECDatabase
+from src.filing_text import FilingTextStore
 from src.time_utils import get_last_24h_window, KST
 
 load_dotenv()
@@ -18,9 +19,14 @@ load_dotenv()
 
 class DataFetcher:
     """6시~6시 기준 데이터 조회 클래스"""
+
+    # 여러 티커 조회 시 파일(정제 텍스트) 로딩 워커 수
+    MAX_WORKERS = int(os.getenv("DATA_FETCH_WORKERS", "4"))
     
     def __init__(self):
         self.db = SECDatabase()
+        self.text_store = FilingTextStore(self.db)
+        self.blobs = self.text_store.blobs  # 압축 원문 저장소 (예전 파일 경로도 투명하게 읽음)
     
     def fetch_ticker_data(
         self,
@@ -40,16 +46,10 @@ class DataFetcher:
                 'ticker': str,
                 'period': {'start': datetime, 'end': datetime},
                 'news': List[Dict],  # 로컬 뉴스 데이터
-                'sec_filings': List[Dict]  # SEC 파일 (메타 + 내용)
+                'sec_filings': List[Dict]  # SEC 파일 (메타 + 내용: FilingContent mmap 핸들)
             }
         """
-        window_days = os.getenv("SEC_CRAWLER_WINDOW_DAYS")
-        if window_days:
-            days = max(1, int(window_days))
-            end = datetime.now(KST)
-            start = end - timedelta(days=days)
-        else:
-            start, end = get_last_24h_window()
+        start, end = self._get_window()
         
         # 2. 로컬 DB에서 뉴스 조회
         news = self.db.get_news(
@@ -67,6 +67,101 @@ class DataFetcher:
         
         # 4. 가장 최근 10-K, 10-Q는 항상 포함 (기간과 관계없이)
         latest_annuals = self.db.get_latest_annual_quarterly(ticker)
+        
+        return self._build_ticker_data(
+            ticker, start, end, news, sec_metadata, latest_annuals, include_file_content
+        )
+    
+    def fetch_all_tickers(
+        self,
+        tickers: List[str],
+        include_file_content: bool = True
+    ) -> Dict[str, Dict]:
+        """
+        여러 ticker의 데이터를 한번에 조회
+        
+        Args:
+            tickers: 종목 코드 리스트
+            include_file_content: SEC 파일 내용 포함 여부
+        
+        Returns:
+            {ticker: data} 딕셔너리 (입력 순서, 실패한 ticker는 None)
+        """
+        results = dict(self.iter_all_tickers(tickers, include_file_content))
+        return {ticker: results.get(ticker) for ticker in tickers}
+    
+    def iter_all_tickers(
+        self,
+        tickers: List[str],
+        include_file_content: bool = True,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[Tuple[str, Optional[Dict]]]:
+        """
+        여러 ticker의 데이터를 준비되는 대로 하나씩 반환
+        
+        DB 조회는 유니버스 전체에 대해 집합 쿼리 몇 번으로 끝내고
+        (뉴스 1회, 기간 내 공시 + 양식별 최신 10-K/10-Q 1회, 정제 텍스트 정보 1회),
+        티커별 파일 로딩만 제한된 스레드 풀에서 병렬로 처리합니다.
+        
+        Yields:
+            (ticker, data) - 완료 순서, 실패한 ticker는 data가 None
+        """
+        tickers = list(dict.fromkeys(tickers))
+        if not tickers:
+            return
+        start, end = self._get_window()
+        news_by_ticker = self.db.get_news_for_tickers(tickers, start_time=start, end_time=end)
+        filings_by_ticker = self.db.get_filings_for_tickers(tickers, start, end)
+        text_records = {}
+        if include_file_content:
+            text_records = self.db.get_filing_texts(
+                filing['accession_number']
+                for entry in filings_by_ticker.values()
+                for filing in entry['window'] + [f for f in entry['latest'].values() if f]
+            )
+        
+        def build(ticker: str) -> Dict:
+            entry = filings_by_ticker[ticker.upper()]
+            return self._build_ticker_data(
+                ticker, start, end,
+                news_by_ticker[ticker.upper()], entry['window'], entry['latest'],
+                include_file_content, text_records,
+            )
+        
+        with ThreadPoolExecutor(max_workers=max_workers or self.MAX_WORKERS) as executor:
+            futures = {executor.submit(build, ticker): ticker for ticker in tickers}
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    yield ticker, future.result()
+                except Exception as e:
+                    print(f"❌ [{ticker}] 데이터 조회 실패: {e}")
+                    yield ticker, None
+    
+    def _get_window(self) -> Tuple[datetime, datetime]:
+        """조회 기간 (SEC_CRAWLER_WINDOW_DAYS가 있으면 최근 N일, 없으면 6시~6시)"""
+        window_days = os.getenv("SEC_CRAWLER_WINDOW_DAYS")
+        if window_days:
+            days = max(1, int(window_days))
+            end = datetime.now(KST)
+            start = end - timedelta(days=days)
+        else:
+            start, end = get_last_24h_window()
+        return start, end
+    
+    def _build_ticker_data(
+        self,
+        ticker: str,
+        start: datetime,
+        end: datetime,
+        news: List[Dict],
+        sec_metadata: List[Dict],
+        latest_annuals: Dict[str, Optional[Dict]],
+        include_file_content: bool,
+        text_records: Optional[Dict[str, Dict]] = None,
+    ) -> Dict:
+        """조회 결과를 합쳐 티커별 데이터 구성 (최신 10-K/10-Q 추가 + 정제 텍스트 핸들)"""
+        sec_metadata = list(sec_metadata)
         existing_accession = {m.get('accession_number') for m in sec_metadata}
         
         for form_type in ['10-K', '10-Q']:
@@ -74,19 +169,25 @@ class DataFetcher:
             if filing and filing.get('accession_number') not in existing_accession:
                 sec_metadata.insert(0, filing)  # 맨 앞에 추가
         
-        # 5. 로컬 파일에서 SEC 내용 가져오기
+        # 수집 시점에 추출해 둔 정제 텍스트 가져오기 (마크업 제거된 본문)
         sec_filings = []
         if include_file_content and sec_metadata:
+            if text_records is None:
+                text_records = self.db.get_filing_texts(m.get('accession_number') for m in sec_metadata)
             for meta in sec_metadata:
-                file_path_str = meta.get('file_path')
-                if file_path_str:
-                    file_path = Path(file_path_str)
-                    if file_path.exists():
-                        content = file_path.read_text(encoding='utf-8', errors='ignore')
-                        sec_filings.append({
-                            'metadata': meta,
-                            'content': content
-                        })
+                file_ref = meta.get('file_path')
+                if self.blobs.exists(file_ref):
+                    # 문서 전체를 읽지 않고 mmap 핸들만 전달 (에이전트가 읽는 구간만 메모리에 올라감)
+                    content = self.text_store.open_content(
+                        meta, text_records.get(meta.get('accession_number'))
+                    )
+                    if content is None:
+                        # 정제 텍스트를 만들 수 없으면 원문 전체(수십 MB)를 메모리에 올리지 않고 내용 없이 전달
+                        print(f"⚠️  [{ticker}] 정제 텍스트 없음 - 원문을 읽지 않고 메타데이터만 전달 ({meta.get('accession_number')})")
+                    sec_filings.append({
+                        'metadata': meta,
+                        'content': content
+                    })
         else:
             # 파일 내용 없이 메타데이터만
             sec_filings = [{'metadata': meta, 'content': None} for meta in sec_metadata]
@@ -112,30 +213,3 @@ class DataFetcher:
         print(f"📊 [{ticker}] 데이터 수집: 뉴스 {len(news)}건, SEC 공시 {len(sec_filings)}건 ({ann_status})")
         
         return result
-    
-    def fetch_all_tickers(
-        self,
-        tickers: List[str],
-        include_file_content: bool = True
-    ) -> Dict[str, Dict]:
-        """
-        여러 ticker의 데이터를 한번에 조회
-        
-        Args:
-            tickers: 종목 코드 리스트
-            include_file_content: SEC 파일 내용 포함 여부
-        
-        Returns:
-            {ticker: data} 딕셔너리
-        """
-        results = {}
-        
-        for ticker in tickers:
-            try:
-                data = self.fetch_ticker_data(ticker, include_file_content)
-                results[ticker] = data
-            except Exception as e:
-                print(f"❌ [{ticker}] 데이터 조회 실패: {e}")
-                results[ticker] = None
-        
-        return results
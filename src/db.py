@@ -4,14 +4,479 @@ SEC 공시 및 뉴스 데이터를 SQLite DB에 저장하고 관리합니다.
 """
 
 import hashlib
+import json
+import os
+import re
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 from datetime import datetime
 
 
+class ConnectionManager:
+    """
+    SQLite 연결 관리자 (DB 파일 경로당 1개, 프로세스 전역)
+    - 스레드별 연결을 재사용 (스레드 풀에서도 연결을 공유하지 않음)
+    - WAL 모드 + synchronous/cache_size/mmap_size PRAGMA 적용
+    - 스키마 초기화(CREATE/마이그레이션)는 프로세스당 한 번만 실행
+    """
+
+    CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "20000"))
+    MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    BUSY_TIMEOUT_SEC = float(os.getenv("SQLITE_BUSY_TIMEOUT", "30"))
+
+    _managers: Dict[str, "ConnectionManager"] = {}
+    _managers_lock = threading.Lock()
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._initialized: set = set()
+
+    @classmethod
+    def for_path(cls, db_path: str) -> "ConnectionManager":
+        """같은 파일이면 같은 관리자를 반환 (상대/절대 경로 구분 없음)"""
+        key = db_path if db_path == ":memory:" else str(Path(db_path).resolve())
+        with cls._managers_lock:
+            manager = cls._managers.get(key)
+            if manager is None:
+                manager = cls(db_path)
+                cls._managers[key] = manager
+            return manager
+
+    def connection(self) -> sqlite3.Connection:
+        """현재 스레드의 연결 (없으면 생성)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT_SEC)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(f"PRAGMA cache_size=-{self.CACHE_SIZE_KB}")
+            conn.execute(f"PRAGMA mmap_size={self.MMAP_SIZE}")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            self._local.conn = conn
+        # 이전 호출이 설정한 row_factory가 남지 않도록 기본값으로 되돌림
+        conn.row_factory = None
+        return conn
+
+    def ensure_schema(self, name: str, init: Callable[[], None]) -> None:
+        """name 스키마를 아직 만들지 않았으면 init을 한 번 실행"""
+        if name in self._initialized:
+            return
+        with self._schema_lock:
+            if name in self._initialized:
+                return
+            init()
+            self._initialized.add(name)
+
+    def close(self) -> None:
+        """현재 스레드의 연결 닫기"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class AddColumn(NamedTuple):
+    """마이그레이션 단계: 컬럼이 없을 때만 추가 (멱등)"""
+
+    table: str
+    column: str
+    definition: str
+
+
+class Migration(NamedTuple):
+    """번호가 매겨진 스키마 변경 (statements는 SQL 문자열 또는 AddColumn)"""
+
+    version: int
+    description: str
+    statements: Tuple[Union[str, AddColumn], ...]
+
+
+def apply_migrations(conn: sqlite3.Connection, migrations: List[Migration], label: str) -> int:
+    """
+    PRAGMA user_version보다 높은 번호의 마이그레이션만 순서대로 적용합니다.
+    최신 DB는 pragma 1회 조회로 끝나며, 각 마이그레이션은 트랜잭션 안에서 실행되고
+    user_version도 같은 트랜잭션에서 올라갑니다. (모든 단계는 멱등)
+
+    Returns:
+        적용 후 스키마 버전
+    """
+    latest = migrations[-1].version
+    current = conn.execute("PRAGMA user_version").fetchone()[0]
+    if current >= latest:
+        return current
+
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        # 다른 프로세스가 먼저 올렸을 수 있으므로 잠금을 잡은 뒤 다시 확인
+        current = conn.execute("PRAGMA user_version").fetchone()[0]
+        for migration in migrations:
+            if migration.version <= current:
+                continue
+            for statement in migration.statements:
+                if isinstance(statement, AddColumn):
+                    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({statement.table})")}
+                    if statement.column not in columns:
+                        conn.execute(
+                            f"ALTER TABLE {statement.table} ADD COLUMN {statement.column} {statement.definition}"
+                        )
+                else:
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {migration.version}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    if current < latest:
+        print(f"스키마 마이그레이션 완료: {label} (v{current} → v{latest})")
+    return latest
+
+
+# 본문 없는 뉴스 조건 (부분 인덱스와 조회가 같은 식을 써야 인덱스가 사용됨)
+_NEWS_MISSING_CONTENT = "(content IS NULL OR content = '')"
+
+# filings.file_path의 블롭 참조 접두사 (src/blob_store.py)
+BLOB_REF_PREFIX = "blob:"
+
+
+def is_blob_ref(value) -> bool:
+    """filings.file_path 값이 압축 블롭 참조인지 (아니면 예전 방식의 파일 경로)"""
+    return isinstance(value, str) and value.startswith(BLOB_REF_PREFIX)
+
+
+def _file_columns(info: Dict, file_path: Union[Path, str]) -> Tuple[str, str, Optional[int]]:
+    """
+    filings의 (file_path, file_format, file_size) 값
+    블롭 참조는 원본 파일이 없으므로 형식/크기를 info에서 가져옵니다.
+    """
+    if is_blob_ref(file_path):
+        return file_path, info.get("file_format") or "unknown", info.get("file_size")
+    path = Path(file_path)
+    return (
+        str(path),
+        path.suffix[1:] if path.suffix else "unknown",
+        path.stat().st_size if path.exists() else None,
+    )
+
+
+# 전문 검색 단위 크기 (문자 수, 문단 경계에서 자름)
+SEARCH_PASSAGE_CHARS = 1500
+
+
+def split_passages(text: str, size: int = SEARCH_PASSAGE_CHARS) -> List[str]:
+    """텍스트를 문단 경계 기준으로 size 문자 안팎의 검색 단위로 나눕니다."""
+    passages: List[str] = []
+    current: List[str] = []
+    length = 0
+    for paragraph in text.split("\n"):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        # 한 문단이 너무 길면 그대로 잘라서 넣음
+        while len(paragraph) > size:
+            if current:
+                passages.append("\n".join(current))
+                current, length = [], 0
+            passages.append(paragraph[:size])
+            paragraph = paragraph[size:]
+        if length + len(paragraph) > size and current:
+            passages.append("\n".join(current))
+            current, length = [], 0
+        current.append(paragraph)
+        length += len(paragraph) + 1
+    if current:
+        passages.append("\n".join(current))
+    return passages
+
+
+def _fts_query(query: str) -> str:
+    """자유 문장을 FTS5 MATCH 식으로 변환 (단어별 OR, 특수문자 무시)"""
+    terms = dict.fromkeys(t.lower() for t in re.findall(r"\w+", query) if len(t) > 1)
+    return " OR ".join(f'"{term}"' for term in terms)
+
+
+# SECDatabase 스키마 이력 (새 변경은 항상 끝에 새 번호로 추가)
+SEC_MIGRATIONS: List[Migration] = [
+    Migration(1, "filings / news 기본 테이블", (
+        """
+        CREATE TABLE IF NOT EXISTS filings (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticker VARCHAR(10) NOT NULL,
+            cik VARCHAR(10) NOT NULL,
+            accession_number VARCHAR(50) UNIQUE NOT NULL,
+            form VARCHAR(20) NOT NULL,
+            filed_date DATE NOT NULL,
+            acceptance_date DATE,
+            reporting_for DATE,
+            filing_entity VARCHAR(255) NOT NULL,
+            file_path VARCHAR(500) NOT NULL,
+            file_format VARCHAR(10) NOT NULL,
+            file_size INTEGER,
+            downloaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # acceptance_date가 없던 시절의 DB
+        AddColumn("filings", "acceptance_date", "DATE"),
+        "CREATE INDEX IF NOT EXISTS idx_ticker ON filings(ticker)",
+        "CREATE INDEX IF NOT EXISTS idx_cik ON filings(cik)",
+        "CREATE INDEX IF NOT EXISTS idx_filed_date ON filings(filed_date)",
+        "CREATE INDEX IF NOT EXISTS idx_acceptance_date ON filings(acceptance_date)",
+        "CREATE INDEX IF NOT EXISTS idx_accession_number ON filings(accession_number)",
+        """
+        CREATE TABLE IF NOT EXISTS news (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticker VARCHAR(10) NOT NULL,
+            title TEXT NOT NULL,
+            summary TEXT,
+            url TEXT NOT NULL,
+            source VARCHAR(255),
+            published_at TIMESTAMP,
+            content TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            UNIQUE(ticker, url)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_news_ticker_published ON news(ticker, published_at)",
+        AddColumn("news", "content", "TEXT"),
+    )),
+    Migration(2, "filings.sha256 (파일 무결성 확인)", (
+        AddColumn("filings", "sha256", "VARCHAR(64)"),
+    )),
+    Migration(3, "티커 → CIK 캐시 / HTTP 검증자", (
+        """
+        CREATE TABLE IF NOT EXISTS ticker_cik_map (
+            ticker VARCHAR(10) PRIMARY KEY,
+            cik VARCHAR(10) NOT NULL,
+            title VARCHAR(255),
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        # 조건부 요청용 HTTP 검증자 (ETag / Last-Modified)
+        """
+        CREATE TABLE IF NOT EXISTS sec_http_cache (
+            url TEXT PRIMARY KEY,
+            etag TEXT,
+            last_modified TEXT,
+            checked_at TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    )),
+    Migration(4, "CIK별 크롤링 high-water mark", (
+        """
+        CREATE TABLE IF NOT EXISTS sec_fetch_state (
+            cik VARCHAR(10) PRIMARY KEY,
+            ticker VARCHAR(10),
+            last_acceptance_datetime TIMESTAMP,
+            last_accession_number VARCHAR(50),
+            submissions_etag TEXT,
+            last_success_run TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    )),
+    Migration(5, "정제 텍스트 (원문 옆 .clean.txt)", (
+        """
+        CREATE TABLE IF NOT EXISTS filing_texts (
+            accession_number VARCHAR(50) PRIMARY KEY,
+            text_path VARCHAR(500) NOT NULL,
+            text_length INTEGER NOT NULL,
+            raw_size INTEGER,
+            documents TEXT,
+            extracted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    )),
+    Migration(6, "10-K/10-Q 섹션 바이트 오프셋", (
+        """
+        CREATE TABLE IF NOT EXISTS filing_sections (
+            accession_number VARCHAR(50) NOT NULL,
+            part VARCHAR(10) NOT NULL DEFAULT '',
+            item VARCHAR(10) NOT NULL,
+            title VARCHAR(200),
+            start_offset INTEGER NOT NULL,
+            end_offset INTEGER NOT NULL,
+            PRIMARY KEY (accession_number, part, item)
+        )
+        """,
+    )),
+    Migration(7, "티커 대문자 정규화 + 조회 패턴별 복합/부분 인덱스", (
+        # 티커는 항상 대문자로 저장 (UPPER(ticker) 조건 없이 인덱스 사용)
+        "UPDATE filings SET ticker = UPPER(ticker) WHERE ticker != UPPER(ticker)",
+        "UPDATE OR IGNORE news SET ticker = UPPER(ticker) WHERE ticker != UPPER(ticker)",
+        "DELETE FROM news WHERE ticker != UPPER(ticker)",  # 대문자 행과 (ticker, url)이 겹친 중복
+        # idx_ticker는 아래 복합 인덱스의 접두사, idx_accession_number는 UNIQUE 자동 인덱스와 중복
+        "DROP INDEX IF EXISTS idx_ticker",
+        "DROP INDEX IF EXISTS idx_accession_number",
+        # get_latest_annual_quarterly: ticker + form, filed_date 최신순
+        "CREATE INDEX IF NOT EXISTS idx_filings_ticker_form_filed ON filings(ticker, form, filed_date DESC)",
+        # get_filings_by_ticker: ticker, filed_date 최신순
+        "CREATE INDEX IF NOT EXISTS idx_filings_ticker_filed ON filings(ticker, filed_date DESC)",
+        # get_filings_between: ticker + acceptance_date 범위
+        "CREATE INDEX IF NOT EXISTS idx_filings_ticker_acceptance ON filings(ticker, acceptance_date)",
+        # get_news_without_content (티커 미지정): 본문 없는 뉴스만 담는 부분 인덱스
+        f"CREATE INDEX IF NOT EXISTS idx_news_missing_content ON news(published_at) WHERE {_NEWS_MISSING_CONTENT}",
+    )),
+    Migration(8, "공시 정제 텍스트 / 뉴스 본문 전문 검색 (FTS5)", (
+        # 검색 단위(문단 묶음) 메타데이터 - id가 search_fts의 rowid
+        """
+        CREATE TABLE IF NOT EXISTS search_passages (
+            id INTEGER PRIMARY KEY,
+            kind VARCHAR(10) NOT NULL,
+            ref VARCHAR(100) NOT NULL,
+            ticker VARCHAR(10) NOT NULL,
+            doc_date DATE,
+            title TEXT,
+            seq INTEGER NOT NULL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_search_passages_ref ON search_passages(kind, ref)",
+        "CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(title, body, tokenize='porter unicode61')",
+    )),
+    Migration(9, "Yahoo 뉴스 원문 캐시 (DynamoDB pk 기준)", (
+        # 같은 기사는 여러 티커/실행에 걸쳐도 본문을 한 번만 저장
+        """
+        CREATE TABLE IF NOT EXISTS news_articles (
+            pk VARCHAR(128) PRIMARY KEY,
+            ticker VARCHAR(10),
+            title TEXT,
+            source VARCHAR(255),
+            published_at TIMESTAMP,
+            s3_key TEXT,
+            body TEXT NOT NULL,
+            body_bytes INTEGER,
+            fetched_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    )),
+    Migration(10, "Yahoo 뉴스 티커별 증분 수집 상태 / 기사-티커 연결", (
+        AddColumn("news_articles", "path", "TEXT"),
+        # 기사 하나가 여러 티커에 걸리므로 티커별 최신순 조회는 연결 테이블로
+        """
+        CREATE TABLE IF NOT EXISTS news_article_tickers (
+            ticker VARCHAR(10) NOT NULL,
+            pk VARCHAR(128) NOT NULL,
+            published_at TIMESTAMP,
+            PRIMARY KEY (ticker, pk)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_news_article_tickers_recent ON news_article_tickers(ticker, published_at DESC, pk DESC)",
+        """
+        INSERT OR IGNORE INTO news_article_tickers (ticker, pk, published_at)
+        SELECT ticker, pk, published_at FROM news_articles WHERE ticker IS NOT NULL
+        """,
+        # 티커별로 마지막으로 받은 뉴스 (역색인 sort_key = "{et_iso}#{pk}" 기준 high-water mark)
+        """
+        CREATE TABLE IF NOT EXISTS news_fetch_state (
+            ticker VARCHAR(10) PRIMARY KEY,
+            last_et_iso TIMESTAMP,
+            last_pk VARCHAR(128),
+            last_success_run TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+    )),
+    Migration(11, "검색 인덱스 백필 예약 (검색 기능 이전에 저장된 뉴스/기사/공시 텍스트)", (
+        # 정제 텍스트 파일/기사 XML을 읽어야 해서 SQL로는 못 채움 → init_db가 한 번 rebuild_search_index 실행
+        "CREATE TABLE IF NOT EXISTS search_backfill_pending (id INTEGER PRIMARY KEY)",
+        "INSERT OR IGNORE INTO search_backfill_pending (id) VALUES (1)",
+    )),
+]
+
+# QuartrDatabase 스키마 이력
+QUARTR_MIGRATIONS: List[Migration] = [
+    Migration(1, "earning_calls / quartr_fetch_state 기본 테이블", (
+        """
+        CREATE TABLE IF NOT EXISTS earning_calls (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ticker VARCHAR(10) NOT NULL,
+            quartr_event_id VARCHAR(64) UNIQUE NOT NULL,
+            call_date TIMESTAMP NOT NULL,
+            call_type VARCHAR(50),
+            timezone VARCHAR(50),
+            source_url TEXT,
+            transcript_hash VARCHAR(64),
+            transcript_text TEXT,
+            transcript_path TEXT,
+            transcript_size INTEGER,
+            language VARCHAR(20),
+            downloaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS quartr_fetch_state (
+            ticker VARCHAR(10) PRIMARY KEY,
+            last_call_datetime TIMESTAMP,
+            last_success_run TIMESTAMP,
+            last_cursor TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_earning_calls_ticker_calldate ON earning_calls(ticker, call_date)",
+        "CREATE INDEX IF NOT EXISTS idx_earning_calls_hash ON earning_calls(transcript_hash)",
+        "CREATE INDEX IF NOT EXISTS idx_quartr_fetch_state_last_call ON quartr_fetch_state(last_call_datetime)",
+    )),
+]
+
+
 class SECDatabase:
     """SEC 공시 및 뉴스 자료를 저장하는 데이터베이스 클래스"""
+
+    # 자주 실행되는 조회 (check_query_plans가 같은 SQL을 점검)
+    _SQL_FILINGS_BY_TICKER = """
+        SELECT * FROM filings
+        WHERE ticker = ?
+        ORDER BY filed_date DESC
+    """
+    _SQL_FILINGS_BETWEEN = """
+        SELECT * FROM filings
+        WHERE ticker = ?
+          AND acceptance_date IS NOT NULL
+          AND acceptance_date BETWEEN ? AND ?
+        ORDER BY acceptance_date DESC
+    """
+    # 원문이 저장된 공시만 (벌크 적재된 메타데이터 행은 file_path = '')
+    _SQL_LATEST_BY_FORM = """
+        SELECT * FROM filings
+        WHERE ticker = ? AND form = ? AND file_path <> ''
+        ORDER BY filed_date DESC
+        LIMIT 1
+    """
+    # 여러 티커의 기간 내 공시 + 양식별 최신 10-K/10-Q를 한 번에 ({tickers}는 IN 자리표시자)
+    # (최신 10-K/10-Q는 _SQL_LATEST_BY_FORM처럼 원문이 저장된 공시 중에서 고름)
+    _SQL_FILINGS_FOR_TICKERS = """
+        SELECT * FROM (
+            SELECT f.*,
+                   ROW_NUMBER() OVER (
+                       PARTITION BY f.ticker, f.form
+                       ORDER BY f.file_path <> '' DESC, f.filed_date DESC, f.id DESC
+                   ) AS form_rank,
+                   (f.acceptance_date IS NOT NULL AND f.acceptance_date BETWEEN ? AND ?) AS in_window
+            FROM filings f
+            WHERE f.ticker IN ({tickers})
+              AND (f.form IN ('10-K', '10-Q') OR f.acceptance_date BETWEEN ? AND ?)
+        )
+        WHERE in_window OR (form IN ('10-K', '10-Q') AND form_rank = 1 AND file_path <> '')
+        ORDER BY ticker, acceptance_date DESC
+    """
+
+    # 티커의 최신 뉴스 원문 (news_article_tickers 인덱스 순서 그대로)
+    _SQL_RECENT_NEWS_ARTICLES = """
+        SELECT l.ticker, a.pk, a.path, a.s3_key, a.title, a.source, l.published_at, a.body
+        FROM news_article_tickers l
+        JOIN news_articles a ON a.pk = l.pk
+        WHERE l.ticker = ?
+        ORDER BY l.published_at DESC, l.pk DESC
+        LIMIT ?
+    """
+
+    # iter_* 조회의 페이지(키셋) 크기
+    ITER_BATCH_SIZE = int(os.getenv("SQLITE_ITER_BATCH_SIZE", "500"))
     
     def __init__(self, db_path: str = "sec_filings.db"):
         """
@@ -19,93 +484,27 @@ class SECDatabase:
             db_path: SQLite 데이터베이스 파일 경로
         """
         self.db_path = db_path
-        self.init_db()
+        self._manager = ConnectionManager.for_path(db_path)
+        self._manager.ensure_schema(type(self).__name__, self.init_db)
     
     def get_connection(self):
-        """데이터베이스 연결 반환"""
-        return sqlite3.connect(self.db_path)
+        """현재 스레드의 재사용 연결 반환 (with 블록은 커밋/롤백만 하고 닫지 않음)"""
+        return self._manager.connection()
     
     def init_db(self):
-        """데이터베이스 초기화 및 테이블 생성"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            
-            # filings 테이블 생성
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS filings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    ticker VARCHAR(10) NOT NULL,
-                    cik VARCHAR(10) NOT NULL,
-                    accession_number VARCHAR(50) UNIQUE NOT NULL,
-                    form VARCHAR(20) NOT NULL,
-                    filed_date DATE NOT NULL,
-                    acceptance_date DATE,
-                    reporting_for DATE,
-                    filing_entity VARCHAR(255) NOT NULL,
-                    file_path VARCHAR(500) NOT NULL,
-                    file_format VARCHAR(10) NOT NULL,
-                    file_size INTEGER,
-                    downloaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            # 기존 테이블에 acceptance_date 컬럼이 없으면 추가 (마이그레이션)
-            try:
-                cursor.execute("SELECT acceptance_date FROM filings LIMIT 1")
-            except sqlite3.OperationalError:
-                # acceptance_date 컬럼이 없으면 추가
-                cursor.execute("""
-                    ALTER TABLE filings ADD COLUMN acceptance_date DATE
-                """)
-                print("acceptance_date 컬럼을 추가했습니다.")
-            
-            # 인덱스 생성 (조회 성능 향상)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_ticker ON filings(ticker)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_cik ON filings(cik)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_filed_date ON filings(filed_date)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_acceptance_date ON filings(acceptance_date)
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_accession_number ON filings(accession_number)
-            """)
-
-            # 뉴스 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS news (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    ticker VARCHAR(10) NOT NULL,
-                    title TEXT NOT NULL,
-                    summary TEXT,
-                    url TEXT NOT NULL,
-                    source VARCHAR(255),
-                    published_at TIMESTAMP,
-                    content TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(ticker, url)
+        """스키마를 최신 버전으로 마이그레이션 (PRAGMA user_version 기준)"""
+        conn = self.get_connection()
+        apply_migrations(conn, SEC_MIGRATIONS, self.db_path)
+        # 마이그레이션이 예약한 검색 인덱스 백필 (한 번만)
+        if conn.execute("SELECT 1 FROM search_backfill_pending").fetchone():
+            counts = self.rebuild_search_index()
+            with conn:
+                conn.execute("DELETE FROM search_backfill_pending")
+            if any(counts.values()):
+                print(
+                    f"검색 인덱스 백필 완료: 뉴스 {counts['news']}건, 기사 {counts['article']}건, "
+                    f"공시 {counts['filing']}건"
                 )
-            """)
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_news_ticker_published
-                ON news(ticker, published_at)
-            """)
-            try:
-                cursor.execute("SELECT content FROM news LIMIT 1")
-            except sqlite3.OperationalError:
-                cursor.execute("""
-                    ALTER TABLE news ADD COLUMN content TEXT
-                """)
-                print("news.content 컬럼을 추가했습니다.")
-            
-            conn.commit()
-            print(f"데이터베이스 초기화 완료: {self.db_path}")
     
     def check_duplicate(self, accession_number: str) -> bool:
         """
@@ -129,35 +528,24 @@ class SECDatabase:
         self,
         ticker: str,
         filing_info: Dict,
-        file_path: Path
+        file_path: Union[Path, str]
     ) -> Optional[int]:
         """
         공시 자료를 데이터베이스에 저장
         
         Args:
             ticker: 주식 티커 심볼
-            filing_info: 공시 정보 딕셔너리 (form, filed, reporting_for, filing_entity, accession_number, cik 포함)
-            file_path: 다운로드된 파일 경로
+            filing_info: 공시 정보 딕셔너리 (form, filed, reporting_for, filing_entity, accession_number, cik,
+                         선택적으로 sha256 포함)
+            file_path: 다운로드된 파일 경로 또는 블롭 참조 ("blob:<sha256>")
             
         Returns:
             저장된 레코드의 ID 또는 None (중복인 경우)
         """
         accession_number = filing_info.get("accession_number")
         
-        # 중복 체크
-        if self.check_duplicate(accession_number):
-            print(f"이미 저장된 공시 자료입니다: {accession_number}")
-            try:
-                file_path.unlink(missing_ok=True)
-            except Exception:
-                pass
-            return None
-        
-        # 파일 크기 계산
-        file_size = file_path.stat().st_size if file_path.exists() else None
-        
-        # 파일 형식 추출
-        file_format = file_path.suffix[1:] if file_path.suffix else "unknown"
+        # 파일 경로/형식/크기 (블롭 참조면 filing_info의 값 사용)
+        stored_path, file_format, file_size = _file_columns(filing_info, file_path)
         
         with self.get_connection() as conn:
             cursor = conn.cursor()
@@ -165,8 +553,10 @@ class SECDatabase:
                 cursor.execute("""
                     INSERT INTO filings (
                         ticker, cik, accession_number, form, filed_date,
-                        acceptance_date, reporting_for, filing_entity, file_path, file_format, file_size
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        acceptance_date, reporting_for, filing_entity, file_path, file_format, file_size,
+                        sha256
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(accession_number) DO NOTHING
                 """, (
                     ticker.upper(),
                     filing_info.get("cik"),
@@ -176,12 +566,22 @@ class SECDatabase:
                     filing_info.get("acceptance_date"),  # SEC에 올라온 날짜
                     filing_info.get("reporting_for"),
                     filing_info.get("filing_entity"),
-                    str(file_path),
+                    stored_path,
                     file_format,
-                    file_size
+                    file_size,
+                    filing_info.get("sha256"),
                 ))
                 
                 conn.commit()
+                # 중복 체크 (INSERT 한 번으로 판단)
+                if cursor.rowcount == 0:
+                    print(f"이미 저장된 공시 자료입니다: {accession_number}")
+                    if not is_blob_ref(file_path):
+                        try:
+                            Path(file_path).unlink(missing_ok=True)
+                        except Exception:
+                            pass
+                    return None
                 record_id = cursor.lastrowid
                 print(f"DB 저장 완료: ID {record_id}, {ticker} - {filing_info.get('form')}")
                 return record_id
@@ -194,6 +594,196 @@ class SECDatabase:
                 conn.rollback()
                 return None
     
+    def save_filings_batch(self, filings: List[Tuple[Dict, Union[Path, str]]]) -> Dict[str, int]:
+        """
+        다운로드한 공시 여러 건을 한 트랜잭션에서 저장 (executemany + ON CONFLICT)
+        이미 있는 접수번호(메타데이터만 적재된 행, 파일이 사라진 행 포함)는
+        파일 경로/크기/해시를 갱신하고 비어 있던 메타데이터만 채웁니다.
+        (값이 모두 같은 행은 건드리지 않으므로 updated에 포함되지 않음)
+
+        Args:
+            filings: [(filing_info, file_path)] - filing_info에는 ticker, cik, accession_number,
+                     form, filed_date, acceptance_date, reporting_for, filing_entity, sha256
+                     (file_path가 블롭 참조면 원본의 file_format, file_size도 포함)
+
+        Returns:
+            {"inserted": 새로 추가된 행 수, "updated": 갱신된 기존 행 수}
+        """
+        if not filings:
+            return {"inserted": 0, "updated": 0}
+
+        rows = []
+        for info, file_path in filings:
+            rows.append((
+                info["ticker"].upper(),
+                info.get("cik"),
+                info["accession_number"],
+                info.get("form"),
+                info.get("filed_date") or info.get("filed"),
+                info.get("acceptance_date"),
+                info.get("reporting_for"),
+                info.get("filing_entity") or "",
+                *_file_columns(info, file_path),
+                info.get("sha256"),
+            ))
+
+        conn = self.get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM filings").fetchone()[0]
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT INTO filings (
+                    ticker, cik, accession_number, form, filed_date,
+                    acceptance_date, reporting_for, filing_entity, file_path, file_format, file_size,
+                    sha256
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(accession_number) DO UPDATE SET
+                    file_path=excluded.file_path,
+                    file_format=excluded.file_format,
+                    file_size=excluded.file_size,
+                    sha256=COALESCE(excluded.sha256, filings.sha256),
+                    acceptance_date=COALESCE(filings.acceptance_date, excluded.acceptance_date),
+                    reporting_for=COALESCE(filings.reporting_for, excluded.reporting_for),
+                    filing_entity=CASE WHEN filings.filing_entity = '' THEN excluded.filing_entity
+                                       ELSE filings.filing_entity END,
+                    downloaded_at=CURRENT_TIMESTAMP
+                -- 바뀌는 값이 없으면 갱신하지 않음 (total_changes가 실제 갱신 건수가 되도록)
+                WHERE filings.file_path IS NOT excluded.file_path
+                   OR filings.file_format IS NOT excluded.file_format
+                   OR filings.file_size IS NOT excluded.file_size
+                   OR (excluded.sha256 IS NOT NULL AND filings.sha256 IS NOT excluded.sha256)
+                   OR (filings.acceptance_date IS NULL AND excluded.acceptance_date IS NOT NULL)
+                   OR (filings.reporting_for IS NULL AND excluded.reporting_for IS NOT NULL)
+                   OR (filings.filing_entity = '' AND excluded.filing_entity <> '')
+                """,
+                rows,
+            )
+            changed = conn.total_changes - before
+            # AUTOINCREMENT id는 증가만 하므로 기존 최댓값보다 큰 id가 새 행
+            inserted = conn.execute("SELECT COUNT(*) FROM filings WHERE id > ?", (max_id,)).fetchone()[0]
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return {"inserted": inserted, "updated": changed - inserted}
+
+    def get_filings_by_accessions(self, accession_numbers: Iterable[str]) -> Dict[str, Dict]:
+        """
+        여러 접수번호를 한 번에 조회 (다운로드 전 중복 확인용)
+
+        Args:
+            accession_numbers: 접수 번호 목록
+
+        Returns:
+            {접수번호: 공시 레코드} (저장된 것만 포함)
+        """
+        accessions = [a for a in dict.fromkeys(accession_numbers) if a]
+        if not accessions:
+            return {}
+        found: Dict[str, Dict] = {}
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            # SQLite 바인딩 변수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(accessions), 500):
+                chunk = accessions[start:start + 500]
+                placeholders = ",".join(["?"] * len(chunk))
+                cursor.execute(
+                    f"SELECT * FROM filings WHERE accession_number IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    found[row["accession_number"]] = dict(row)
+        return found
+
+    def update_filing_file(
+        self,
+        accession_number: str,
+        file_path: Union[Path, str],
+        sha256: Optional[str] = None,
+        file_size: Optional[int] = None,
+    ) -> bool:
+        """
+        기존 공시 레코드의 파일 경로/크기/해시 갱신 (파일을 다시 받았거나 블롭으로 옮긴 경우)
+        """
+        if not is_blob_ref(file_path):
+            file_path, _, file_size = _file_columns({}, file_path)
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                UPDATE filings
+                SET file_path = ?, file_size = ?, sha256 = COALESCE(?, sha256),
+                    downloaded_at = CURRENT_TIMESTAMP
+                WHERE accession_number = ?
+                """,
+                (file_path, file_size, sha256, accession_number),
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def get_legacy_file_rows(self) -> List[Dict]:
+        """블롭 참조가 아닌 파일 경로로 저장된 공시 (accession_number, file_path, sha256)"""
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT accession_number, file_path, sha256 FROM filings "
+                "WHERE file_path != '' AND file_path NOT LIKE ?",
+                (f"{BLOB_REF_PREFIX}%",),
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    def get_blob_ref_counts(self) -> Dict[str, int]:
+        """블롭 해시별 참조하는 공시 행 수 (블롭 GC 기준)"""
+        conn = self.get_connection()
+        cursor = conn.execute(
+            "SELECT SUBSTR(file_path, ?), COUNT(*) FROM filings WHERE file_path LIKE ? GROUP BY file_path",
+            (len(BLOB_REF_PREFIX) + 1, f"{BLOB_REF_PREFIX}%"),
+        )
+        return {digest: count for digest, count in cursor.fetchall()}
+
+    def bulk_insert_filing_metadata(self, filings: List[Dict]) -> int:
+        """
+        파일 없이 공시 메타데이터만 대량 적재 (하나의 트랜잭션, executemany)
+        file_path는 빈 문자열로 두며, 이후 크롤러가 파일을 받으면 경로가 갱신됩니다.
+        이미 있는 접수번호는 건드리지 않습니다.
+
+        Returns:
+            새로 추가된 행 수
+        """
+        if not filings:
+            return 0
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            before = conn.total_changes
+            cursor.executemany(
+                """
+                INSERT INTO filings (
+                    ticker, cik, accession_number, form, filed_date,
+                    acceptance_date, reporting_for, filing_entity, file_path, file_format
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, '', '')
+                ON CONFLICT(accession_number) DO NOTHING
+                """,
+                [
+                    (
+                        info["ticker"].upper(),
+                        info.get("cik"),
+                        info.get("accession_number"),
+                        info.get("form"),
+                        info.get("filed_date") or info.get("filed"),
+                        info.get("acceptance_date"),
+                        info.get("reporting_for"),
+                        info.get("filing_entity") or "",
+                    )
+                    for info in filings
+                ],
+            )
+            conn.commit()
+            return conn.total_changes - before
+
     def get_filings_by_ticker(self, ticker: str, limit: Optional[int] = None) -> List[Dict]:
         """
         티커로 공시 자료 조회
@@ -206,230 +796,1166 @@ class SECDatabase:
             공시 자료 리스트
         """
         with self.get_connection() as conn:
-            conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
+            conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
+            cursor = conn.cursor()
+            
+            query = self._SQL_FILINGS_BY_TICKER
+            params: List = [ticker.upper()]
+            
+            if limit:
+                query += " LIMIT ?"
+                params.append(limit)
+            
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            
+            return [dict(row) for row in rows]
+
+    def iter_filings_by_ticker(
+        self,
+        ticker: str,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """
+        get_filings_by_ticker의 스트리밍 버전 ((filed_date, id) 최신순 키셋 페이지)
+
+        Args:
+            ticker: 주식 티커 심볼
+            limit: 조회할 최대 개수 (None이면 전체)
+            batch_size: 페이지당 행 수 (기본 ITER_BATCH_SIZE)
+        """
+        return self._iter_keyset(
+            "filings", ["ticker = ?"], [ticker.upper()], "filed_date",
+            limit=limit, batch_size=batch_size, nullable_key=False,
+        )
+
+    def get_filings_between(
+        self,
+        ticker: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Dict]:
+        """
+        특정 기간 동안의 공시 자료 조회
+        """
+        start_iso = start_time.date().isoformat()
+        end_iso = end_time.date().isoformat()
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_FILINGS_BETWEEN, (ticker.upper(), start_iso, end_iso))
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    def get_latest_annual_quarterly(self, ticker: str) -> Dict[str, Dict]:
+        """
+        가장 최근 10-K (연간보고서)와 10-Q (분기보고서)를 가져옴
+        (원문이 아직 없는 메타데이터 전용 행은 제외)
+        
+        Returns:
+            {'10-K': {...} or None, '10-Q': {...} or None}
+        """
+        result = {'10-K': None, '10-Q': None}
+        
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            # 양식별 가장 최근 1건 (idx_filings_ticker_form_filed)
+            for form in result:
+                cursor.execute(self._SQL_LATEST_BY_FORM, (ticker.upper(), form))
+                row = cursor.fetchone()
+                if row:
+                    result[form] = dict(row)
+        
+        return result
+
+    def get_filings_for_tickers(
+        self,
+        tickers: Iterable[str],
+        start_time: datetime,
+        end_time: datetime,
+    ) -> Dict[str, Dict]:
+        """
+        여러 티커의 get_filings_between + get_latest_annual_quarterly를 한 쿼리로 조회
+        (양식별 최신 공시는 ROW_NUMBER() 윈도우 함수로 계산)
+
+        Returns:
+            {티커: {"window": [기간 내 공시, acceptance_date 최신순],
+                    "latest": {"10-K": {...} or None, "10-Q": {...} or None}}}
+        """
+        symbols = [t.upper() for t in dict.fromkeys(tickers) if t]
+        result = {t: {"window": [], "latest": {"10-K": None, "10-Q": None}} for t in symbols}
+        start_iso = start_time.date().isoformat()
+        end_iso = end_time.date().isoformat()
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            # SQLite 바인딩 변수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(symbols), 500):
+                chunk = symbols[start:start + 500]
+                query = self._SQL_FILINGS_FOR_TICKERS.format(tickers=",".join(["?"] * len(chunk)))
+                cursor.execute(query, [start_iso, end_iso, *chunk, start_iso, end_iso])
+                for row in cursor.fetchall():
+                    filing = dict(row)
+                    form_rank = filing.pop("form_rank")
+                    in_window = filing.pop("in_window")
+                    entry = result[filing["ticker"]]
+                    if in_window:
+                        entry["window"].append(filing)
+                    if form_rank == 1 and filing["form"] in entry["latest"]:
+                        entry["latest"][filing["form"]] = filing
+        return result
+
+    def get_news_for_tickers(
+        self,
+        tickers: Iterable[str],
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+    ) -> Dict[str, List[Dict]]:
+        """
+        여러 티커의 get_news를 한 쿼리로 조회
+
+        Returns:
+            {티커: [뉴스, published_at 최신순]}
+        """
+        symbols = [t.upper() for t in dict.fromkeys(tickers) if t]
+        result: Dict[str, List[Dict]] = {t: [] for t in symbols}
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            for start in range(0, len(symbols), 500):
+                chunk = symbols[start:start + 500]
+                conditions, params = self._news_filters(
+                    [f"ticker IN ({','.join(['?'] * len(chunk))})"], chunk, start_time, end_time
+                )
+                cursor.execute(
+                    f"SELECT * FROM news WHERE {' AND '.join(conditions)} ORDER BY ticker, published_at DESC",
+                    params,
+                )
+                for row in cursor.fetchall():
+                    result[row["ticker"]].append(dict(row))
+        return result
+
+    def save_news_items(self, ticker: str, news_items: List[Dict]) -> Dict[str, int]:
+        """
+        뉴스 데이터를 한 트랜잭션에서 upsert (executemany + ON CONFLICT(ticker, url))
+        이미 있는 뉴스는 새 값이 있는 필드만 갱신하고, 기존 본문(content)은 빈 값으로 덮어쓰지 않습니다.
+
+        Returns:
+            {"inserted": 새로 추가된 수, "updated": 값이 실제로 바뀐 수, "skipped": title/url이 없어 제외된 수}
+        """
+        rows = [
+            (
+                (item.get("ticker") or ticker).upper(),
+                item.get("title"),
+                item.get("summary"),
+                item.get("url"),
+                item.get("source"),
+                item.get("published_at"),
+                item.get("content"),
+            )
+            for item in news_items
+            if item.get("title") and item.get("url")
+        ]
+        skipped = len(news_items) - len(rows)
+        if skipped:
+            print(f"⚠️  title/url이 없는 뉴스 {skipped}건 제외")
+        if not rows:
+            return {"inserted": 0, "updated": 0, "skipped": skipped}
+
+        conn = self.get_connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            max_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM news").fetchone()[0]
+            # 검색 인덱스는 새로 추가됐거나 색인 대상 값이 바뀐 뉴스만 갱신
+            reindex = self._news_index_changes(conn, rows)
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT INTO news (ticker, title, summary, url, source, published_at, content)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ticker, url) DO UPDATE SET
+                    title=excluded.title,
+                    summary=COALESCE(excluded.summary, news.summary),
+                    source=COALESCE(excluded.source, news.source),
+                    published_at=COALESCE(excluded.published_at, news.published_at),
+                    content=COALESCE(NULLIF(excluded.content, ''), news.content)
+                -- 바뀌는 값이 없으면 갱신하지 않음 (total_changes가 실제 갱신 건수가 되도록)
+                WHERE news.title IS NOT excluded.title
+                   OR (excluded.summary IS NOT NULL AND news.summary IS NOT excluded.summary)
+                   OR (excluded.source IS NOT NULL AND news.source IS NOT excluded.source)
+                   OR (excluded.published_at IS NOT NULL AND news.published_at IS NOT excluded.published_at)
+                   OR (NULLIF(excluded.content, '') IS NOT NULL AND news.content IS NOT excluded.content)
+                """,
+                rows,
+            )
+            changed = conn.total_changes - before
+            inserted = conn.execute("SELECT COUNT(*) FROM news WHERE id > ?", (max_id,)).fetchone()[0]
+            for ticker, url in reindex:
+                self._index_news(conn, ticker, url)
+            conn.commit()
+        except Exception as exc:
+            conn.rollback()
+            print(f"❌ 뉴스 저장 실패: {exc}")
+            raise
+        return {"inserted": inserted, "updated": changed - inserted, "skipped": skipped}
+
+    def get_news(
+        self,
+        ticker: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        뉴스 데이터 조회
+        """
+        query, params = self._news_query(["ticker = ?"], [ticker.upper()], start_time, end_time, limit)
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    def get_news_without_content(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        tickers: Optional[List[str]] = None,
+    ) -> List[Dict]:
+        """
+        본문이 비어 있는 뉴스 조회
+        """
+        conditions, params = self._missing_content_filters(tickers)
+        query, params = self._news_query(conditions, params, start_time, end_time, limit)
+
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+            return [dict(row) for row in rows]
+
+    def iter_news(
+        self,
+        ticker: str,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """
+        get_news의 스트리밍 버전 ((published_at, id) 최신순 키셋 페이지)
+        수년치 백필처럼 결과가 큰 조회에서 전체를 메모리에 올리지 않습니다.
+        """
+        conditions, params = self._news_filters(["ticker = ?"], [ticker.upper()], start_time, end_time)
+        return self._iter_keyset("news", conditions, params, "published_at", limit=limit, batch_size=batch_size)
+
+    def iter_news_without_content(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = None,
+        tickers: Optional[List[str]] = None,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[Dict]:
+        """get_news_without_content의 스트리밍 버전 ((published_at, id) 최신순 키셋 페이지)"""
+        conditions, params = self._missing_content_filters(tickers)
+        conditions, params = self._news_filters(conditions, params, start_time, end_time)
+        return self._iter_keyset("news", conditions, params, "published_at", limit=limit, batch_size=batch_size)
+
+    def _iter_keyset(
+        self,
+        table: str,
+        conditions: List[str],
+        params: List,
+        key_column: str,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        nullable_key: bool = True,
+    ) -> Iterator[Dict]:
+        """
+        (key_column, id) 내림차순 키셋 페이지네이션으로 행을 스트리밍합니다.
+        페이지마다 "(key, id) < (마지막 key, 마지막 id)" 조건으로 새 쿼리를 실행하고
+        fetchmany로 읽은 뒤 커서를 닫고 yield하므로, 순회 중 다른 쿼리/쓰기를 막지 않습니다.
+        key_column이 NULL인 행은 ORDER BY DESC와 같이 마지막에 id 내림차순으로 반환합니다.
+        """
+        batch_size = max(1, batch_size or self.ITER_BATCH_SIZE)
+        remaining = limit
+        phases = (False, True) if nullable_key else (None,)
+        for null_phase in phases:
+            last: Optional[Tuple] = None
+            while remaining is None or remaining > 0:
+                size = batch_size if remaining is None else min(batch_size, remaining)
+                query, page_params = self._keyset_query(table, conditions, params, key_column, null_phase, last, size)
+
+                cursor = self.get_connection().cursor()
+                cursor.row_factory = sqlite3.Row
+                try:
+                    cursor.execute(query, page_params)
+                    rows = [dict(row) for row in cursor.fetchmany(size)]
+                finally:
+                    cursor.close()
+
+                yield from rows
+                if remaining is not None:
+                    remaining -= len(rows)
+                if len(rows) < size:
+                    break
+                last = (rows[-1][key_column], rows[-1]["id"])
+
+    @staticmethod
+    def _keyset_query(
+        table: str,
+        conditions: List[str],
+        params: List,
+        key_column: str,
+        null_phase: Optional[bool],
+        last: Optional[Tuple],
+        size: int,
+    ) -> Tuple[str, List]:
+        """
+        키셋 페이지 SQL 조립
+
+        Args:
+            null_phase: None이면 NULL 구분 없음, False/True면 key_column이 NOT NULL/NULL인 구간
+            last: 직전 페이지 마지막 행의 (key, id) (첫 페이지는 None)
+        """
+        where = list(conditions)
+        params = list(params)
+        if null_phase is not None:
+            where.append(f"{key_column} IS NULL" if null_phase else f"{key_column} IS NOT NULL")
+        if last is not None:
+            if null_phase:
+                where.append("id < ?")
+                params.append(last[1])
+            else:
+                where.append(f"({key_column}, id) < (?, ?)")
+                params.extend(last)
+        order = "id DESC" if null_phase else f"{key_column} DESC, id DESC"
+        params.append(size)
+        return f"SELECT * FROM {table} WHERE {' AND '.join(where)} ORDER BY {order} LIMIT ?", params
+
+    @staticmethod
+    def _news_index_changes(conn: sqlite3.Connection, rows: List[Tuple]) -> List[Tuple[str, str]]:
+        """
+        upsert 후 검색 인덱스를 다시 만들어야 하는 (ticker, url) 목록
+        save_news_items의 ON CONFLICT 규칙대로 저장될 값을 계산해, 새 뉴스이거나
+        색인 대상(title, summary, published_at, content)이 바뀌었고 본문/요약이 있는 것만 반환합니다.
+        """
+        keys = list(dict.fromkeys((row[0], row[3]) for row in rows))
+        existing: Dict[Tuple[str, str], Tuple] = {}
+        # SQLite 바인딩 변수 제한을 넘지 않도록 나눠서 조회 (UNIQUE(ticker, url) 인덱스 사용)
+        for start in range(0, len(keys), 400):
+            chunk = keys[start:start + 400]
+            values = ",".join(["(?, ?)"] * len(chunk))
+            params = [value for key in chunk for value in key]
+            for ticker, url, *indexed in conn.execute(
+                f"SELECT ticker, url, title, summary, published_at, content FROM news "
+                f"WHERE (ticker, url) IN (VALUES {values})",
+                params,
+            ):
+                existing[(ticker, url)] = tuple(indexed)
+
+        changed: Dict[Tuple[str, str], None] = {}
+        for ticker, title, summary, url, _source, published_at, content in rows:
+            key = (ticker, url)
+            if isinstance(published_at, datetime):
+                published_at = published_at.isoformat(" ")  # sqlite3 기본 datetime 변환과 같은 형식
+            old = existing.get(key)
+            if old is None:
+                new = (title, summary, published_at, content)
+            else:
+                new = (
+                    title,
+                    summary if summary is not None else old[1],
+                    published_at if published_at is not None else old[2],
+                    content or old[3],
+                )
+            existing[key] = new
+            if new != old and (new[1] or new[3]):
+                changed[key] = None
+        return list(changed)
+
+    def _index_news(self, conn: sqlite3.Connection, ticker: str, url: str) -> None:
+        """저장된 뉴스 1건의 본문(없으면 요약)을 검색 인덱스에 반영"""
+        row = conn.execute(
+            "SELECT id, title, summary, published_at, content FROM news WHERE ticker = ? AND url = ?",
+            (ticker, url),
+        ).fetchone()
+        if not row:
+            return
+        news_id, title, summary, published_at, content = row
+        self._replace_passages(
+            conn, "news", str(news_id), ticker, published_at, title, content or summary or ""
+        )
+
+    @staticmethod
+    def _missing_content_filters(tickers: Optional[List[str]]) -> Tuple[List[str], List]:
+        """본문 없는 뉴스 조건 (+ 티커 목록)"""
+        conditions = [_NEWS_MISSING_CONTENT]
+        params: List = []
+        if tickers:
+            # 티커는 대문자로 저장되므로 UPPER(ticker) 없이 인덱스 사용
+            placeholders = ",".join(["?"] * len(tickers))
+            conditions.append(f"ticker IN ({placeholders})")
+            params.extend([t.upper() for t in tickers])
+        return conditions, params
+
+    @staticmethod
+    def _news_filters(
+        conditions: List[str],
+        params: List,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+    ) -> Tuple[List[str], List]:
+        """뉴스 조회 조건에 기간 조건 추가"""
+        conditions = list(conditions)
+        params = list(params)
+        if start_time and end_time:
+            conditions.append("published_at BETWEEN ? AND ?")
+            params.extend([start_time.isoformat(), end_time.isoformat()])
+        return conditions, params
+
+    @classmethod
+    def _news_query(
+        cls,
+        conditions: List[str],
+        params: List,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        limit: Optional[int],
+    ) -> Tuple[str, List]:
+        """뉴스 조회 SQL 조립 (기간 조건 + 최신순 정렬)"""
+        conditions, params = cls._news_filters(conditions, params, start_time, end_time)
+        query = f"""
+            SELECT * FROM news
+            WHERE {' AND '.join(conditions)}
+            ORDER BY published_at DESC
+        """
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        return query, params
+
+    def update_news_content(self, news_id: int, content: str) -> bool:
+        """
+        뉴스 본문 업데이트
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    """
+                    UPDATE news
+                    SET content = ?
+                    WHERE id = ?
+                    """,
+                    (content, news_id),
+                )
+                updated = cursor.rowcount > 0
+                if updated:
+                    ticker, url = conn.execute(
+                        "SELECT ticker, url FROM news WHERE id = ?", (news_id,)
+                    ).fetchone()
+                    self._index_news(conn, ticker, url)
+                conn.commit()
+                return updated
+            except Exception as exc:
+                print(f"뉴스 본문 업데이트 실패 (id={news_id}): {exc}")
+                conn.rollback()
+                return False
+    
+    def get_news_articles(self, pks: Iterable[str]) -> Dict[str, Dict]:
+        """
+        캐시된 Yahoo 뉴스 원문을 pk로 한 번에 조회
+
+        Returns:
+            {pk: news_articles 레코드} (캐시에 있는 것만 포함)
+        """
+        pks = [pk for pk in dict.fromkeys(pks) if pk]
+        if not pks:
+            return {}
+        found: Dict[str, Dict] = {}
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            # SQLite 바인딩 변수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(pks), 500):
+                chunk = pks[start:start + 500]
+                placeholders = ",".join(["?"] * len(chunk))
+                cursor.execute(f"SELECT * FROM news_articles WHERE pk IN ({placeholders})", chunk)
+                for row in cursor.fetchall():
+                    found[row["pk"]] = dict(row)
+        return found
+
+    def save_news_articles(self, articles: List[Dict]) -> int:
+        """
+        Yahoo 뉴스 원문을 캐시에 저장 (이미 있는 pk는 그대로 둠)
+
+        Args:
+            articles: {"pk", "ticker", "title", "source", "published_at", "path", "s3_key", "body"} 목록
+
+        Returns:
+            새로 저장된 수
+        """
+        rows = [
+            (
+                article["pk"],
+                (article.get("ticker") or "").upper() or None,
+                article.get("title"),
+                article.get("source"),
+                article.get("published_at"),
+                article.get("path"),
+                article.get("s3_key"),
+                article["body"],
+                len(article["body"].encode("utf-8")),
+            )
+            for article in articles
+            if article.get("pk") and article.get("body") is not None
+        ]
+        if not rows:
+            return 0
+        with self.get_connection() as conn:
+            before = conn.total_changes
+            try:
+                conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO news_articles (
+                        pk, ticker, title, source, published_at, path, s3_key, body, body_bytes
+                    )
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                conn.commit()
+            except Exception as exc:
+                conn.rollback()
+                print(f"❌ 뉴스 원문 캐시 저장 실패: {exc}")
+                return 0
+            return conn.total_changes - before
+
+    def link_news_articles(self, ticker: str, articles: List[Dict]) -> int:
+        """
+        캐시된 기사들을 티커에 연결 (get_recent_news_articles 조회 대상)
+
+        Args:
+            articles: {"pk", "published_at"} 목록
+
+        Returns:
+            새로 연결된 수
+        """
+        rows = [
+            (ticker.upper(), article["pk"], article.get("published_at"))
+            for article in articles
+            if article.get("pk")
+        ]
+        if not rows:
+            return 0
+        linked = 0
+        with self.get_connection() as conn:
+            for row in rows:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO news_article_tickers (ticker, pk, published_at) VALUES (?, ?, ?)",
+                    row,
+                )
+                if cursor.rowcount:
+                    # 새로 연결된 기사는 해당 티커의 전문 검색 인덱스에도 반영
+                    self._index_article(conn, row[0], row[1])
+                    linked += 1
+            conn.commit()
+        return linked
+
+    def get_recent_news_articles(self, ticker: str, limit: int) -> List[Dict]:
+        """티커에 연결된 캐시 기사 중 최신 limit개 (published_at, pk 내림차순)"""
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(self._SQL_RECENT_NEWS_ARTICLES, (ticker.upper(), limit))
+            return [dict(row) for row in cursor.fetchall()]
+
+    def count_news_articles(self, ticker: str) -> int:
+        """티커에 연결된 캐시 기사 수"""
+        with self.get_connection() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM news_article_tickers WHERE ticker = ?", (ticker.upper(),)
+            ).fetchone()[0]
+
+    def get_news_fetch_state(self, ticker: str) -> Optional[Dict]:
+        """티커별 뉴스 수집 상태(high-water mark) 조회"""
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT *
+                FROM news_fetch_state
+                WHERE ticker = ?
+                """,
+                (ticker.upper(),),
+            )
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def update_news_fetch_state(
+        self,
+        ticker: str,
+        *,
+        last_et_iso: Optional[str] = None,
+        last_pk: Optional[str] = None,
+        last_success_run: Optional[datetime] = None,
+    ) -> None:
+        """티커별 뉴스 수집 상태 갱신 (None인 값은 기존 값 유지)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO news_fetch_state (
+                    ticker,
+                    last_et_iso,
+                    last_pk,
+                    last_success_run,
+                    updated_at
+                )
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(ticker) DO UPDATE SET
+                    last_et_iso=COALESCE(excluded.last_et_iso, news_fetch_state.last_et_iso),
+                    last_pk=COALESCE(excluded.last_pk, news_fetch_state.last_pk),
+                    last_success_run=COALESCE(excluded.last_success_run, news_fetch_state.last_success_run),
+                    updated_at=CURRENT_TIMESTAMP
+                """,
+                (
+                    ticker.upper(),
+                    last_et_iso,
+                    last_pk,
+                    last_success_run.isoformat() if last_success_run else None,
+                ),
+            )
+            conn.commit()
+
+    def get_filing_by_accession(self, accession_number: str) -> Optional[Dict]:
+        """
+        접수 번호로 공시 자료 조회
+        
+        Args:
+            accession_number: 접수 번호
+            
+        Returns:
+            공시 자료 딕셔너리 또는 None
+        """
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT * FROM filings WHERE accession_number = ?
+            """, (accession_number,))
+            row = cursor.fetchone()
+            
+            return dict(row) if row else None
+    
+    def get_cik_map(self) -> Dict[str, str]:
+        """
+        저장된 티커 → CIK 매핑 전체 조회
+
+        Returns:
+            {티커: CIK} 딕셔너리
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT ticker, cik FROM ticker_cik_map")
+            return {row[0]: row[1] for row in cursor.fetchall()}
+
+    def replace_cik_map(self, entries: List[Dict]) -> int:
+        """
+        티커 → CIK 매핑을 통째로 교체 (하나의 트랜잭션)
+
+        Args:
+            entries: ticker, cik, title 키를 가진 딕셔너리 리스트
+
+        Returns:
+            저장된 매핑 수
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM ticker_cik_map")
+            # 동일 티커가 중복되면 첫 항목 유지
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO ticker_cik_map (ticker, cik, title, updated_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                [
+                    (entry["ticker"].upper(), entry["cik"], entry.get("title"))
+                    for entry in entries
+                ],
+            )
+            conn.commit()
+            cursor.execute("SELECT COUNT(*) FROM ticker_cik_map")
+            return cursor.fetchone()[0]
+
+    def get_http_validators(self, url: str) -> Optional[Dict]:
+        """
+        URL별 ETag / Last-Modified / 마지막 검증 시각 조회
+        """
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            
-            query = """
-                SELECT * FROM filings 
-                WHERE ticker = ? 
-                ORDER BY filed_date DESC
-            """
-            
-            if limit:
-                query += f" LIMIT {limit}"
-            
-            cursor.execute(query, (ticker.upper(),))
-            rows = cursor.fetchall()
-            
-            return [dict(row) for row in rows]
+            cursor.execute("""
+                SELECT * FROM sec_http_cache WHERE url = ?
+            """, (url,))
+            row = cursor.fetchone()
+            return dict(row) if row else None
 
-    def get_filings_between(
+    def update_http_validators(
         self,
-        ticker: str,
-        start_time: datetime,
-        end_time: datetime
-    ) -> List[Dict]:
+        url: str,
+        *,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        checked_at: Optional[datetime] = None,
+    ) -> None:
         """
-        특정 기간 동안의 공시 자료 조회
+        URL별 HTTP 검증자 저장 (None인 값은 기존 값 유지)
         """
-        start_iso = start_time.date().isoformat()
-        end_iso = end_time.date().isoformat()
         with self.get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute(
                 """
-                SELECT * FROM filings
-                WHERE ticker = ?
-                  AND acceptance_date IS NOT NULL
-                  AND acceptance_date BETWEEN ? AND ?
-                ORDER BY acceptance_date DESC
+                INSERT INTO sec_http_cache (url, etag, last_modified, checked_at, updated_at)
+                VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(url) DO UPDATE SET
+                    etag=COALESCE(excluded.etag, sec_http_cache.etag),
+                    last_modified=COALESCE(excluded.last_modified, sec_http_cache.last_modified),
+                    checked_at=COALESCE(excluded.checked_at, sec_http_cache.checked_at),
+                    updated_at=CURRENT_TIMESTAMP
                 """,
-                (ticker.upper(), start_iso, end_iso)
+                (
+                    url,
+                    etag,
+                    last_modified,
+                    checked_at.isoformat() if checked_at else None,
+                ),
             )
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            conn.commit()
+    
+    def save_filing_text(
+        self,
+        accession_number: str,
+        text_path: str,
+        text_length: int,
+        raw_size: Optional[int] = None,
+        documents: Optional[List[Dict]] = None,
+    ) -> None:
+        """
+        공시 정제 텍스트 정보 저장 (재추출 시 덮어씀)
 
-    def get_latest_annual_quarterly(self, ticker: str) -> Dict[str, Dict]:
+        Args:
+            text_length: 정제 텍스트 파일 크기 (바이트)
+            documents: 문서별 바이트 오프셋 목록
         """
-        가장 최근 10-K (연간보고서)와 10-Q (분기보고서)를 가져옴
-        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO filing_texts (
+                    accession_number, text_path, text_length, raw_size, documents, extracted_at
+                )
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(accession_number) DO UPDATE SET
+                    text_path=excluded.text_path,
+                    text_length=excluded.text_length,
+                    raw_size=excluded.raw_size,
+                    documents=excluded.documents,
+                    extracted_at=CURRENT_TIMESTAMP
+                """,
+                (
+                    accession_number,
+                    text_path,
+                    text_length,
+                    raw_size,
+                    json.dumps(documents or [], ensure_ascii=False),
+                ),
+            )
+            conn.commit()
+
+    def get_filing_texts(self, accession_numbers: Iterable[str]) -> Dict[str, Dict]:
+        """
+        여러 공시의 정제 텍스트 정보를 한 번에 조회
+
         Returns:
-            {'10-K': {...} or None, '10-Q': {...} or None}
+            {접수번호: {text_path, text_length, raw_size, documents(list), ...}}
         """
-        result = {'10-K': None, '10-Q': None}
-        
+        accessions = [a for a in dict.fromkeys(accession_numbers) if a]
+        found: Dict[str, Dict] = {}
+        if not accessions:
+            return found
         with self.get_connection() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            
-            # 가장 최근 10-K
-            cursor.execute("""
-                SELECT * FROM filings 
-                WHERE ticker = ? AND form = '10-K'
-                ORDER BY filed_date DESC
-                LIMIT 1
-            """, (ticker.upper(),))
-            row = cursor.fetchone()
-            if row:
-                result['10-K'] = dict(row)
-            
-            # 가장 최근 10-Q
-            cursor.execute("""
-                SELECT * FROM filings 
-                WHERE ticker = ? AND form = '10-Q'
-                ORDER BY filed_date DESC
-                LIMIT 1
-            """, (ticker.upper(),))
-            row = cursor.fetchone()
-            if row:
-                result['10-Q'] = dict(row)
-        
-        return result
+            for start in range(0, len(accessions), 500):
+                chunk = accessions[start:start + 500]
+                placeholders = ",".join(["?"] * len(chunk))
+                cursor.execute(
+                    f"SELECT * FROM filing_texts WHERE accession_number IN ({placeholders})",
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    record = dict(row)
+                    record["documents"] = json.loads(record["documents"] or "[]")
+                    found[record["accession_number"]] = record
+        return found
 
-    def save_news_items(self, ticker: str, news_items: List[Dict]) -> int:
+    def save_filing_sections(self, accession_number: str, sections: List[Dict]) -> int:
         """
-        뉴스 데이터를 저장 (중복은 무시)
+        공시의 섹션 위치를 통째로 교체 저장
+
+        Args:
+            sections: [{"part", "item", "title", "start", "end"}] (바이트 오프셋)
+
+        Returns:
+            저장된 섹션 수
         """
-        if not news_items:
-            return 0
-        inserted = 0
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            for item in news_items:
-                try:
-                    cursor.execute(
-                        """
-                        INSERT OR IGNORE INTO news
-                        (ticker, title, summary, url, source, published_at, content)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            (item.get("ticker") or ticker).upper(),
-                            item.get("title"),
-                            item.get("summary"),
-                            item.get("url"),
-                            item.get("source"),
-                            item.get("published_at"),
-                            item.get("content"),
-                        )
+            cursor.execute(
+                "DELETE FROM filing_sections WHERE accession_number = ?",
+                (accession_number,),
+            )
+            cursor.executemany(
+                """
+                INSERT OR REPLACE INTO filing_sections (
+                    accession_number, part, item, title, start_offset, end_offset
+                )
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        accession_number,
+                        section.get("part") or "",
+                        section["item"],
+                        section.get("title"),
+                        section["start"],
+                        section["end"],
                     )
-                    if cursor.rowcount > 0:
-                        inserted += 1
-                except Exception as exc:
-                    print(f"❌ 뉴스 저장 실패: {exc}")
+                    for section in sections
+                ],
+            )
             conn.commit()
-        return inserted
+        return len(sections)
 
-    def get_news(
+    def get_filing_section(
         self,
-        ticker: str,
-        start_time: Optional[datetime] = None,
-        end_time: Optional[datetime] = None,
-        limit: Optional[int] = None
-    ) -> List[Dict]:
+        accession_number: str,
+        item: str,
+        part: Optional[str] = None,
+    ) -> Optional[Dict]:
         """
-        뉴스 데이터 조회
+        섹션 위치와 정제 텍스트 경로 조회
+        part를 생략하면 같은 Item 중 문서 앞쪽 것을 반환합니다.
+
+        Returns:
+            {part, item, title, start_offset, end_offset, text_path} 또는 None
         """
-        params: List = [ticker.upper()]
-        conditions = ["ticker = ?"]
-        if start_time and end_time:
-            conditions.append("published_at BETWEEN ? AND ?")
-            params.extend([start_time.isoformat(), end_time.isoformat()])
-        query = f"""
-            SELECT * FROM news
-            WHERE {' AND '.join(conditions)}
-            ORDER BY published_at DESC
+        query = """
+            SELECT s.part, s.item, s.title, s.start_offset, s.end_offset, t.text_path
+            FROM filing_sections s
+            JOIN filing_texts t ON t.accession_number = s.accession_number
+            WHERE s.accession_number = ? AND s.item = ?
         """
-        if limit:
-            query += f" LIMIT {limit}"
+        params: List = [accession_number, item.upper()]
+        if part is not None:
+            query += " AND s.part = ?"
+            params.append(part.upper())
+        query += " ORDER BY s.start_offset LIMIT 1"
+
         with self.get_connection() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
             cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            row = cursor.fetchone()
+            return dict(row) if row else None
 
-    def get_news_without_content(
+    def get_sec_fetch_state(self, cik: str) -> Optional[Dict]:
+        """CIK별 크롤링 상태(high-water mark) 조회"""
+        with self.get_connection() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT *
+                FROM sec_fetch_state
+                WHERE cik = ?
+                """,
+                (cik.zfill(10),),
+            )
+            row = cursor.fetchone()
+            return dict(row) if row else None
+
+    def update_sec_fetch_state(
         self,
-        start_time: Optional[datetime] = None,
-        end_time: Optional[datetime] = None,
-        limit: Optional[int] = None,
-        tickers: Optional[List[str]] = None,
-    ) -> List[Dict]:
+        cik: str,
+        *,
+        ticker: Optional[str] = None,
+        last_acceptance_datetime: Optional[str] = None,
+        last_accession_number: Optional[str] = None,
+        submissions_etag: Optional[str] = None,
+        last_success_run: Optional[datetime] = None,
+    ) -> None:
+        """CIK별 크롤링 상태 갱신 (None인 값은 기존 값 유지)"""
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                INSERT INTO sec_fetch_state (
+                    cik,
+                    ticker,
+                    last_acceptance_datetime,
+                    last_accession_number,
+                    submissions_etag,
+                    last_success_run,
+                    updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(cik) DO UPDATE SET
+                    ticker=COALESCE(excluded.ticker, sec_fetch_state.ticker),
+                    last_acceptance_datetime=COALESCE(excluded.last_acceptance_datetime, sec_fetch_state.last_acceptance_datetime),
+                    last_accession_number=COALESCE(excluded.last_accession_number, sec_fetch_state.last_accession_number),
+                    submissions_etag=COALESCE(excluded.submissions_etag, sec_fetch_state.submissions_etag),
+                    last_success_run=COALESCE(excluded.last_success_run, sec_fetch_state.last_success_run),
+                    updated_at=CURRENT_TIMESTAMP
+                """,
+                (
+                    cik.zfill(10),
+                    ticker.upper() if ticker else None,
+                    last_acceptance_datetime,
+                    last_accession_number,
+                    submissions_etag,
+                    last_success_run.isoformat() if last_success_run else None,
+                ),
+            )
+            conn.commit()
+
+    def _replace_passages(
+        self,
+        conn: sqlite3.Connection,
+        kind: str,
+        ref: str,
+        ticker: str,
+        doc_date: Optional[str],
+        title: Optional[str],
+        text: str,
+    ) -> int:
         """
-        본문이 비어 있는 뉴스 조회
+        문서의 기존 검색 단위를 지우고 다시 넣음 (호출한 쪽 트랜잭션 안에서 실행)
+        기사는 여러 티커에 연결되므로 (kind, ref, ticker)별로 따로 관리합니다.
         """
-        params: List = []
-        conditions = ["(content IS NULL OR content = '')"]
+        old_ids = [row[0] for row in conn.execute(
+            "SELECT id FROM search_passages WHERE kind = ? AND ref = ? AND ticker = ?", (kind, ref, ticker.upper())
+        )]
+        if old_ids:
+            conn.executemany("DELETE FROM search_fts WHERE rowid = ?", [(i,) for i in old_ids])
+            conn.executemany("DELETE FROM search_passages WHERE id = ?", [(i,) for i in old_ids])
 
-        if tickers:
-            placeholders = ",".join(["?"] * len(tickers))
-            conditions.append(f"UPPER(ticker) IN ({placeholders})")
-            params.extend([t.upper() for t in tickers])
+        doc_date = (doc_date or "")[:10] or None
+        count = 0
+        for seq, passage in enumerate(split_passages(text)):
+            cursor = conn.execute(
+                """
+                INSERT INTO search_passages (kind, ref, ticker, doc_date, title, seq)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (kind, ref, ticker.upper(), doc_date, title, seq),
+            )
+            conn.execute(
+                "INSERT INTO search_fts (rowid, title, body) VALUES (?, ?, ?)",
+                (cursor.lastrowid, title or "", passage),
+            )
+            count += 1
+        return count
 
-        if start_time and end_time:
-            conditions.append("published_at BETWEEN ? AND ?")
-            params.extend([start_time.isoformat(), end_time.isoformat()])
+    def _index_article(self, conn: sqlite3.Connection, ticker: str, pk: str) -> int:
+        """캐시된 Yahoo 기사 1건을 티커의 검색 인덱스에 반영 (원문 XML은 텍스트로 정제)"""
+        from src.filing_text import html_to_text  # filing_text가 db를 import하므로 여기서 import
 
-        where_clause = " AND ".join(conditions)
-        query = f"""
-            SELECT * FROM news
-            WHERE {where_clause}
-            ORDER BY published_at DESC
+        row = conn.execute(
+            "SELECT title, published_at, body FROM news_articles WHERE pk = ?", (pk,)
+        ).fetchone()
+        if not row:
+            return 0
+        title, published_at, body = row
+        return self._replace_passages(conn, "article", pk, ticker, published_at, title, html_to_text(body or ""))
+
+    def rebuild_search_index(self) -> Dict[str, int]:
         """
-        if limit:
-            query += f" LIMIT {limit}"
+        검색 인덱스(search_passages / search_fts)를 저장된 데이터로 다시 만듭니다.
+        검색 기능 이전에 저장된 뉴스 본문/요약, Yahoo 기사, 공시 정제 텍스트를 채우는 용도로,
+        마이그레이션 후 init_db가 한 번 실행합니다.
 
+        Returns:
+            {"news": 뉴스 수, "article": 기사(티커별) 수, "filing": 공시 수} (검색 단위가 생긴 문서만)
+        """
+        counts = {"news": 0, "article": 0, "filing": 0}
         with self.get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+            conn.execute("DELETE FROM search_fts")
+            conn.execute("DELETE FROM search_passages")
+            news = conn.execute(
+                f"SELECT ticker, url FROM news WHERE NOT {_NEWS_MISSING_CONTENT} OR COALESCE(summary, '') != ''"
+            ).fetchall()
+            for ticker, url in news:
+                self._index_news(conn, ticker, url)
+                counts["news"] += 1
+            for ticker, pk in conn.execute("SELECT ticker, pk FROM news_article_tickers").fetchall():
+                if self._index_article(conn, ticker, pk):
+                    counts["article"] += 1
+            conn.commit()
 
-    def update_news_content(self, news_id: int, content: str) -> bool:
+        # 공시 정제 텍스트는 파일에서 한 건씩 읽음
+        texts = self.get_connection().execute("SELECT accession_number, text_path FROM filing_texts").fetchall()
+        for accession_number, text_path in texts:
+            path = Path(text_path)
+            if not path.exists():
+                continue
+            if self.index_filing_text(accession_number, path.read_text(encoding="utf-8", errors="ignore")):
+                counts["filing"] += 1
+        return counts
+
+    def index_filing_text(self, accession_number: str, text: str) -> int:
         """
-        뉴스 본문 업데이트
+        공시 정제 텍스트를 전문 검색 인덱스에 반영 (filings에 저장된 공시만)
+
+        Returns:
+            인덱싱된 검색 단위 수
         """
+        filing = self.get_filing_by_accession(accession_number)
+        if not filing:
+            return 0
+        title = f"{filing.get('form')} {filing.get('filed_date')} {filing.get('filing_entity') or ''}".strip()
         with self.get_connection() as conn:
-            cursor = conn.cursor()
-            try:
-                cursor.execute(
-                    """
-                    UPDATE news
-                    SET content = ?
-                    WHERE id = ?
-                    """,
-                    (content, news_id),
-                )
-                conn.commit()
-                return cursor.rowcount > 0
-            except Exception as exc:
-                print(f"뉴스 본문 업데이트 실패 (id={news_id}): {exc}")
-                conn.rollback()
-                return False
-    
-    def get_filing_by_accession(self, accession_number: str) -> Optional[Dict]:
+            return self._replace_passages(
+                conn, "filing", accession_number, filing["ticker"], filing.get("filed_date"), title, text
+            )
+
+    def search(
+        self,
+        ticker: str,
+        query: str,
+        k: int = 5,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        kinds: Optional[List[str]] = None,
+    ) -> List[Dict]:
         """
-        접수 번호로 공시 자료 조회
-        
+        티커의 공시 텍스트/뉴스 본문에서 질의와 가장 관련 있는 구간을 찾습니다 (bm25 순위).
+
         Args:
-            accession_number: 접수 번호
-            
+            ticker: 주식 티커 심볼
+            query: 검색할 문장 또는 키워드
+            k: 반환할 최대 구간 수
+            start_date, end_date: 문서 날짜 범위 (YYYY-MM-DD, 양 끝 포함)
+            kinds: "filing", "news", "article" 중 검색할 종류 (None이면 전체)
+
         Returns:
-            공시 자료 딕셔너리 또는 None
+            [{kind, ref, ticker, doc_date, title, snippet, text, score}] (관련도 높은 순)
         """
+        match = _fts_query(query)
+        if not match:
+            return []
+
+        conditions = ["search_fts MATCH ?", "p.ticker = ?"]
+        params: List = [match, ticker.upper()]
+        if start_date:
+            conditions.append("p.doc_date >= ?")
+            params.append(str(start_date)[:10])
+        if end_date:
+            conditions.append("p.doc_date <= ?")
+            params.append(str(end_date)[:10])
+        if kinds:
+            conditions.append(f"p.kind IN ({','.join(['?'] * len(kinds))})")
+            params.extend(kinds)
+        params.append(k)
+
         with self.get_connection() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT * FROM filings WHERE accession_number = ?
-            """, (accession_number,))
-            row = cursor.fetchone()
-            
-            return dict(row) if row else None
-    
+            cursor.execute(
+                f"""
+                SELECT p.kind, p.ref, p.ticker, p.doc_date, p.title,
+                       snippet(search_fts, 1, '[', ']', ' … ', 24) AS snippet,
+                       search_fts.body AS text,
+                       bm25(search_fts, 2.0, 1.0) AS score
+                FROM search_fts
+                JOIN search_passages p ON p.id = search_fts.rowid
+                WHERE {' AND '.join(conditions)}
+                ORDER BY score
+                LIMIT ?
+                """,
+                params,
+            )
+            return [dict(row) for row in cursor.fetchall()]
+
+    @classmethod
+    def hot_queries(cls) -> Dict[str, Tuple[str, List]]:
+        """check_query_plans가 점검하는 자주 실행되는 조회 {조회 이름: (SQL, 바인딩 값)}"""
+        since = datetime(2000, 1, 1)
+        return {
+            "get_filings_by_ticker": (cls._SQL_FILINGS_BY_TICKER, ["GOOG"]),
+            "get_filings_between": (cls._SQL_FILINGS_BETWEEN, ["GOOG", "2024-01-01", "2024-12-31"]),
+            "get_latest_annual_quarterly": (cls._SQL_LATEST_BY_FORM, ["GOOG", "10-K"]),
+            "get_filings_for_tickers": (
+                cls._SQL_FILINGS_FOR_TICKERS.format(tickers="?, ?"),
+                ["2024-01-01", "2024-12-31", "GOOG", "AAPL", "2024-01-01", "2024-12-31"],
+            ),
+            "get_filings_by_accessions": ("SELECT * FROM filings WHERE accession_number IN (?, ?)", ["a", "b"]),
+            "get_news_articles": ("SELECT * FROM news_articles WHERE pk IN (?, ?)", ["a", "b"]),
+            "get_recent_news_articles": (cls._SQL_RECENT_NEWS_ARTICLES, ["GOOG", 10]),
+            "get_news": cls._news_query(["ticker = ?"], ["GOOG"], since, datetime.now(), 10),
+            "get_news_without_content": cls._news_query([_NEWS_MISSING_CONTENT], [], since, datetime.now(), 10),
+            "get_news_without_content(tickers)": cls._news_query(
+                [_NEWS_MISSING_CONTENT, "ticker IN (?, ?)"], ["GOOG", "AAPL"], since, datetime.now(), 10
+            ),
+            "iter_filings_by_ticker": cls._keyset_query(
+                "filings", ["ticker = ?"], ["GOOG"], "filed_date", None, ("2024-01-01", 1), 500
+            ),
+            "iter_news": cls._keyset_query(
+                "news", ["ticker = ?"], ["GOOG"], "published_at", False, ("2024-01-01", 1), 500
+            ),
+            "iter_news_without_content": cls._keyset_query(
+                "news", [_NEWS_MISSING_CONTENT], [], "published_at", False, ("2024-01-01", 1), 500
+            ),
+        }
+
+    def check_query_plans(self, names: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """
+        주요 조회의 EXPLAIN QUERY PLAN을 확인합니다.
+        인덱스 검색 없이 테이블(또는 인덱스) 전체를 읽는 단계("SCAN ...")가 있는 조회만 반환하므로,
+        스키마/쿼리 변경 후 빈 딕셔너리가 아니면 인덱스가 빠진 것입니다.
+        (tests/test_query_plans.py가 조회별로 확인)
+
+        Args:
+            names: 확인할 조회 이름 (None이면 hot_queries() 전체)
+
+        Returns:
+            {조회 이름: [전체 스캔 단계 설명]}
+        """
+        hot_queries = self.hot_queries()
+        if names is not None:
+            hot_queries = {name: hot_queries[name] for name in names}
+        scans: Dict[str, List[str]] = {}
+        conn = self.get_connection()
+        for name, (query, params) in hot_queries.items():
+            plan = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+            details = [row[-1] for row in plan]
+            # "SCAN 테이블 USING INDEX ..."도 인덱스 전체를 순서대로 읽는 것이므로 전체 스캔으로 봄
+            # (서브쿼리(윈도우 함수 결과) 순회만 허용)
+            full_scans = [d for d in details if d.startswith("SCAN ") and not d.startswith("SCAN (subquery")]
+            if full_scans:
+                scans[name] = full_scans
+        return scans
+
     def get_statistics(self) -> Dict:
         """
         데이터베이스 통계 정보 반환
@@ -474,67 +2000,14 @@ class QuartrDatabase:
 
     def __init__(self, db_path: str = "quartr_calls.db"):
         self.db_path = db_path
-        self.init_db()
+        self._manager = ConnectionManager.for_path(db_path)
+        self._manager.ensure_schema(type(self).__name__, self.init_db)
 
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        return self._manager.connection()
 
     def init_db(self):
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS earning_calls (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    ticker VARCHAR(10) NOT NULL,
-                    quartr_event_id VARCHAR(64) UNIQUE NOT NULL,
-                    call_date TIMESTAMP NOT NULL,
-                    call_type VARCHAR(50),
-                    timezone VARCHAR(50),
-                    source_url TEXT,
-                    transcript_hash VARCHAR(64),
-                    transcript_text TEXT,
-                    transcript_path TEXT,
-                    transcript_size INTEGER,
-                    language VARCHAR(20),
-                    downloaded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
-            cursor.execute(
-                """
-                CREATE TABLE IF NOT EXISTS quartr_fetch_state (
-                    ticker VARCHAR(10) PRIMARY KEY,
-                    last_call_datetime TIMESTAMP,
-                    last_success_run TIMESTAMP,
-                    last_cursor TEXT,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-                """
-            )
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_earning_calls_ticker_calldate
-                ON earning_calls(ticker, call_date)
-                """
-            )
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_earning_calls_hash
-                ON earning_calls(transcript_hash)
-                """
-            )
-            cursor.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_quartr_fetch_state_last_call
-                ON quartr_fetch_state(last_call_datetime)
-                """
-            )
-
-            conn.commit()
-            print(f"Quartr DB 초기화 완료: {self.db_path}")
+        apply_migrations(self.get_connection(), QUARTR_MIGRATIONS, self.db_path)
 
     def _normalize_datetime(self, value: Optional[datetime]) -> Optional[str]:
         if value is None:
@@ -648,9 +2121,11 @@ class QuartrDatabase:
                 WHERE ticker = ?
                 ORDER BY call_date DESC
             """
+            params: List = [ticker.upper()]
             if limit:
-                query += f" LIMIT {limit}"
-            cursor.execute(query, (ticker.upper(),))
+                query += " LIMIT ?"
+                params.append(limit)
+            cursor.execute(query, params)
             rows = cursor.fetchall()
             return [dict(row) for row in rows]
 
@@ -0,0 +1,138 @@
+"""
+EDGAR 벌크 submissions.zip 적재 모듈
+압축을 풀지 않고 아카이브 멤버를 하나씩 읽어 추적 중인 CIK만 파싱하고,
+공시 메타데이터를 SECDatabase.filings에 대량 적재합니다.
+(filings.files 페이지 히스토리 포함, CIK별 HTTP 요청 없음)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from src.db import SECDatabase
+from src.sec_submissions import SubmissionsSnapshot
+
+
+class SubmissionsBulkLoader:
+    """submissions.zip에서 추적 CIK의 공시 메타데이터를 적재하는 클래스"""
+
+    ARCHIVE_URL = "https://www.sec.gov/Archives/edgar/daily-index/bulkdata/submissions.zip"
+    ARCHIVE_PATH = "downloads/sec_cache/submissions.zip"
+    BATCH_SIZE = 5000
+
+    def __init__(self, db: Optional[SECDatabase] = None, batch_size: Optional[int] = None):
+        """
+        Args:
+            db: 메타데이터를 적재할 데이터베이스
+            batch_size: 트랜잭션당 INSERT 행 수
+        """
+        self.db = db or SECDatabase()
+        self.batch_size = batch_size or self.BATCH_SIZE
+
+    def download_archive(self, session, dest: Optional[str] = None) -> Optional[Path]:
+        """
+        submissions.zip을 스트리밍으로 내려받습니다 (중단 시 이어받기).
+
+        Args:
+            session: RateLimitedSession (download 메서드 필요)
+            dest: 저장 경로
+        """
+        path = Path(dest or self.ARCHIVE_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            if session.download(self.ARCHIVE_URL, path):
+                return path
+            print("submissions.zip을 다운로드할 수 없습니다.")
+        except Exception as e:
+            print(f"submissions.zip 다운로드 중 오류 발생: {e}")
+        return None
+
+    def iter_filings(self, archive_path: Path, cik_to_ticker: Dict[str, str]) -> Iterator[Dict]:
+        """
+        아카이브에서 추적 CIK의 공시 메타데이터를 한 건씩 생성합니다.
+        recent와 filings.files에 나열된 과거 페이지를 모두 포함합니다.
+
+        Args:
+            archive_path: submissions.zip 경로
+            cik_to_ticker: {CIK(10자리): 티커}
+        """
+        tracked = {cik.zfill(10): ticker.upper() for cik, ticker in cik_to_ticker.items()}
+        with zipfile.ZipFile(archive_path) as archive:
+            members = set(archive.namelist())
+            for cik, ticker in tracked.items():
+                name = f"CIK{cik}.json"
+                if name not in members:
+                    print(f"⚠️  아카이브에 {name}이(가) 없습니다.")
+                    continue
+                # 멤버 단위로만 압축 해제하여 메모리에서 파싱
+                with archive.open(name) as member:
+                    data = json.load(member)
+
+                entity = data.get("name", "")
+                pages = [SubmissionsSnapshot(cik, data)]
+                for page in (data.get("filings") or {}).get("files") or []:
+                    page_name = page.get("name")
+                    if not page_name or page_name not in members:
+                        continue
+                    with archive.open(page_name) as member:
+                        columns = json.load(member)
+                    pages.append(SubmissionsSnapshot(cik, {"name": entity, "filings": {"recent": columns}}))
+
+                for snapshot in pages:
+                    for idx in range(len(snapshot)):
+                        info = snapshot.filing_info(idx)
+                        info["ticker"] = ticker
+                        info.setdefault("acceptance_date", info["filed_date"])
+                        yield info
+
+    def ingest(self, archive_path: Path, cik_to_ticker: Dict[str, str]) -> Dict[str, int]:
+        """
+        아카이브의 추적 CIK 공시 메타데이터를 배치 단위 트랜잭션으로 적재합니다.
+        이미 있는 접수번호(다운로드된 공시 포함)는 건드리지 않습니다.
+
+        Returns:
+            {"scanned": 읽은 행 수, "inserted": 새로 추가된 행 수}
+        """
+        scanned = 0
+        inserted = 0
+        batch: List[Dict] = []
+        for info in self.iter_filings(archive_path, cik_to_ticker):
+            batch.append(info)
+            scanned += 1
+            if len(batch) >= self.batch_size:
+                inserted += self.db.bulk_insert_filing_metadata(batch)
+                batch = []
+        if batch:
+            inserted += self.db.bulk_insert_filing_metadata(batch)
+
+        print(f"📦 submissions.zip 적재 완료: {scanned}건 확인, {inserted}건 추가")
+        return {"scanned": scanned, "inserted": inserted}
+
+
+def main():
+    """submissions.zip으로 여러 티커의 공시 히스토리를 한 번에 적재"""
+    from src.sec_crawler import SECCrawler
+
+    parser = argparse.ArgumentParser(description="EDGAR submissions.zip 벌크 적재")
+    parser.add_argument("--tickers", nargs="+", required=True, help="적재할 티커 목록")
+    parser.add_argument("--archive", default=None, help="이미 받아둔 submissions.zip 경로")
+    args = parser.parse_args()
+
+    db = SECDatabase()
+    crawler = SECCrawler(db=db)
+    ciks = crawler.get_ciks_from_tickers(args.tickers)
+    cik_to_ticker = {cik: ticker for ticker, cik in ciks.items() if cik}
+
+    loader = SubmissionsBulkLoader(db=db)
+    archive_path = Path(args.archive) if args.archive else loader.download_archive(crawler.session)
+    if not archive_path:
+        return
+    loader.ingest(archive_path, cik_to_ticker)
+
+
+if __name__ == "__main__":
+    main()
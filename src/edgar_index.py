@@ -0,0 +1,268 @@
+"""
+EDGAR 일별 인덱스 기반 신규 공시 탐색 모듈
+하루에 인덱스 파일(master.idx / form.idx) 1개만 받아 추적 중인 CIK와 조인하고,
+원문이 저장되지 않은 공시(DB에 없거나 메타데이터만 있거나 블롭이 지워진 공시)만 다운로드 대상으로 돌려줍니다.
+(티커 수와 관계없이 요청 수가 날짜 수에 비례)
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.blob_store import BlobStore
+from src.db import SECDatabase
+from src.time_utils import get_korea_batch_window
+
+try:
+    from zoneinfo import ZoneInfo
+
+    EDGAR_TZ = ZoneInfo("America/New_York")
+except Exception:  # tzdata가 없는 환경
+    EDGAR_TZ = timezone(timedelta(hours=-5))
+
+
+def parse_index(text: str, kind: str = "master") -> Iterator[Dict]:
+    """
+    EDGAR 일별 인덱스 파일 파싱
+
+    Args:
+        text: 인덱스 파일 내용
+        kind: "master" (CIK|Company|Form|Date|Filename) 또는 "form" (고정폭 컬럼)
+
+    Yields:
+        cik, company, form, filed_date, accession_number, filename 키를 가진 딕셔너리
+    """
+    body_started = False
+    for line in text.splitlines():
+        if not body_started:
+            # 헤더는 '-----' 구분선에서 끝남
+            if line.startswith("---"):
+                body_started = True
+            continue
+        if not line.strip():
+            continue
+
+        if kind == "master":
+            parts = line.split("|")
+            if len(parts) != 5:
+                continue
+            cik, company, form, filed, filename = (p.strip() for p in parts)
+        else:
+            # Form Type / Company Name / CIK / Date Filed / File Name
+            tokens = line.rsplit(None, 3)
+            if len(tokens) != 4:
+                continue
+            head, cik, filed, filename = tokens
+            head_parts = re.split(r"\s{2,}", head.strip(), maxsplit=1)
+            if len(head_parts) != 2:
+                continue
+            form, company = head_parts
+
+        if not cik.isdigit():
+            continue
+        yield {
+            "cik": cik.zfill(10),
+            "company": company.strip(),
+            "form": form.strip(),
+            "filed_date": _normalize_date(filed),
+            "accession_number": Path(filename).stem,
+            "filename": filename,
+        }
+
+
+def _normalize_date(raw: str) -> str:
+    raw = raw.strip()
+    if len(raw) == 8 and raw.isdigit():
+        return f"{raw[:4]}-{raw[4:6]}-{raw[6:]}"
+    return raw
+
+
+def index_dates_for_window(window_start: datetime, window_end: datetime) -> List[date]:
+    """
+    KST 배치 구간을 덮는 EDGAR(미 동부) 제출일 목록 (주말 제외)
+    """
+    start = window_start.astimezone(EDGAR_TZ).date()
+    end = window_end.astimezone(EDGAR_TZ).date()
+    days = []
+    current = start
+    while current <= end:
+        if current.weekday() < 5:  # 주말에는 인덱스가 없음
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+class DailyIndexDiscovery:
+    """EDGAR 일별 인덱스로 추적 CIK의 신규 공시를 찾는 클래스"""
+
+    INDEX_URL = "https://www.sec.gov/Archives/edgar/daily-index/{year}/QTR{quarter}/{kind}.{ymd}.idx"
+    CACHE_DIR = "downloads/sec_cache/daily-index"
+
+    def __init__(
+        self,
+        session=None,
+        db: Optional[SECDatabase] = None,
+        kind: str = "master",
+        index_dir: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        blob_store: Optional[BlobStore] = None,
+    ):
+        """
+        Args:
+            session: SEC 요청용 세션 (index_dir만 쓸 때는 None 가능)
+            db: 이미 저장된 접수번호 확인용 데이터베이스
+            kind: "master" 또는 "form"
+            index_dir: 로컬 인덱스 파일 디렉토리 (지정 시 HTTP 요청 없이 이 파일만 사용)
+            cache_dir: 받아온 과거 인덱스를 보관할 디렉토리
+            blob_store: 저장된 원문 존재 확인용 블롭 저장소 (None이면 기본 저장소)
+        """
+        if kind not in ("master", "form"):
+            raise ValueError("kind는 'master' 또는 'form'이어야 합니다.")
+        self.session = session
+        self.db = db or SECDatabase()
+        self.kind = kind
+        self.index_dir = Path(index_dir) if index_dir else None
+        self.cache_dir = Path(cache_dir or self.CACHE_DIR)
+        self.blob_store = blob_store or BlobStore()
+
+    def index_filename(self, day: date) -> str:
+        return f"{self.kind}.{day.strftime('%Y%m%d')}.idx"
+
+    def load_index(self, day: date) -> Optional[str]:
+        """
+        해당 날짜의 인덱스 파일 내용 (없으면 None)
+        지난 날짜의 인덱스는 바뀌지 않으므로 디스크 캐시를 그대로 사용합니다.
+        """
+        filename = self.index_filename(day)
+        if self.index_dir is not None:
+            path = self.index_dir / filename
+            return path.read_text(encoding="latin-1") if path.exists() else None
+
+        cache_path = self.cache_dir / filename
+        if cache_path.exists():
+            return cache_path.read_text(encoding="latin-1")
+        if self.session is None:
+            return None
+
+        url = self.INDEX_URL.format(
+            year=day.year,
+            quarter=(day.month - 1) // 3 + 1,
+            kind=self.kind,
+            ymd=day.strftime("%Y%m%d"),
+        )
+        try:
+            response = self.session.get(url)
+            if response.status_code != 200:
+                # 휴일 등 인덱스가 없는 날
+                return None
+            text = response.content.decode("latin-1")
+        except Exception as e:
+            print(f"일별 인덱스 조회 중 오류 발생 ({filename}): {e}")
+            return None
+
+        # 오늘(미 동부) 인덱스는 아직 갱신 중일 수 있으므로 캐싱하지 않음
+        if day < datetime.now(EDGAR_TZ).date():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(text, encoding="latin-1")
+        return text
+
+    def discover(
+        self,
+        cik_to_ticker: Dict[str, str],
+        days: Iterable[date],
+        forms: Optional[Iterable[str]] = None,
+    ) -> List[Dict]:
+        """
+        여러 날짜의 인덱스에서 추적 CIK의 신규 공시만 추립니다.
+
+        Args:
+            cik_to_ticker: {CIK(10자리): 티커}
+            days: 조회할 제출일 목록
+            forms: 포함할 양식 (None이면 전체)
+
+        Returns:
+            크롤러 공용 filing_info 딕셔너리 리스트 (원문이 저장되지 않은 것만, ticker 포함)
+        """
+        tracked = {cik.zfill(10): ticker.upper() for cik, ticker in cik_to_ticker.items()}
+        form_filter = set(forms) if forms else None
+
+        candidates: Dict[str, Dict] = {}
+        for day in days:
+            text = self.load_index(day)
+            if not text:
+                continue
+            for entry in parse_index(text, self.kind):
+                ticker = tracked.get(entry["cik"])
+                if not ticker:
+                    continue
+                if form_filter and entry["form"] not in form_filter:
+                    continue
+                candidates.setdefault(entry["accession_number"], {
+                    "ticker": ticker,
+                    "form": entry["form"],
+                    "filed": entry["filed_date"],
+                    "filed_date": entry["filed_date"],
+                    "acceptance_date": entry["filed_date"],
+                    "reporting_for": None,
+                    "filing_entity": entry["company"],
+                    "accession_number": entry["accession_number"],
+                    "cik": entry["cik"],
+                })
+
+        # 메타데이터만 있는 행(file_path='')이나 블롭이 지워진 행은 다시 받아야 하므로 원문 존재까지 확인
+        known = self.db.get_filings_by_accessions(candidates.keys())
+        return [
+            info for accession, info in candidates.items()
+            if not self._is_stored(known.get(accession))
+        ]
+
+    def _is_stored(self, row: Optional[Dict]) -> bool:
+        """DB에 있고 원문(블롭 또는 예전 파일)도 남아 있으면 True (SECCrawler._is_stored와 같은 기준)"""
+        return bool(row and self.blob_store.exists(row.get("file_path")))
+
+    def discover_batch_window(
+        self,
+        cik_to_ticker: Dict[str, str],
+        now: Optional[datetime] = None,
+        forms: Optional[Iterable[str]] = None,
+    ) -> Tuple[List[Dict], List[date]]:
+        """
+        오전 6시(KST) 배치 구간에 해당하는 날짜들의 신규 공시 탐색
+
+        Returns:
+            (신규 filing_info 리스트, 조회한 날짜 리스트)
+        """
+        window_start, window_end = get_korea_batch_window(now)
+        days = index_dates_for_window(window_start, window_end)
+        return self.discover(cik_to_ticker, days, forms=forms), days
+
+
+def main():
+    """일별 인덱스로 여러 티커의 신규 공시를 한 번에 수집"""
+    from src.sec_crawler import SECCrawler
+
+    parser = argparse.ArgumentParser(description="EDGAR 일별 인덱스 기반 신규 공시 수집")
+    parser.add_argument("--tickers", nargs="+", required=True, help="추적할 티커 목록")
+    parser.add_argument("--index-dir", default=None, help="로컬 인덱스 파일 디렉토리 (테스트용)")
+    parser.add_argument("--kind", default="master", choices=["master", "form"])
+    parser.add_argument("--forms", nargs="*", default=None, help="포함할 양식 (예: 10-K 10-Q 8-K)")
+    args = parser.parse_args()
+
+    db = SECDatabase()
+    crawler = SECCrawler(db=db)
+    results = crawler.crawl_daily_index(
+        args.tickers,
+        db=db,
+        kind=args.kind,
+        index_dir=args.index_dir,
+        forms=args.forms,
+    )
+    print(f"\n📊 신규 공시 {len(results)}건 저장, 통계: {crawler.get_crawl_stats()}")
+
+
+if __name__ == "__main__":
+    main()
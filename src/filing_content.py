@@ -0,0 +1,122 @@
+"""
+공시 본문 지연 로딩 모듈
+정제 텍스트 파일을 mmap으로 열어, 에이전트가 실제로 읽는 구간만 메모리에 올립니다.
+DataFetcher가 dataset["sec_filings"][i]["content"]에 문자열 대신 넣는 핸들로,
+기존 코드의 `content[:2000]`, `if content:` 같은 사용은 그대로 동작합니다.
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+import threading
+from pathlib import Path
+from typing import List, Optional, Union
+
+from src.filing_sections import FilingSectionIndex
+
+
+class FilingContent:
+    """
+    정제 텍스트 파일 핸들 (mmap, 처음 접근할 때 엶)
+
+    길이와 슬라이스 위치는 UTF-8 바이트 기준입니다.
+    (정제 텍스트는 대부분 ASCII라 문자 수와 거의 같고, 잘린 멀티바이트 문자는 버림)
+    """
+
+    def __init__(
+        self,
+        text_path: Union[str, Path],
+        accession_number: Optional[str] = None,
+        sections: Optional[FilingSectionIndex] = None,
+    ):
+        """
+        Args:
+            text_path: 정제 텍스트 파일 경로
+            accession_number: 접수번호 (섹션 조회에 사용)
+            sections: 섹션 인덱스 (None이면 section() 호출 시 생성)
+        """
+        self.text_path = Path(text_path)
+        self.accession_number = accession_number
+        self._sections = sections
+        self._size = self.text_path.stat().st_size
+        self._mm: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __getitem__(self, key: Union[int, slice]) -> str:
+        if not self._size:
+            return "" if isinstance(key, slice) else ""[key]
+        data = self._map()[key]
+        if isinstance(key, int):
+            data = bytes([data])
+        return data.decode("utf-8", errors="ignore")
+
+    def __str__(self) -> str:
+        """문서 전체를 문자열로 (필요한 경우에만 사용)"""
+        return self[:]
+
+    def __repr__(self) -> str:
+        return f"FilingContent({str(self.text_path)!r}, {self._size} bytes)"
+
+    def __getstate__(self):
+        # 복사/직렬화 시 mmap은 넘기지 않고 다시 열도록 함
+        state = self.__dict__.copy()
+        state["_mm"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def section(self, item: str, part: Optional[str] = None, max_bytes: Optional[int] = None) -> Optional[str]:
+        """Item 섹션 텍스트 (filing_sections 인덱스가 없으면 None)"""
+        if not self.accession_number:
+            return None
+        if self._sections is None:
+            self._sections = FilingSectionIndex()
+        return self._sections.get_section(self.accession_number, item, part=part, max_bytes=max_bytes)
+
+    def find(self, query: str, start: int = 0) -> int:
+        """대소문자를 구분해 query의 바이트 위치를 찾음 (없으면 -1)"""
+        if not self._size:
+            return -1
+        return self._map().find(query.encode("utf-8"), start)
+
+    def search(self, query: str, context: int = 300, limit: int = 5) -> List[str]:
+        """
+        query가 나오는 위치 앞뒤 context 바이트씩을 반환 (대소문자 무시)
+        문서 전체를 문자열로 만들지 않고 mmap 위에서 바로 찾습니다.
+        """
+        if not self._size or not query:
+            return []
+        pattern = re.compile(re.escape(query.encode("utf-8")), re.I)
+        mm = self._map()
+        results = []
+        for match in pattern.finditer(mm):
+            start = max(0, match.start() - context)
+            results.append(mm[start:match.end() + context].decode("utf-8", errors="ignore").strip())
+            if len(results) >= limit:
+                break
+        return results
+
+    def close(self) -> None:
+        with self._lock:
+            if self._mm is not None:
+                self._mm.close()
+                self._mm = None
+
+    def _map(self) -> mmap.mmap:
+        # 에이전트들이 스레드 풀에서 같은 핸들을 동시에 읽으므로 최초 열기만 잠금
+        if self._mm is None:
+            with self._lock:
+                if self._mm is None:
+                    with open(self.text_path, "rb") as f:
+                        self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mm
@@ -0,0 +1,115 @@
+"""
+공시 본문 문서 선택 모듈
+index.json의 파일 목록(파일명/size)과 submissions의 primaryDocument를 이용해
+실제 본문 문서를 먼저 받도록 후보 순서를 정합니다.
+XBRL 부속 파일은 제외하고, 크기 상한을 넘는 파일은 건너뛴 기록을 남깁니다.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import PurePosixPath
+from typing import Dict, List, Optional, Tuple
+
+# 본문이 아닌 파일 (XBRL 스키마/링크베이스, 뷰어용 R 파일, 인덱스, 이미지 등)
+_NON_DOCUMENT_RE = re.compile(
+    r"(^FilingSummary\.xml$|^MetaLinks\.json$|^Financial_Report\.xlsx$"
+    r"|\.xsd$|_(cal|def|lab|pre|htm)\.xml$|^R\d+\.(htm|xml)$|-index(-headers)?\.html?$"
+    r"|\.(jpg|jpeg|gif|png|pdf|zip|json|css|js|xlsx)$)",
+    re.I,
+)
+# 첨부(Exhibit) 파일명 패턴 (ex99-1.htm, d123dex991.htm, exhibit21.htm 등)
+_EXHIBIT_RE = re.compile(r"(^|[_\-.])ex\d|dex\d|exhibit", re.I)
+
+_FORMAT_EXTENSIONS = {
+    "xml": (".xml",),
+    "html": (".htm", ".html"),
+    "txt": (".txt",),
+}
+_DOCUMENT_EXTENSIONS = (".xml", ".htm", ".html", ".txt")
+
+
+class PrimaryDocumentSelector:
+    """index.json 항목에서 다운로드할 문서 후보를 우선순위대로 고르는 클래스"""
+
+    MAX_BYTES = int(float(os.getenv("SEC_MAX_DOCUMENT_MB", "20")) * 1_000_000)
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_bytes: 이 크기를 넘는 문서는 받지 않음 (index.json의 size 기준)
+        """
+        self.max_bytes = max_bytes if max_bytes is not None else self.MAX_BYTES
+
+    def select(
+        self,
+        items: List[Dict],
+        accession_number: str,
+        file_format: str = "xml",
+        primary_document: Optional[str] = None,
+    ) -> Tuple[List[str], List[Dict]]:
+        """
+        다운로드 시도 순서를 정합니다.
+
+        1. submissions의 primaryDocument (양식 무관, 실제 본문)
+        2. 본문 후보: 요청 형식(xml/html/txt) 먼저, 그다음 다른 형식
+           (같은 형식 안에서는 첨부 파일은 뒤로, 큰 파일 먼저)
+        3. 전체 제출본 {접수번호}.txt (크기 상한 이내일 때만)
+
+        Args:
+            items: index.json의 directory.item 목록
+            accession_number: 접수번호 (예: "0000320193-24-000001")
+            file_format: 선호 형식 ("xml", "html", "txt")
+            primary_document: submissions의 primaryDocument
+
+        Returns:
+            (파일명 후보 리스트, [{"name", "size", "reason"}] 크기 상한으로 건너뛴 파일 목록)
+        """
+        sizes = {item.get("name", ""): _parse_size(item.get("size")) for item in items}
+        full_submission = f"{accession_number}.txt"
+        candidates: List[str] = []
+        skipped: List[Dict] = []
+
+        def add(name: str) -> None:
+            if not name or name in candidates or any(s["name"] == name for s in skipped):
+                return
+            size = sizes.get(name)
+            if size is not None and self.max_bytes and size > self.max_bytes:
+                skipped.append({"name": name, "size": size, "reason": "size_limit"})
+                return
+            candidates.append(name)
+
+        # 1. primaryDocument: 소유권 공시(Form 4 등)는 "xslF345X05/원본.xml" 형태의 렌더링 경로
+        if primary_document:
+            add(PurePosixPath(primary_document).name)
+
+        # 2. 본문 후보 (요청 형식 우선)
+        preferred = _FORMAT_EXTENSIONS.get(file_format.lower(), (".xml",))
+        documents = []
+        for name, size in sizes.items():
+            lowered = name.lower()
+            if not name or name == full_submission or not lowered.endswith(_DOCUMENT_EXTENSIONS):
+                continue
+            if _NON_DOCUMENT_RE.search(name):
+                continue
+            documents.append((
+                not lowered.endswith(preferred),
+                bool(_EXHIBIT_RE.search(name)),
+                -(size or 0),
+                name,
+            ))
+        for *_, name in sorted(documents):
+            add(name)
+
+        # 3. 전체 제출본 (모든 첨부 포함, 최후 수단)
+        add(full_submission)
+        return candidates, skipped
+
+
+def _parse_size(raw) -> Optional[int]:
+    """index.json의 size는 문자열 (폴더는 빈 문자열)"""
+    try:
+        return int(raw)
+    except (TypeError, ValueError):
+        return None
@@ -0,0 +1,149 @@
+"""
+10-K/10-Q 섹션(Item) 인덱스 모듈
+정제 텍스트에서 "PART II" / "Item 1A." 같은 제목 줄의 위치를 수집 시점에 찾아
+filing_sections 테이블에 바이트 오프셋으로 기록하고,
+에이전트는 해당 구간만 잘라 읽습니다. (문서 전체 스캔/소문자 변환 없음)
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from src.db import SECDatabase
+
+# 섹션 인덱스를 만드는 양식 (정정 공시 포함)
+SECTION_FORMS = ("10-K", "10-KT", "10-Q")
+
+# 줄 맨 앞의 제목만 인정 (본문 중 "see Item 1A" 같은 참조 제외)
+_PART_RE = re.compile(r"^PART\s+(IV|III|II|I)\b[^\n]*", re.I | re.M)
+_ITEM_RE = re.compile(r"^ITEMS?\s+(\d{1,2}[A-C]?)\b[^\n]*", re.I | re.M)
+
+
+def is_section_form(form: Optional[str]) -> bool:
+    """섹션 인덱스 대상 양식인지 (10-K/A 등 정정 공시 포함)"""
+    if not form:
+        return False
+    return form.upper().split("/")[0] in SECTION_FORMS
+
+
+def locate_sections(
+    text: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    by_part: bool = False,
+) -> List[Dict]:
+    """
+    정제 텍스트에서 Item별 구간을 찾습니다.
+
+    목차(TOC)에도 같은 제목이 나오므로, 같은 Item 후보 중
+    다음 제목까지의 거리가 가장 긴 것(실제 본문)을 고릅니다.
+    by_part=True이면 첫 PART 제목 앞의 Item(Part를 알 수 없는 목차 줄)은 버립니다.
+    (PART 제목이 하나도 없는 문서는 Part 없이 그대로 기록)
+
+    Args:
+        text: 정제 텍스트 전체
+        start, end: 탐색할 문서 구간 (문자 오프셋, 본문 문서만 지정할 때 사용)
+        by_part: Part마다 같은 번호의 Item이 따로 있는 경우 True (10-Q)
+
+    Returns:
+        [{"part", "item", "title", "start", "end"}] (정제 텍스트 UTF-8 바이트 오프셋, 시작 위치순)
+    """
+    end = len(text) if end is None else end
+
+    # (위치, 종류, 값, 제목) - 모든 제목 줄이 구간 경계가 됨
+    headings = []
+    for match in _PART_RE.finditer(text, start, end):
+        headings.append((match.start(), "part", match.group(1).upper(), match.group(0)))
+    for match in _ITEM_RE.finditer(text, start, end):
+        headings.append((match.start(), "item", match.group(1).upper(), match.group(0)))
+    headings.sort()
+    if not headings:
+        return []
+
+    has_parts = any(kind == "part" for _, kind, _, _ in headings)
+    best: Dict[object, tuple] = {}
+    part = ""
+    for idx, (pos, kind, value, title) in enumerate(headings):
+        if kind == "part":
+            part = value
+            continue
+        if by_part and has_parts and not part:
+            # 예: 10-Q 목차의 "Item 1A. Risk Factors | 45" → part=''로 남으면 Part 없는 조회가 목차를 반환
+            continue
+        next_pos = headings[idx + 1][0] if idx + 1 < len(headings) else end
+        key = (part, value) if by_part else value
+        if key not in best or next_pos - pos > best[key][1] - best[key][0]:
+            best[key] = (pos, next_pos, part, value, title.strip(" |")[:200])
+
+    ordered = sorted(best.values())
+    to_bytes = _ByteOffsets(text)
+    return [
+        {
+            "part": part,
+            "item": item,
+            "title": title,
+            "start": to_bytes(char_start),
+            "end": to_bytes(char_end),
+        }
+        for char_start, char_end, part, item, title in ordered
+    ]
+
+
+class _ByteOffsets:
+    """문자 오프셋 → UTF-8 바이트 오프셋 변환 (오름차순 호출 시 증분 계산)"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._char = 0
+        self._byte = 0
+
+    def __call__(self, char_offset: int) -> int:
+        if char_offset < self._char:
+            self._char, self._byte = 0, 0
+        self._byte += len(self.text[self._char:char_offset].encode("utf-8"))
+        self._char = char_offset
+        return self._byte
+
+
+class FilingSectionIndex:
+    """filing_sections 테이블을 이용한 섹션 조회"""
+
+    def __init__(self, db: Optional[SECDatabase] = None):
+        self.db = db or SECDatabase()
+
+    def get_section(
+        self,
+        accession_number: str,
+        item: str,
+        part: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Optional[str]:
+        """
+        저장된 오프셋으로 정제 텍스트 파일에서 섹션만 읽습니다.
+
+        Args:
+            accession_number: 접수번호
+            item: "1A", "7" 등
+            part: "I", "II" 등 (10-Q의 Part II Item 1A처럼 구분이 필요할 때)
+            max_bytes: 앞에서부터 읽을 최대 바이트 수
+
+        Returns:
+            섹션 텍스트 또는 None (인덱스/파일 없음)
+        """
+        section = self.db.get_filing_section(accession_number, item, part)
+        if not section:
+            return None
+        text_path = Path(section["text_path"])
+        if not text_path.exists():
+            return None
+
+        length = section["end_offset"] - section["start_offset"]
+        if max_bytes is not None:
+            length = min(length, max_bytes)
+        with open(text_path, "rb") as f:
+            f.seek(section["start_offset"])
+            data = f.read(length)
+        # max_bytes로 멀티바이트 문자 중간이 잘릴 수 있으므로 무시
+        return data.decode("utf-8", errors="ignore").strip()
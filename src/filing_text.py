@@ -0,0 +1,246 @@
+"""
+공시 본문 텍스트 추출 모듈
+다운로드한 XML/HTML/SGML 원문을 수집 시점에 한 번만 정제 텍스트로 변환하여
+파일로 저장합니다. (표는 "셀 | 셀" 형태의 간결한 텍스트로 유지)
+"""
+
+from __future__ import annotations
+
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.blob_store import BlobStore, FileRef
+from src.db import SECDatabase, is_blob_ref
+from src.filing_content import FilingContent
+from src.filing_sections import FilingSectionIndex, is_section_form, locate_sections
+
+# 줄바꿈으로 취급할 블록 태그
+_BLOCK_TAGS = {
+    "p", "div", "br", "tr", "li", "ul", "ol", "table", "section", "article",
+    "h1", "h2", "h3", "h4", "h5", "h6", "title", "center", "hr", "pre", "blockquote",
+}
+# 줄을 나누지 않는 인라인 태그 (그 외 태그는 닫힐 때 줄바꿈 → XML 필드 구분)
+_INLINE_TAGS = {
+    "span", "a", "b", "i", "u", "em", "strong", "font", "small", "big", "sup", "sub",
+    "ix:nonfraction", "ix:nonnumeric", "ix:continuation", "ix:footnote",
+}
+# 내용을 통째로 버릴 태그 (스크립트, 인라인 XBRL 숨김 헤더 등)
+_SKIP_TAGS = {"script", "style", "head", "ix:header"}
+# SGML 전체 제출본에서 본문이 아닌 문서 유형 (이미지, 압축, XBRL 등)
+_SKIP_DOCUMENT_TYPES = ("GRAPHIC", "ZIP", "EXCEL", "PDF", "JSON", "XML", "EX-101")
+
+_DOCUMENT_RE = re.compile(r"<DOCUMENT>(.*?)</DOCUMENT>", re.S | re.I)
+_TEXT_RE = re.compile(r"<TEXT>(.*?)(?:</TEXT>|$)", re.S | re.I)
+_HEADER_FIELD_RE = re.compile(r"<(TYPE|FILENAME|DESCRIPTION)>([^\n<]*)", re.I)
+
+
+class _TextCollector(HTMLParser):
+    """태그를 제거하고 블록/표 구조만 줄바꿈과 구분자로 남기는 파서"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in ("td", "th"):
+            self.parts.append(" | ")
+        elif tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+        if tag in _BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag not in _INLINE_TAGS and tag not in ("td", "th"):
+            self.parts.append("\n")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+def html_to_text(markup: str) -> str:
+    """HTML/XML 마크업을 정규화된 텍스트로 변환"""
+    collector = _TextCollector()
+    collector.feed(markup)
+    collector.close()
+    return normalize_text("".join(collector.parts))
+
+
+def normalize_text(text: str) -> str:
+    """공백/빈 줄을 정리하고 표 구분자 앞뒤를 다듬습니다."""
+    lines = []
+    blank = False
+    for line in text.replace("\xa0", " ").splitlines():
+        line = re.sub(r"[ \t\r\f\v]+", " ", line).strip()
+        line = re.sub(r"(?:\s*\|\s*)+", " | ", line).strip(" |")
+        if not line:
+            if lines and not blank:
+                lines.append("")
+            blank = True
+            continue
+        lines.append(line)
+        blank = False
+    return "\n".join(lines).strip()
+
+
+def extract_filing_text(raw: str) -> Tuple[str, List[Dict]]:
+    """
+    공시 원문을 정제 텍스트로 변환합니다.
+    SGML 전체 제출본(.txt)은 <DOCUMENT>별로 나눠 본문 문서만 추출합니다.
+
+    Returns:
+        (정제 텍스트, [{"type", "filename", "description", "start", "end"}] 문서별 오프셋)
+        오프셋은 정제 텍스트를 UTF-8로 저장한 파일 기준 바이트 위치입니다.
+    """
+    documents = _DOCUMENT_RE.findall(raw)
+    if not documents:
+        text = html_to_text(raw)
+        size = len(text.encode("utf-8"))
+        return text, [{"type": None, "filename": None, "description": None, "start": 0, "end": size}]
+
+    chunks: List[str] = []
+    offsets: List[Dict] = []
+    position = 0
+    for document in documents:
+        header = {key.upper(): value.strip() for key, value in _HEADER_FIELD_RE.findall(document[:2000])}
+        doc_type = header.get("TYPE", "")
+        if doc_type.upper().startswith(_SKIP_DOCUMENT_TYPES):
+            continue
+        match = _TEXT_RE.search(document)
+        body = match.group(1) if match else document
+        if body.lstrip().startswith("begin "):  # uuencode 바이너리
+            continue
+        text = html_to_text(body)
+        if not text:
+            continue
+        if chunks:
+            position += 2  # 문서 사이 빈 줄
+        offsets.append({
+            "type": doc_type or None,
+            "filename": header.get("FILENAME"),
+            "description": header.get("DESCRIPTION"),
+            "start": position,
+            "end": position + len(text.encode("utf-8")),
+        })
+        chunks.append(text)
+        position = offsets[-1]["end"]
+    return "\n\n".join(chunks), offsets
+
+
+class FilingTextStore:
+    """정제 텍스트를 파일로 저장하고 filing_texts 테이블에 기록하는 클래스"""
+
+    SUFFIX = ".clean.txt"
+    # 블롭으로 저장된 원문의 정제 텍스트 위치 (섹션 조회가 seek하므로 압축하지 않음)
+    TEXT_DIR = Path("downloads/sec_texts")
+
+    def __init__(self, db: Optional[SECDatabase] = None, blobs: Optional[BlobStore] = None):
+        self.db = db or SECDatabase()
+        self.blobs = blobs or BlobStore()
+
+    @classmethod
+    def text_path_for(cls, raw_path: FileRef, accession_number: str) -> Path:
+        """정제 텍스트 경로 (블롭 원문은 TEXT_DIR/{접수번호}.clean.txt, 예전 파일은 원문 옆)"""
+        if is_blob_ref(raw_path):
+            return cls.TEXT_DIR / f"{accession_number}{cls.SUFFIX}"
+        raw_path = Path(raw_path)
+        return raw_path.with_name(raw_path.stem + cls.SUFFIX)
+
+    def process(
+        self,
+        accession_number: str,
+        raw_path: FileRef,
+        form: Optional[str] = None,
+    ) -> Optional[Dict]:
+        """
+        원문 파일 하나를 정제 텍스트로 변환하여 저장합니다.
+        10-K/10-Q는 본문 문서의 Item별 섹션 위치도 함께 기록합니다.
+
+        Args:
+            accession_number: 접수번호
+            raw_path: 원문 블롭 참조 ("blob:<sha256>") 또는 다운로드한 원문 파일
+            form: 공시 양식 (None이면 SGML 문서 유형으로 판단)
+
+        Returns:
+            filing_texts 레코드 딕셔너리 또는 None (원문이 없거나 실패)
+        """
+        if not self.blobs.exists(raw_path):
+            return None
+        try:
+            data = self.blobs.read_bytes(raw_path)
+            text, documents = extract_filing_text(data.decode("utf-8", errors="ignore"))
+            encoded = text.encode("utf-8")
+            text_path = self.text_path_for(raw_path, accession_number)
+            text_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = text_path.with_name(text_path.name + ".tmp")
+            tmp_path.write_bytes(encoded)
+            tmp_path.replace(text_path)
+        except Exception as e:
+            print(f"텍스트 추출 실패 ({raw_path}): {e}")
+            return None
+
+        record = {
+            "accession_number": accession_number,
+            "text_path": str(text_path),
+            "text_length": len(encoded),  # 바이트 단위
+            "raw_size": len(data),
+            "documents": documents,
+        }
+        self.db.save_filing_text(**record)
+        self._index_sections(accession_number, text, encoded, documents, form)
+        self.db.index_filing_text(accession_number, text)
+        return record
+
+    def _index_sections(
+        self,
+        accession_number: str,
+        text: str,
+        encoded: bytes,
+        documents: List[Dict],
+        form: Optional[str],
+    ) -> None:
+        """본문 문서(첫 번째 문서) 구간에서 Item 섹션을 찾아 저장"""
+        main = documents[0] if documents else None
+        form = form or (main or {}).get("type")
+        if not main or not is_section_form(form):
+            return
+        # 바이트 오프셋 → 문자 오프셋 (본문 문서 범위만 탐색)
+        char_start = len(encoded[:main["start"]].decode("utf-8"))
+        char_end = char_start + len(encoded[main["start"]:main["end"]].decode("utf-8"))
+        # 10-Q는 Part I/II에 같은 번호의 Item이 있으므로 Part별로 구분
+        by_part = form.upper().startswith("10-Q")
+        sections = locate_sections(text, char_start, char_end, by_part=by_part)
+        self.db.save_filing_sections(accession_number, sections)
+
+    def open_content(self, meta: Dict, text_record: Optional[Dict] = None) -> Optional[FilingContent]:
+        """
+        공시 레코드의 정제 텍스트를 지연 로딩 핸들(mmap)로 엽니다.
+        아직 추출되지 않았으면 지금 추출해 저장합니다 (기존 데이터 백필).
+        """
+        text_path = Path(text_record["text_path"]) if text_record else None
+        if not text_path or not text_path.exists():
+            raw_ref = meta.get("file_path")
+            record = self.process(meta["accession_number"], raw_ref, meta.get("form")) if raw_ref else None
+            if not record:
+                return None
+            text_path = Path(record["text_path"])
+        return FilingContent(text_path, meta["accession_number"], FilingSectionIndex(self.db))
+
+    def load_text(self, meta: Dict, text_record: Optional[Dict] = None) -> Optional[str]:
+        """공시 레코드의 정제 텍스트 전체를 문자열로 읽습니다 (open_content 참고)."""
+        content = self.open_content(meta, text_record)
+        if content is None:
+            return None
+        try:
+            return str(content)
+        finally:
+            content.close()
@@ -7,15 +7,21 @@ XML 파일은 나중에 파싱하여 LLM에 적합한 형식(마크다운 테이
 """
 
 import os
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Tuple, List
+from typing import Dict, Optional, Set, Tuple, List
 
-import requests
 from dotenv import load_dotenv
 
+from src.blob_store import BlobStore, FileRef
+from src.cik_resolver import CIKResolver
 from src.db import SECDatabase
-from src.time_utils import KST, parse_iso_datetime, get_last_24h_window
+from src.edgar_index import DailyIndexDiscovery
+from src.filing_documents import PrimaryDocumentSelector
+from src.filing_text import FilingTextStore
+from src.sec_http import DownloadPool, RateLimitedSession
+from src.sec_submissions import SubmissionsCache, SubmissionsSnapshot
+from src.time_utils import KST, get_last_24h_window
 
 # .env 환경변수 로드
 load_dotenv()
@@ -28,15 +34,33 @@ class SECCrawler:
     USER_AGENT = "ehddus416@korea.ac.kr"  # SEC 요구사항: 본인 정보로 변경 필요
     WINDOW_DAYS = int(os.getenv("SEC_CRAWLER_WINDOW_DAYS", "90"))
     
-    def __init__(self, user_agent: Optional[str] = None):
+    def __init__(self, user_agent: Optional[str] = None, db: Optional[SECDatabase] = None):
         """
         Args:
             user_agent: SEC API 사용 시 필요한 User-Agent (본인/회사 정보)
+            db: CIK 매핑 캐시 등에 사용할 데이터베이스 (None이면 필요할 때 기본 DB 생성)
         """
         self.user_agent = user_agent or self.USER_AGENT
         self.window_days = self.WINDOW_DAYS
-        self.session = requests.Session()
+        # 전역 토큰 버킷(초당 10회) + 타임아웃 + 429/503 재시도가 적용된 세션
+        self.download_pool = DownloadPool()
+        self.session = RateLimitedSession(pool_size=max(10, self.download_pool.max_workers))
         self.session.headers.update({"User-Agent": self.user_agent})
+        self.db = db
+        self._cik_resolver: Optional[CIKResolver] = None
+        self._submissions_cache: Optional[SubmissionsCache] = None
+        self._crawl_stats: Dict[str, int] = {"downloaded": 0, "skipped_existing": 0, "failed": 0}
+        self._file_hashes: Dict[str, str] = {}  # 다운로드 경로 → SHA-256
+        self.document_selector = PrimaryDocumentSelector()
+        self._skipped_documents: List[Dict] = []  # 크기 상한으로 받지 않은 파일
+        self.blob_store = BlobStore()  # 저장한 원문은 SHA-256 내용 주소 gzip 블롭으로 보관
+
+    @property
+    def cik_resolver(self) -> CIKResolver:
+        """티커 → CIK 캐시 (최초 사용 시 생성)"""
+        if self._cik_resolver is None:
+            self._cik_resolver = CIKResolver(self.session, db=self.db)
+        return self._cik_resolver
     
     def get_cik_from_ticker(self, ticker: str) -> Optional[str]:
         """
@@ -49,129 +73,78 @@ class SECCrawler:
             CIK 번호 (문자열) 또는 None
         """
         try:
-            url = f"{self.BASE_URL}/files/company_tickers.json"
-            response = self.session.get(url) # HTTP GET 요청(지정된 URL로 GET 요청)
-            response.raise_for_status() # error check
-            
-            companies = response.json() # json으로 parsing
-            
-            # 티커로 CIK 찾기 (대소문자 무시)
-            ticker_upper = ticker.upper()
-            for entry in companies.values():
-                if entry.get("ticker", "").upper() == ticker_upper:
-                    cik = str(entry["cik_str"]).zfill(10)  # CIK는 10자리로 패딩
-                    print(f"티커 {ticker}의 CIK: {cik}")
-                    return cik
-            
+            cik = self.cik_resolver.resolve(ticker)
+        except Exception as e:
+            print(f"CIK 조회 중 오류 발생: {e}")
+            return None
+
+        if not cik:
             print(f"티커 {ticker}에 해당하는 CIK를 찾을 수 없습니다.")
             return None
-            
+        print(f"티커 {ticker}의 CIK: {cik}")
+        return cik
+
+    def get_ciks_from_tickers(self, tickers: List[str]) -> Dict[str, Optional[str]]:
+        """
+        여러 티커의 CIK를 한 번에 조회 (배치 크롤링용)
+
+        Returns:
+            {티커(대문자): CIK 또는 None}
+        """
+        try:
+            return self.cik_resolver.resolve_many(tickers)
         except Exception as e:
             print(f"CIK 조회 중 오류 발생: {e}")
-            return None
+            return {t.upper(): None for t in tickers}
     
-    def get_filings_in_window(self, cik: str, only_today: bool = False) -> List[Dict]:
+    @property
+    def submissions_cache(self) -> SubmissionsCache:
+        """CIK별 submissions JSON 디스크 캐시 (최초 사용 시 생성)"""
+        if self._submissions_cache is None:
+            self._submissions_cache = SubmissionsCache(self.session, db=self.db)
+        return self._submissions_cache
+
+    def get_submissions(self, cik: str) -> Optional[SubmissionsSnapshot]:
+        """
+        CIK의 submissions 스냅샷 조회 (조건부 GET + 디스크 캐시)
+
+        Args:
+            cik: CIK 번호
+
+        Returns:
+            SubmissionsSnapshot 또는 None
+        """
+        return self.submissions_cache.load(cik)
+
+    def get_http_metrics(self) -> Dict:
+        """이 크롤러 세션의 요청 수 / 재시도 / 전송량 / 처리량 지표"""
+        return self.session.metrics.snapshot()
+
+    def get_filings_in_window(
+        self,
+        cik: str,
+        only_today: bool = False,
+        snapshot: Optional[SubmissionsSnapshot] = None,
+    ) -> List[Dict]:
         """
         CIK로부터 기간 내 모든 공시 정보를 조회합니다.
         
         Args:
             cik: CIK 번호
             only_today: True면 현재 시각 기준 직전 24시간 내 공시만 반환
+            snapshot: 이미 받아둔 submissions 스냅샷 (None이면 새로 조회)
             
         Returns:
             공시 정보 딕셔너리 리스트
         """
         try:
-            # SEC EDGAR submissions JSON API 사용
-            cik_padded = cik.zfill(10)  # CIK는 10자리로 패딩
-            submissions_json_url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
-            response = self.session.get(submissions_json_url)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # submissions.json 구조 확인
             # recent : 해당 CIK의 가장 최근 제출된 공시 목록을 의미 -> 40개 내외의 최신 공시가 포함됨
-            if "filings" in data and "recent" in data["filings"]:
-                recent = data["filings"]["recent"]
-                
-                if recent and len(recent["form"]) > 0:
-                    filings = []
-                    if only_today:
-                        if os.getenv("SEC_CRAWLER_WINDOW_DAYS"):
-                            window_end = datetime.now(KST)
-                            window_start = window_end - timedelta(days=self.window_days)
-                        else:
-                            window_start, window_end = get_last_24h_window()
-                        
-                        for idx in range(len(recent["form"])):
-                            acceptance_dt_str = None
-                            acc_kst = None
-                            if recent.get("acceptanceDateTime") and len(recent["acceptanceDateTime"]) > idx:
-                                acceptance_dt_str = recent["acceptanceDateTime"][idx]
-                                if acceptance_dt_str:
-                                    acc_dt = parse_iso_datetime(acceptance_dt_str)
-                                    if acc_dt:
-                                        if acc_dt.tzinfo is None:
-                                            acc_dt = acc_dt.replace(tzinfo=timezone.utc)
-                                        acc_kst = acc_dt.astimezone(KST)
-                            filed_date = recent["filingDate"][idx]
-                            candidate_dt = acc_kst or self._parse_filed_date(filed_date)
-                            if not candidate_dt:
-                                continue
-                            if not (window_start <= candidate_dt < window_end):
-                                continue
-                            acceptance_date = (acc_kst or candidate_dt).date().isoformat()
-                            
-                            reporting_for = (
-                                recent["reportDate"][idx]
-                                if recent.get("reportDate")
-                                and len(recent["reportDate"]) > idx
-                                else None
-                            )
-                            filing_info = {
-                                "form": recent["form"][idx],
-                                "filed": filed_date,
-                                "filed_date": filed_date,
-                                "reporting_for": reporting_for,
-                                "filing_entity": data.get("name", ""),
-                                "accession_number": recent["accessionNumber"][idx],
-                                "acceptance_datetime": acceptance_dt_str or filed_date,
-                                "acceptance_date": acceptance_date,
-                                "cik": cik
-                            }
-                            filings.append(filing_info)
-                        
-                        return filings
-                    else:
-                        latest_idx = 0
-                        filed_date = recent["filingDate"][latest_idx]
-                        reporting_for = (
-                            recent["reportDate"][latest_idx]
-                            if recent.get("reportDate") and len(recent["reportDate"]) > latest_idx
-                            else None
-                        )
-                        filing_info = {
-                            "form": recent["form"][latest_idx],
-                            "filed": filed_date,
-                            "filed_date": filed_date,
-                            "reporting_for": reporting_for,
-                            "filing_entity": data.get("name", ""),
-                            "accession_number": recent["accessionNumber"][latest_idx],
-                            "cik": cik
-                        }
-                        if recent.get("acceptanceDateTime") and len(recent["acceptanceDateTime"]) > latest_idx:
-                            acceptance_dt_str = recent["acceptanceDateTime"][latest_idx]
-                            if acceptance_dt_str:
-                                acc_dt = parse_iso_datetime(acceptance_dt_str)
-                                if acc_dt:
-                                    if acc_dt.tzinfo is None:
-                                        acc_dt = acc_dt.replace(tzinfo=timezone.utc)
-                                    acc_kst = acc_dt.astimezone(KST)
-                                    acceptance_date = acc_kst.date().isoformat()
-                                    filing_info["acceptance_datetime"] = acceptance_dt_str
-                                    filing_info["acceptance_date"] = acceptance_date
-                        return [filing_info]
+            snapshot = snapshot or self.get_submissions(cik)
+            if snapshot and len(snapshot) > 0:
+                if only_today:
+                    window_start, window_end = self._get_crawl_window()
+                    return snapshot.filings_in_window(window_start, window_end)
+                return [snapshot.filing_info(0)]
             
             print("해당 조건에 맞는 공시를 찾을 수 없습니다.")
             return []
@@ -180,37 +153,39 @@ class SECCrawler:
             print(f"공시 조회 중 오류 발생: {e}")
             return []
 
-    def _parse_filed_date(self, filed_str: Optional[str]) -> Optional[datetime]:
-        if not filed_str:
-            return None
-        try:
-            dt = datetime.fromisoformat(filed_str)
-        except ValueError:
-            return None
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=KST)
-        else:
-            dt = dt.astimezone(KST)
-        return dt
+    def _get_crawl_window(self) -> Tuple[datetime, datetime]:
+        if os.getenv("SEC_CRAWLER_WINDOW_DAYS"):
+            window_end = datetime.now(KST)
+            window_start = window_end - timedelta(days=self.window_days)
+            return window_start, window_end
+        return get_last_24h_window()
 
     def get_latest_filing(self, cik: str, only_today: bool = False) -> Optional[Dict]:
         filings = self.get_filings_in_window(cik, only_today)
         return filings[0] if filings else None
     
-    def download_filing_file(self, cik: str, accession_number: str, form: str, file_format: str = "xml") -> Optional[Path]:
+    def download_filing_file(
+        self,
+        cik: str,
+        accession_number: str,
+        form: str,
+        file_format: str = "xml",
+        primary_document: Optional[str] = None,
+    ) -> Optional[Path]:
         """
         공시 문서 파일을 다운로드합니다.
         
-        표가 많은 공시자료의 경우 XML 형식이 표 구조를 가장 잘 보존합니다.
-        - XML: 표 구조 완벽 보존, 파싱 후 LLM에 적합한 형식으로 변환 가능 (권장)
-        - HTML: 표 구조 보존되지만 태그 노이즈 많음
-        - TXT: 표 구조가 깨질 수 있음
+        submissions의 primaryDocument(실제 본문)를 먼저 받고, 없으면 index.json의
+        파일 목록에서 본문 후보를 고릅니다. XBRL 부속 파일(FilingSummary.xml, 스키마 등)은
+        제외하고, 크기 상한(SEC_MAX_DOCUMENT_MB)을 넘는 파일은 건너뛴 기록만 남깁니다.
+        전체 제출본({접수번호}.txt)은 최후 수단입니다.
         
         Args:
             cik: CIK 번호
             accession_number: 접수 번호 (예: "0000320193-24-000001")
             form: 공시 양식 (예: "10-K")
-            file_format: 다운로드할 파일 형식 ("xml", "html", "txt")
+            file_format: 본문 후보 중 선호할 파일 형식 ("xml", "html", "txt")
+            primary_document: submissions의 primaryDocument (없으면 index.json으로 판단)
             
         Returns:
             다운로드된 파일 경로 또는 None
@@ -219,63 +194,44 @@ class SECCrawler:
             # accession number에서 하이픈 제거
             accession_no_dash = accession_number.replace("-", "")
             
-            # index.json에서 사용 가능한 파일 목록 확인
+            # index.json에서 사용 가능한 파일 목록(파일명/크기) 확인
             index_url = f"{self.BASE_URL}/Archives/edgar/data/{cik}/{accession_no_dash}/index.json"
             response = self.session.get(index_url)
             response.raise_for_status()
+            items = response.json().get("directory", {}).get("item", [])
             
-            index_data = response.json()
-            
-            # 파일 형식별 우선순위 설정
-            if file_format.lower() == "xml":
-                # XML 우선: 표 구조를 가장 잘 보존
-                file_priorities = [
-                    f"{form}.xml",  # 순수 XML 파일 (가장 좋음)
-                    f"{accession_no_dash}.txt",  # 전체 문서 (XML 인코딩된 텍스트)
-                ]
-                # index.json에서 XML 파일 찾기
-                if "directory" in index_data:
-                    for item in index_data["directory"]["item"]:
-                        if item.get("name", "").endswith(".xml"):
-                            file_priorities.insert(0, item["name"])
-                            break
-            elif file_format.lower() == "html":
-                file_priorities = [
-                    f"{form}.htm",
-                    f"{form}.html",
-                ]
-                if "directory" in index_data:
-                    for item in index_data["directory"]["item"]:
-                        if item.get("name", "").endswith((".htm", ".html")):
-                            file_priorities.insert(0, item["name"])
-                            break
-            else:  # txt
-                file_priorities = [
-                    f"{accession_no_dash}.txt",
-                ]
+            file_priorities, skipped = self.document_selector.select(
+                items, accession_number, file_format, primary_document
+            )
+            for entry in skipped:
+                self._skipped_documents.append({
+                    "cik": cik,
+                    "accession_number": accession_number,
+                    "form": form,
+                    **entry,
+                })
             
-            # 파일 다운로드 시도
+            # 파일 다운로드 시도 (청크 스트리밍 + SHA-256 계산)
+            download_dir = Path("downloads/sec_filings")
+            download_dir.mkdir(parents=True, exist_ok=True)
             downloaded_file = None
             for filename in file_priorities:
                 try:
                     file_url = f"{self.BASE_URL}/Archives/edgar/data/{cik}/{accession_no_dash}/{filename}"
-                    response = self.session.get(file_url)
-                    if response.status_code == 200:
-                        # 파일 저장
-                        download_dir = Path("downloads/sec_filings")
-                        download_dir.mkdir(parents=True, exist_ok=True)
-                        
-                        file_path = download_dir / f"{cik}_{accession_no_dash}_{filename}"
-                        file_path.write_bytes(response.content)
-                        
-                        print(f"파일 다운로드 완료: {file_path} ({file_format.upper()} 형식)")
+                    file_path = download_dir / f"{cik}_{accession_no_dash}_{filename}"
+                    sha256 = self.session.download(file_url, file_path)
+                    if sha256:
+                        self._file_hashes[str(file_path)] = sha256
+                        print(f"파일 다운로드 완료: {file_path}")
                         downloaded_file = file_path
                         break
                 except Exception as e:
                     continue
             
             if not downloaded_file:
-                print(f"{file_format.upper()} 파일을 다운로드할 수 없습니다.")
+                print(f"{form} 본문 문서를 다운로드할 수 없습니다. ({accession_number})")
+                for entry in skipped:
+                    print(f"   ⏭️  크기 상한 초과로 건너뜀: {entry['name']} ({entry['size'] / 1_000_000:.1f}MB)")
                 return None
             
             return downloaded_file
@@ -292,47 +248,102 @@ class SECCrawler:
         db: Optional[SECDatabase] = None,
         only_today: bool = True,
         include_annual_quarterly: bool = True  # 10-K, 10-Q 항상 포함
-    ) -> List[Tuple[Dict, Path]]:
-        filings: List[Tuple[Dict, Path]] = []
+    ) -> List[Tuple[Dict, FileRef]]:
+        filings: List[Tuple[Dict, FileRef]] = []
 
         cik = self.get_cik_from_ticker(ticker)
         if not cik:
             return filings
 
-        filing_infos = self.get_filings_in_window(cik, only_today=only_today)
-        if not filing_infos:
+        # submissions JSON은 크롤링당 한 번만 받아 10-K/10-Q 조회에도 재사용
+        snapshot = self.get_submissions(cik)
+        if not snapshot:
             return filings
 
-        for filing_info in filing_infos:
-            file_path = self.download_filing_file(
+        database = self._resolve_db(db, save_to_db)
+        state = database.get_sec_fetch_state(cik) if database else None
+
+        # 지난 크롤링을 끝까지 처리한 이후 submissions가 바뀌지 않았으면(304 + 동일 ETag) 기간 내 순회 생략
+        # (10-K/10-Q는 예전 것이 지워졌을 수 있으므로 아래에서 계속 확인)
+        unchanged = bool(
+            state
+            and state.get("last_success_run")
+            and snapshot.not_modified
+            and state.get("submissions_etag") == snapshot.etag
+        )
+
+        # high-water mark 이전 공시는 이미 처리했으므로 그 지점에서 순회 중단
+        stop = None
+        if only_today and state:
+            stop = snapshot.count_newer_than(
+                state.get("last_acceptance_datetime"),
+                state.get("last_accession_number"),
+            )
+        if unchanged:
+            print(f"⏭️  [{ticker}] submissions 변경 없음 (ETag 동일) - 기간 내 공시 순회 생략")
+            filing_infos = []
+        elif stop is not None:
+            window_start, window_end = self._get_crawl_window()
+            filing_infos = snapshot.filings_in_window(window_start, window_end, stop=stop)
+        else:
+            filing_infos = self.get_filings_in_window(cik, only_today=only_today, snapshot=snapshot)
+        failed_before = self._crawl_stats["failed"]
+
+        # 이미 저장된 접수번호는 한 번의 쿼리로 확인하여 다운로드 전에 제외
+        known = database.get_filings_by_accessions(snapshot.accession_set) if database else {}
+        to_download = [info for info in filing_infos if not self._is_stored(known, info)]
+
+        # 다운로드는 워커 풀에서 병렬로, DB 저장은 순서대로
+        file_paths = self.download_pool.map(
+            lambda info: self.download_filing_file(
                 cik=cik,
-                accession_number=filing_info["accession_number"],
-                form=filing_info["form"],
+                accession_number=info["accession_number"],
+                form=info["form"],
                 file_format=file_format,
-            )
+                primary_document=info.get("primary_document"),
+            ),
+            to_download,
+        )
+        downloaded = {
+            info["accession_number"]: file_path
+            for info, file_path in zip(to_download, file_paths)
+        }
+
+        pending: List[Tuple[Dict, Path]] = []
+        for filing_info in filing_infos:
+            accession_number = filing_info["accession_number"]
+            if accession_number not in downloaded:
+                self._crawl_stats["skipped_existing"] += 1
+                filings.append((filing_info, known[accession_number]["file_path"]))
+                continue
+
+            file_path = downloaded[accession_number]
             if not file_path:
+                self._crawl_stats["failed"] += 1
                 continue
+            self._crawl_stats["downloaded"] += 1
 
             if save_to_db:
-                try:
-                    metadata = {
-                        "ticker": ticker.upper(),
-                        "acceptance_date": filing_info.get("acceptance_date"),
-                        "accession_number": filing_info.get("accession_number"),
-                        "cik": cik,
-                        "form": filing_info.get("form"),
-                        "filed_date": filing_info.get("filed_date") or filing_info.get("filed"),
-                        "reporting_for": filing_info.get("reporting_for"),
-                        "file_format": file_format,
-                        "filing_entity": filing_info.get("filing_entity", ""),
-                    }
-                    database = db or SECDatabase()
-                    database.save_filing(ticker, metadata, file_path)
-                except Exception as e:
-                    print(f"❌ 로컬 DB 저장 실패: {e}")
+                metadata = {
+                    "ticker": ticker.upper(),
+                    "acceptance_date": filing_info.get("acceptance_date"),
+                    "accession_number": filing_info.get("accession_number"),
+                    "cik": cik,
+                    "form": filing_info.get("form"),
+                    "filed_date": filing_info.get("filed_date") or filing_info.get("filed"),
+                    "reporting_for": filing_info.get("reporting_for"),
+                    "file_format": file_format,
+                    "filing_entity": filing_info.get("filing_entity", ""),
+                    "sha256": self._file_hashes.get(str(file_path)),
+                }
+                pending.append((metadata, file_path))
 
             filings.append((filing_info, file_path))
 
+        # 새로 받은 공시는 블롭으로 옮겨 한 트랜잭션으로 저장
+        refs = self._store_filings(database, pending)
+        filings = [(info, refs.get(info["accession_number"], path)) for info, path in filings]
+
         # 10-K, 10-Q 항상 포함 (기간 외 최신 것도)
         if include_annual_quarterly:
             existing_accessions = {f[0].get("accession_number") for f in filings}
@@ -340,7 +351,10 @@ class SECCrawler:
                 ticker=ticker,
                 file_format=file_format,
                 save_to_db=save_to_db,
-                db=db
+                db=database,
+                snapshot=snapshot,
+                skip_accessions=existing_accessions,
+                known_filings=known,
             )
             for form_type in ['10-K', '10-Q']:
                 if annual_quarterly.get(form_type):
@@ -348,6 +362,26 @@ class SECCrawler:
                     if filing_info.get("accession_number") not in existing_accessions:
                         filings.insert(0, (filing_info, file_path))
 
+        # 기간 내 공시를 실패 없이 처리했을 때만 high-water mark 전진 (실패한 공시는 다음 실행에서 재시도)
+        # only_today=False는 최신 1건만 보므로 마크를 옮기면 그보다 오래된 기간 내 공시를 건너뛰게 됨
+        if (
+            database
+            and save_to_db
+            and only_today
+            and not unchanged
+            and self._crawl_stats["failed"] == failed_before
+        ):
+            # recent는 최신순이므로 첫 항목이 실제로 처리한 가장 최신 공시 (없으면 기존 마크 유지)
+            newest = filing_infos[0] if filing_infos else {}
+            database.update_sec_fetch_state(
+                cik,
+                ticker=ticker,
+                last_acceptance_datetime=newest.get("acceptance_datetime") or None,
+                last_accession_number=newest.get("accession_number"),
+                submissions_etag=snapshot.etag,
+                last_success_run=datetime.now(KST),
+            )
+
         return filings
 
     def crawl_latest_annual_quarterly(
@@ -355,86 +389,233 @@ class SECCrawler:
         ticker: str,
         file_format: str = "xml",
         save_to_db: bool = True,
-        db: Optional[SECDatabase] = None
-    ) -> Dict[str, Optional[Tuple[Dict, Path]]]:
+        db: Optional[SECDatabase] = None,
+        snapshot: Optional[SubmissionsSnapshot] = None,
+        skip_accessions: Optional[Set[str]] = None,
+        known_filings: Optional[Dict[str, Dict]] = None,
+    ) -> Dict[str, Optional[Tuple[Dict, FileRef]]]:
         """
         가장 최근 10-K (연간보고서)와 10-Q (분기보고서)를 크롤링
         기간과 관계없이 가장 최신 것을 가져옴
         
+        Args:
+            snapshot: 이미 받아둔 submissions 스냅샷 (None이면 새로 조회)
+            skip_accessions: 이미 처리한 접수번호 (다시 다운로드하지 않음)
+            known_filings: DB에 저장된 공시 {접수번호: 레코드} (None이면 새로 조회)
+        
         Returns:
             {'10-K': (filing_info, file_path) or None, '10-Q': (filing_info, file_path) or None}
         """
         result = {'10-K': None, '10-Q': None}
+        skip_accessions = skip_accessions or set()
         
         cik = self.get_cik_from_ticker(ticker)
         if not cik:
             return result
         
         try:
-            # SEC EDGAR submissions JSON API 사용
-            cik_padded = cik.zfill(10)
-            submissions_json_url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
-            response = self.session.get(submissions_json_url)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if "filings" not in data or "recent" not in data["filings"]:
+            snapshot = snapshot or self.get_submissions(cik)
+            if not snapshot:
                 return result
             
-            recent = data["filings"]["recent"]
-            
             # 10-K, 10-Q 각각 가장 최근 것 찾기
+            targets = []
             for target_form in ['10-K', '10-Q']:
-                for idx in range(len(recent["form"])):
-                    if recent["form"][idx] == target_form:
-                        filing_info = {
-                            "form": recent["form"][idx],
-                            "filed": recent["filingDate"][idx],
-                            "filed_date": recent["filingDate"][idx],
-                            "reporting_for": recent["reportDate"][idx] if recent.get("reportDate") and len(recent["reportDate"]) > idx else None,
-                            "filing_entity": data.get("name", ""),
-                            "accession_number": recent["accessionNumber"][idx],
-                            "cik": cik
-                        }
-                        
-                        # 파일 다운로드
-                        file_path = self.download_filing_file(
-                            cik=cik,
-                            accession_number=filing_info["accession_number"],
-                            form=target_form,
-                            file_format=file_format,
-                        )
-                        
-                        if file_path:
-                            if save_to_db:
-                                try:
-                                    metadata = {
-                                        "ticker": ticker.upper(),
-                                        "acceptance_date": filing_info.get("filed_date"),
-                                        "accession_number": filing_info.get("accession_number"),
-                                        "cik": cik,
-                                        "form": filing_info.get("form"),
-                                        "filed_date": filing_info.get("filed_date"),
-                                        "reporting_for": filing_info.get("reporting_for"),
-                                        "file_format": file_format,
-                                        "filing_entity": filing_info.get("filing_entity", ""),
-                                    }
-                                    database = db or SECDatabase()
-                                    database.save_filing(ticker, metadata, file_path)
-                                    print(f"✅ [{ticker}] {target_form} ({filing_info['filed_date']}) 저장 완료")
-                                except Exception as e:
-                                    print(f"❌ [{ticker}] {target_form} DB 저장 실패: {e}")
-                            
-                            result[target_form] = (filing_info, file_path)
-                        break  # 가장 최근 것 하나만
+                filing_info = snapshot.latest_by_form(target_form)
+                if filing_info and filing_info["accession_number"] not in skip_accessions:
+                    targets.append((target_form, filing_info))
+            
+            database = self._resolve_db(db, save_to_db)
+            if known_filings is None:
+                known_filings = database.get_filings_by_accessions(
+                    [info["accession_number"] for _, info in targets]
+                ) if database else {}
             
+            # 이미 저장된 공시는 다운로드하지 않고 기존 파일 사용
+            to_download = []
+            for target_form, filing_info in targets:
+                if self._is_stored(known_filings, filing_info):
+                    self._crawl_stats["skipped_existing"] += 1
+                    stored_ref = known_filings[filing_info["accession_number"]]["file_path"]
+                    result[target_form] = (filing_info, stored_ref)
+                else:
+                    to_download.append((target_form, filing_info))
+            
+            # 파일 다운로드 (병렬)
+            file_paths = self.download_pool.map(
+                lambda target: self.download_filing_file(
+                    cik=cik,
+                    accession_number=target[1]["accession_number"],
+                    form=target[0],
+                    file_format=file_format,
+                    primary_document=target[1].get("primary_document"),
+                ),
+                to_download,
+            )
+            
+            pending: List[Tuple[Dict, Path]] = []
+            for (target_form, filing_info), file_path in zip(to_download, file_paths):
+                if not file_path:
+                    self._crawl_stats["failed"] += 1
+                    continue
+                self._crawl_stats["downloaded"] += 1
+                
+                if save_to_db:
+                    metadata = {
+                        "ticker": ticker.upper(),
+                        "acceptance_date": filing_info.get("filed_date"),
+                        "accession_number": filing_info.get("accession_number"),
+                        "cik": cik,
+                        "form": filing_info.get("form"),
+                        "filed_date": filing_info.get("filed_date"),
+                        "reporting_for": filing_info.get("reporting_for"),
+                        "file_format": file_format,
+                        "filing_entity": filing_info.get("filing_entity", ""),
+                        "sha256": self._file_hashes.get(str(file_path)),
+                    }
+                    pending.append((metadata, file_path))
+                print(f"✅ [{ticker}] {target_form} ({filing_info['filed_date']}) 다운로드 완료")
+                
+                result[target_form] = (filing_info, file_path)
+            
+            refs = self._store_filings(database, pending)
+            for target_form, entry in result.items():
+                if entry:
+                    result[target_form] = (entry[0], refs.get(entry[0]["accession_number"], entry[1]))
             return result
             
         except Exception as e:
             print(f"10-K/10-Q 크롤링 중 오류: {e}")
             return result
 
+    def crawl_daily_index(
+        self,
+        tickers: List[str],
+        file_format: str = "xml",
+        db: Optional[SECDatabase] = None,
+        now: Optional[datetime] = None,
+        kind: str = "master",
+        index_dir: Optional[str] = None,
+        forms: Optional[List[str]] = None,
+    ) -> List[Tuple[Dict, FileRef]]:
+        """
+        EDGAR 일별 인덱스로 여러 티커의 신규 공시를 한 번에 수집
+        CIK별 submissions 요청 없이 날짜당 인덱스 파일 1개만 요청합니다.
+        
+        Args:
+            tickers: 추적할 티커 목록
+            now: 배치 기준 시각 (None이면 현재, 오전 6시 KST 배치 구간 사용)
+            kind: 인덱스 종류 ("master" 또는 "form")
+            index_dir: 로컬 인덱스 파일 디렉토리 (테스트용 fixture)
+            forms: 포함할 양식 (None이면 전체)
+            
+        Returns:
+            [(filing_info, file_path)] 새로 저장된 공시 목록
+        """
+        database = self._resolve_db(db, save_to_db=True)
+        ciks = self.get_ciks_from_tickers(tickers)
+        cik_to_ticker = {cik: ticker for ticker, cik in ciks.items() if cik}
+        if not cik_to_ticker:
+            return []
+
+        discovery = DailyIndexDiscovery(
+            session=self.session,
+            db=database,
+            kind=kind,
+            index_dir=index_dir,
+            blob_store=self.blob_store,
+        )
+        new_filings, days = discovery.discover_batch_window(cik_to_ticker, now=now, forms=forms)
+        print(f"📇 일별 인덱스 {len(days)}일치 조회: 신규 공시 {len(new_filings)}건")
+
+        file_paths = self.download_pool.map(
+            lambda info: self.download_filing_file(
+                cik=info["cik"],
+                accession_number=info["accession_number"],
+                form=info["form"],
+                file_format=file_format,
+            ),
+            new_filings,
+        )
+
+        results: List[Tuple[Dict, FileRef]] = []
+        pending: List[Tuple[Dict, Path]] = []
+        for filing_info, file_path in zip(new_filings, file_paths):
+            if not file_path:
+                self._crawl_stats["failed"] += 1
+                continue
+            self._crawl_stats["downloaded"] += 1
+            metadata = {
+                **filing_info,
+                "file_format": file_format,
+                "sha256": self._file_hashes.get(str(file_path)),
+            }
+            pending.append((metadata, file_path))
+            results.append((filing_info, file_path))
+
+        refs = self._store_filings(database, pending)
+        return [(info, refs.get(info["accession_number"], path)) for info, path in results]
+
+    def get_crawl_stats(self) -> Dict[str, int]:
+        """다운로드 / 기존 공시 스킵 / 실패 / 크기 상한 스킵 건수 (크롤러 생성 이후 누적)"""
+        stats = dict(self._crawl_stats)
+        stats["skipped_oversize"] = len(self._skipped_documents)
+        return stats
+
+    def get_skipped_documents(self) -> List[Dict]:
+        """크기 상한 때문에 받지 않은 파일 목록 (cik, accession_number, form, name, size, reason)"""
+        return list(self._skipped_documents)
+
+    def _resolve_db(self, db: Optional[SECDatabase], save_to_db: bool) -> Optional[SECDatabase]:
+        if save_to_db:
+            return db or self.db or SECDatabase()
+        return db or self.db
+
+    def _is_stored(self, known: Dict[str, Dict], filing_info: Dict) -> bool:
+        """DB에 있고 원문(블롭 또는 예전 파일)도 남아 있으면 True (지워졌으면 다시 받음)"""
+        row = known.get(filing_info["accession_number"])
+        return bool(row and self.blob_store.exists(row.get("file_path")))
+
+    def _store_filings(
+        self,
+        database: Optional[SECDatabase],
+        pending: List[Tuple[Dict, Path]],
+    ) -> Dict[str, str]:
+        """
+        새로 받은 원문을 압축 블롭으로 옮기고 한 트랜잭션으로 저장 (기존 행은 파일 정보만 갱신)한 뒤
+        정제 텍스트를 추출합니다.
+
+        Returns:
+            {접수번호: 블롭 참조} (DB 저장에 실패하면 빈 딕셔너리 + 실패 건수 집계, 원문 파일은 그대로 남김)
+        """
+        if not database or not pending:
+            return {}
+        stored: List[Tuple[Dict, str]] = []
+        for metadata, file_path in pending:
+            ref = self.blob_store.put_file(file_path, metadata.get("sha256"), remove_source=False)
+            stored.append(({
+                **metadata,
+                "sha256": BlobStore.digest(ref),
+                "file_format": file_path.suffix[1:] if file_path.suffix else "unknown",
+                "file_size": file_path.stat().st_size,
+            }, ref))
+        try:
+            counts = database.save_filings_batch(stored)
+        except Exception as e:
+            print(f"❌ 로컬 DB 저장 실패: {e}")
+            # 실패로 집계해야 high-water mark가 저장되지 않은 공시를 넘어가지 않음
+            self._crawl_stats["failed"] += len(pending)
+            return {}
+        # DB가 블롭을 참조하게 된 뒤에 비압축 원문 삭제
+        for _, file_path in pending:
+            file_path.unlink(missing_ok=True)
+        print(f"💾 공시 저장: {counts['inserted']}건 추가, {counts['updated']}건 갱신")
+        # 수집 시점에 한 번만 정제 텍스트 추출 (에이전트는 이 텍스트를 사용)
+        text_store = FilingTextStore(database, self.blob_store)
+        for metadata, ref in stored:
+            text_store.process(metadata["accession_number"], ref, metadata.get("form"))
+        return {metadata["accession_number"]: ref for metadata, ref in stored}
+
     def crawl_latest_filing(
         self,
         ticker: str,
@@ -442,7 +623,7 @@ class SECCrawler:
         save_to_db: bool = True,
         db: Optional[SECDatabase] = None,
         only_today: bool = True
-    ) -> Optional[Tuple[Dict, Path]]:
+    ) -> Optional[Tuple[Dict, FileRef]]:
         results = self.crawl_filings_in_window(
             ticker=ticker,
             file_format=file_format,
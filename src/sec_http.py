@@ -0,0 +1,284 @@
+"""
+SEC HTTP 모듈
+SEC 공정 접근 정책(초당 10회)을 모든 스레드에 걸쳐 지키는 토큰 버킷,
+재시도/타임아웃이 적용된 세션, 공시 파일 병렬 다운로드 풀을 제공합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷 (rate: 초당 토큰 수, capacity: 버스트 허용량)
+
+    capacity가 1보다 크면 가득 찬 버킷 + 1초 동안 채워진 토큰만큼 한꺼번에 나갈 수 있으므로
+    (capacity=rate면 첫 1초에 약 2배), 기본값 1로 요청 간격을 1/rate초 이상으로 고르게 둡니다.
+    → 어떤 1초 구간에서도 rate회를 넘지 않음
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rate: 초당 토큰 수
+            capacity: 버스트 허용량 (1이면 버스트 없음)
+            clock, sleep: 시간 함수 (테스트에서 가짜 시계 주입용)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 1개를 소비합니다. 토큰이 없으면 생길 때까지 대기합니다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                # 부동소수점 오차로 0.999999…에서 멈추지 않도록 아주 작은 여유를 둠
+                if self._tokens >= 1 - 1e-9:
+                    self._tokens = max(0.0, self._tokens - 1)
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+
+class HttpMetrics:
+    """요청 수, 재시도, 전송 바이트, 소요 시간 집계 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.errors = 0
+            self.bytes = 0
+            self.throttle_wait = 0.0
+            self.started = time.monotonic()
+
+    def record(self, *, nbytes: int = 0, retried: bool = False, error: bool = False, waited: float = 0.0) -> None:
+        with self._lock:
+            self.requests += 1
+            self.bytes += nbytes
+            self.throttle_wait += waited
+            if retried:
+                self.retries += 1
+            if error:
+                self.errors += 1
+
+    def add_bytes(self, nbytes: int) -> None:
+        """스트리밍 응답처럼 요청 이후에 읽은 바이트 수 누적"""
+        with self._lock:
+            self.bytes += nbytes
+
+    def snapshot(self) -> Dict:
+        """현재까지의 처리량 지표"""
+        with self._lock:
+            elapsed = max(time.monotonic() - self.started, 1e-9)
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "errors": self.errors,
+                "bytes": self.bytes,
+                "elapsed_sec": round(elapsed, 3),
+                "requests_per_sec": round(self.requests / elapsed, 2),
+                "mb_per_sec": round(self.bytes / elapsed / 1_000_000, 3),
+                "throttle_wait_sec": round(self.throttle_wait, 3),
+            }
+
+
+# 프로세스 전체에서 공유하는 SEC 요청 제한 (모든 크롤러/스레드 합산)
+SEC_MAX_RPS = float(os.getenv("SEC_MAX_RPS", "10"))
+_GLOBAL_BUCKET = TokenBucket(SEC_MAX_RPS)
+
+
+class RateLimitedSession(requests.Session):
+    """
+    모든 요청에 전역 토큰 버킷, 기본 타임아웃, 429/503 재시도(지수 백오프)를 적용하는 세션
+    """
+
+    RETRY_STATUS = (429, 503)
+
+    def __init__(
+        self,
+        bucket: Optional[TokenBucket] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff: float = 1.0,
+        pool_size: int = 10,
+    ):
+        """
+        Args:
+            bucket: 요청 제한 토큰 버킷 (None이면 프로세스 전역 버킷)
+            timeout: 요청별 기본 타임아웃 (초)
+            max_retries: 429/503 및 연결 오류 시 최대 재시도 횟수
+            backoff: 백오프 기본 간격 (초, 시도마다 2배)
+            pool_size: 호스트당 커넥션 풀 크기 (다운로드 워커 수 이상)
+        """
+        super().__init__()
+        self.bucket = bucket or _GLOBAL_BUCKET
+        self.timeout = timeout if timeout is not None else float(os.getenv("SEC_HTTP_TIMEOUT", "30"))
+        self.max_retries = max_retries if max_retries is not None else int(os.getenv("SEC_HTTP_MAX_RETRIES", "3"))
+        self.backoff = backoff
+        self.metrics = HttpMetrics()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        while True:
+            waited = self.bucket.acquire()
+            try:
+                response = super().request(method, url, *args, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.metrics.record(error=True, retried=attempt < self.max_retries, waited=waited)
+                if attempt >= self.max_retries:
+                    raise
+                self._sleep_backoff(attempt, None)
+                attempt += 1
+                continue
+
+            if response.status_code in self.RETRY_STATUS and attempt < self.max_retries:
+                self.metrics.record(retried=True, waited=waited)
+                retry_after = response.headers.get("Retry-After")
+                response.close()
+                self._sleep_backoff(attempt, retry_after)
+                attempt += 1
+                continue
+
+            nbytes = 0 if kwargs.get("stream") else len(response.content or b"")
+            self.metrics.record(nbytes=nbytes, error=response.status_code >= 400, waited=waited)
+            return response
+
+    def download(
+        self,
+        url: str,
+        dest: Path,
+        chunk_size: int = 1 << 20,
+        max_resumes: int = 3,
+    ) -> Optional[str]:
+        """
+        url을 dest로 스트리밍 저장하고 SHA-256을 함께 계산합니다.
+        임시 파일(.part)에 쓰고 완료 후 원자적으로 rename하며,
+        전송이 끊기면 서버가 지원할 경우 Range 요청으로 이어 받습니다.
+
+        Returns:
+            파일의 SHA-256 (hex) 또는 None (200/206 이외의 응답)
+        """
+        part_path = dest.with_name(dest.name + ".part")
+        attempt = 0
+        while True:
+            offset = part_path.stat().st_size if part_path.exists() else 0
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            response = self.get(url, headers=headers, stream=True)
+            try:
+                if response.status_code == 416 and offset:
+                    # 이어받기 위치가 잘못됨: 처음부터 다시 받음
+                    part_path.unlink(missing_ok=True)
+                    continue
+                if response.status_code not in (200, 206):
+                    return None
+
+                digest = hashlib.sha256()
+                if response.status_code == 206:
+                    # 이미 받은 앞부분도 해시에 포함
+                    with open(part_path, "rb") as f:
+                        for chunk in iter(lambda: f.read(chunk_size), b""):
+                            digest.update(chunk)
+                    mode = "ab"
+                else:
+                    mode = "wb"  # Range 미지원: 처음부터
+
+                with open(part_path, mode) as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if not chunk:
+                            continue
+                        digest.update(chunk)
+                        f.write(chunk)
+                        self.metrics.add_bytes(len(chunk))
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                if attempt >= max_resumes:
+                    raise
+                attempt += 1
+                print(f"전송 중단, 이어받기 재시도 ({attempt}/{max_resumes}): {e}")
+                continue
+            finally:
+                response.close()
+
+            os.replace(part_path, dest)
+            return digest.hexdigest()
+
+    def _sleep_backoff(self, attempt: int, retry_after: Optional[str]) -> None:
+        delay = self.backoff * (2 ** attempt) + random.uniform(0, self.backoff)
+        if retry_after:
+            try:
+                delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+        time.sleep(delay)
+
+
+class DownloadPool:
+    """제한된 수의 워커로 작업을 병렬 실행하고 입력 순서대로 결과를 반환하는 풀"""
+
+    MAX_WORKERS = int(os.getenv("SEC_DOWNLOAD_WORKERS", "4"))
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max(1, max_workers or self.MAX_WORKERS)
+
+    def map(self, func: Callable[[T], R], items: List[T]) -> List[Optional[R]]:
+        """
+        items 각각에 func을 병렬 적용합니다.
+        실패한 항목은 None으로 채워 입력 순서를 유지합니다.
+        """
+        if not items:
+            return []
+
+        def run(item: T) -> Optional[R]:
+            try:
+                return func(item)
+            except Exception as e:
+                print(f"다운로드 작업 실패: {e}")
+                return None
+
+        if self.max_workers == 1 or len(items) == 1:
+            return [run(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(items))) as executor:
+            return list(executor.map(run, items))
@@ -0,0 +1,248 @@
+"""
+SEC submissions 스냅샷 모듈
+data.sec.gov/submissions/CIK*.json을 CIK당 한 번만 받아 파싱하고,
+윈도우 필터 / 양식별 최신 공시 / 접수번호 집합 조회에 재사용합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional
+
+import requests
+
+from src.db import SECDatabase
+from src.time_utils import KST, parse_iso_datetime
+
+
+class SubmissionsSnapshot:
+    """submissions JSON의 recent 컬럼을 타입 배열로 보관하는 스냅샷"""
+
+    def __init__(
+        self,
+        cik: str,
+        data: Dict,
+        etag: Optional[str] = None,
+        not_modified: bool = False,
+    ):
+        """
+        Args:
+            cik: CIK 번호 (10자리)
+            data: submissions JSON 전체
+            etag: 응답 ETag (조건부 요청용)
+            not_modified: 304 응답으로 디스크 캐시를 재사용했으면 True
+        """
+        self.cik = cik
+        self.name = data.get("name", "")
+        self.etag = etag
+        self.not_modified = not_modified
+
+        recent = (data.get("filings") or {}).get("recent") or {}
+        self.forms = tuple(recent.get("form") or ())
+        size = len(self.forms)
+        self.accession_numbers = tuple(self._column(recent, "accessionNumber", size))
+        self.filing_dates = tuple(self._column(recent, "filingDate", size))
+        self.report_dates = tuple(self._column(recent, "reportDate", size))
+        self.acceptance_datetimes = tuple(self._column(recent, "acceptanceDateTime", size))
+        self.primary_documents = tuple(self._column(recent, "primaryDocument", size))
+        self.sizes = array("q", (int(v or 0) for v in self._column(recent, "size", size)))
+        # acceptanceDateTime → epoch 초 (없으면 NaN)
+        self.acceptance_ts = array("d", (self._to_epoch(v) for v in self.acceptance_datetimes))
+        self._accession_set: Optional[FrozenSet[str]] = None
+
+    def __len__(self) -> int:
+        return len(self.forms)
+
+    @property
+    def accession_set(self) -> FrozenSet[str]:
+        """recent에 포함된 모든 접수번호"""
+        if self._accession_set is None:
+            self._accession_set = frozenset(self.accession_numbers)
+        return self._accession_set
+
+    def acceptance_kst(self, idx: int) -> Optional[datetime]:
+        """idx번째 공시의 SEC 접수 시각 (KST)"""
+        ts = self.acceptance_ts[idx]
+        if math.isnan(ts):
+            return None
+        return datetime.fromtimestamp(ts, tz=KST)
+
+    def filing_info(self, idx: int) -> Dict:
+        """idx번째 공시를 크롤러 공용 딕셔너리 형태로 변환"""
+        filed_date = self.filing_dates[idx]
+        info = {
+            "form": self.forms[idx],
+            "filed": filed_date,
+            "filed_date": filed_date,
+            "reporting_for": self.report_dates[idx] or None,
+            "filing_entity": self.name,
+            "accession_number": self.accession_numbers[idx],
+            "primary_document": self.primary_documents[idx] or None,
+            "cik": self.cik,
+        }
+        acc_kst = self.acceptance_kst(idx)
+        if acc_kst:
+            info["acceptance_datetime"] = self.acceptance_datetimes[idx]
+            info["acceptance_date"] = acc_kst.date().isoformat()
+        return info
+
+    def count_newer_than(
+        self,
+        acceptance_datetime: Optional[str] = None,
+        accession_number: Optional[str] = None,
+    ) -> int:
+        """
+        high-water mark(마지막으로 처리한 접수 시각/접수번호)보다 최신인 앞쪽 행 수
+        recent는 최신순이므로 마크를 만나는 지점에서 멈춥니다.
+        """
+        mark_ts = self._to_epoch(acceptance_datetime)
+        for idx in range(len(self)):
+            if accession_number and self.accession_numbers[idx] == accession_number:
+                return idx
+            ts = self.acceptance_ts[idx]
+            if not math.isnan(mark_ts) and not math.isnan(ts) and ts < mark_ts:
+                return idx
+        return len(self)
+
+    def filings_in_window(
+        self,
+        window_start: datetime,
+        window_end: datetime,
+        stop: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        [window_start, window_end) 구간에 접수된 공시 목록
+        접수 시각이 없으면 제출일(filingDate, KST 자정)로 판단합니다.
+
+        Args:
+            stop: 앞에서부터 이 개수의 행만 확인 (high-water mark 이전에서 중단)
+        """
+        filings = []
+        for idx in range(len(self) if stop is None else min(stop, len(self))):
+            filed_date = self.filing_dates[idx]
+            candidate_dt = self.acceptance_kst(idx) or _parse_filed_date(filed_date)
+            if not candidate_dt:
+                continue
+            if not (window_start <= candidate_dt < window_end):
+                continue
+            info = self.filing_info(idx)
+            info.setdefault("acceptance_datetime", filed_date)
+            info.setdefault("acceptance_date", candidate_dt.date().isoformat())
+            filings.append(info)
+        return filings
+
+    def latest_by_form(self, form: str) -> Optional[Dict]:
+        """해당 양식의 가장 최근 공시 (recent는 최신순 정렬)"""
+        for idx, value in enumerate(self.forms):
+            if value == form:
+                return self.filing_info(idx)
+        return None
+
+    @staticmethod
+    def _column(recent: Dict, key: str, size: int) -> List:
+        values = list(recent.get(key) or ())
+        if len(values) < size:
+            values.extend([""] * (size - len(values)))
+        return values[:size]
+
+    @staticmethod
+    def _to_epoch(raw: Optional[str]) -> float:
+        dt = parse_iso_datetime(raw)
+        if not dt:
+            return math.nan
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+
+
+class SubmissionsCache:
+    """CIK별 submissions JSON 디스크 캐시 (조건부 GET으로 재검증)"""
+
+    SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK{cik}.json"
+    CACHE_DIR = os.getenv("SEC_SUBMISSIONS_CACHE_DIR", "downloads/sec_cache/submissions")
+
+    def __init__(
+        self,
+        session: requests.Session,
+        db: Optional[SECDatabase] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            session: SEC User-Agent가 설정된 requests 세션
+            db: ETag/Last-Modified를 저장할 데이터베이스 (None이면 기본 DB)
+            cache_dir: JSON 원본을 저장할 디렉토리
+        """
+        self.session = session
+        self.db = db or SECDatabase()
+        self.cache_dir = Path(cache_dir or self.CACHE_DIR)
+
+    def cache_path(self, cik: str) -> Path:
+        return self.cache_dir / f"CIK{cik.zfill(10)}.json"
+
+    def load(self, cik: str) -> Optional[SubmissionsSnapshot]:
+        """
+        CIK의 submissions 스냅샷을 가져옵니다.
+        디스크 캐시가 있으면 If-None-Match/If-Modified-Since로 요청하고
+        304면 디스크의 JSON을 그대로 사용합니다.
+        """
+        cik_padded = cik.zfill(10)
+        url = self.SUBMISSIONS_URL.format(cik=cik_padded)
+        path = self.cache_path(cik_padded)
+
+        headers: Dict[str, str] = {}
+        state = self.db.get_http_validators(url) if path.exists() else None
+        if state:
+            if state.get("etag"):
+                headers["If-None-Match"] = state["etag"]
+            if state.get("last_modified"):
+                headers["If-Modified-Since"] = state["last_modified"]
+
+        now = datetime.now(timezone.utc)
+        try:
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                self.db.update_http_validators(url, checked_at=now)
+                data = json.loads(path.read_bytes())
+                return SubmissionsSnapshot(
+                    cik_padded, data, etag=state.get("etag"), not_modified=True
+                )
+            response.raise_for_status()
+            body = response.content
+            data = json.loads(body)
+        except Exception as e:
+            print(f"submissions 조회 중 오류 발생 (CIK {cik_padded}): {e}")
+            return None
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        tmp_path.write_bytes(body)
+        tmp_path.replace(path)
+
+        etag = response.headers.get("ETag")
+        self.db.update_http_validators(
+            url,
+            etag=etag,
+            last_modified=response.headers.get("Last-Modified"),
+            checked_at=now,
+        )
+        return SubmissionsSnapshot(cik_padded, data, etag=etag)
+
+
+def _parse_filed_date(filed_str: Optional[str]) -> Optional[datetime]:
+    if not filed_str:
+        return None
+    try:
+        dt = datetime.fromisoformat(filed_str)
+    except ValueError:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=KST)
+    else:
+        dt = dt.astimezone(KST)
+    return dt
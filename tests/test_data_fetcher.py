@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from src.database.data_fetcher import DataFetcher
+from src.time_utils import KST
+
+WINDOW = (datetime(2026, 10, 16, 6, tzinfo=KST), datetime(2026, 10, 17, 6, tzinfo=KST))
+
+
+class _Blobs:
+    def exists(self, ref):
+        return bool(ref)
+
+    def read_text(self, ref):
+        raise AssertionError("정제 텍스트가 없어도 원문 전체를 읽지 않아야 함")
+
+
+class _TextStore:
+    def open_content(self, meta, text_record=None):
+        return None
+
+
+def _fetcher():
+    fetcher = DataFetcher.__new__(DataFetcher)
+    fetcher.text_store = _TextStore()
+    fetcher.blobs = _Blobs()
+    return fetcher
+
+
+def test_missing_clean_text_does_not_read_raw_document():
+    meta = {"accession_number": "0001045810-26-000101", "form": "8-K", "file_path": "blob:" + "a" * 64}
+
+    data = _fetcher()._build_ticker_data(
+        "NVDA", *WINDOW, [], [meta], {"10-K": None, "10-Q": None},
+        include_file_content=True, text_records={},
+    )
+
+    assert data["sec_filings"] == [{"metadata": meta, "content": None}]
@@ -0,0 +1,72 @@
+import pytest
+
+from src.db import SECDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SECDatabase(str(tmp_path / "sec.db"))
+
+
+def _news(**overrides):
+    item = {
+        "title": "NVIDIA beats estimates",
+        "url": "https://example.com/nvda-q3",
+        "summary": "Revenue up 94%",
+        "source": "Reuters",
+        "published_at": "2026-10-16T09:00:00",
+        "content": "Full article body",
+    }
+    item.update(overrides)
+    return item
+
+
+def _filing(**overrides):
+    info = {
+        "ticker": "NVDA",
+        "cik": "0001045810",
+        "accession_number": "0001045810-26-000101",
+        "form": "10-Q",
+        "filed_date": "2026-10-15",
+        "acceptance_date": "2026-10-15",
+        "reporting_for": "2026-09-30",
+        "filing_entity": "NVIDIA CORP",
+        "sha256": "a" * 64,
+        "file_format": "htm",
+        "file_size": 1234,
+    }
+    info.update(overrides)
+    return info
+
+
+def test_news_resave_without_changes_is_not_counted(db):
+    assert db.save_news_items("NVDA", [_news()]) == {"inserted": 1, "updated": 0, "skipped": 0}
+    assert db.save_news_items("NVDA", [_news()]) == {"inserted": 0, "updated": 0, "skipped": 0}
+    # 비어 있는 값은 기존 값을 덮어쓰지 않으므로 갱신이 아님
+    assert db.save_news_items("NVDA", [_news(summary=None, content="")])["updated"] == 0
+
+
+def test_news_real_change_is_counted(db):
+    db.save_news_items("NVDA", [_news(), _news(url="https://example.com/other")])
+
+    counts = db.save_news_items("NVDA", [_news(summary="Revenue up 95%"), _news(url="https://example.com/other")])
+
+    assert counts == {"inserted": 0, "updated": 1, "skipped": 0}
+    assert {row["summary"] for row in db.get_news("NVDA")} == {"Revenue up 95%", "Revenue up 94%"}
+
+
+def test_filing_resave_without_changes_is_not_counted(db):
+    ref = "blob:" + "a" * 64
+    assert db.save_filings_batch([(_filing(), ref)]) == {"inserted": 1, "updated": 0}
+    assert db.save_filings_batch([(_filing(), ref)]) == {"inserted": 0, "updated": 0}
+
+
+def test_filing_file_change_is_counted(db):
+    # 예전 방식의 파일 경로로 저장된 행 → 블롭으로 옮김
+    db.save_filings_batch([(_filing(), "downloads/sec_filings/0001045810-26-000101.htm")])
+
+    counts = db.save_filings_batch([(_filing(), "blob:" + "a" * 64)])
+
+    assert counts == {"inserted": 0, "updated": 1}
+    row = db.get_filings_by_accessions(["0001045810-26-000101"])["0001045810-26-000101"]
+    assert row["file_path"] == "blob:" + "a" * 64
@@ -0,0 +1,89 @@
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from src.blob_store import BlobStore
+from src.db import SECDatabase
+from src.edgar_index import DailyIndexDiscovery
+
+INDEX_DIR = Path(__file__).parent / "fixtures" / "daily-index"
+DAYS = [date(2026, 10, 15), date(2026, 10, 16)]
+TRACKED = {"1045810": "nvda", "0000002488": "AMD"}
+
+ANNUAL = "0001045810-26-000101"    # 10-Q
+CURRENT = "0001045810-26-000102"   # 8-K
+INSIDER = "0001045810-26-000103"   # Form 4
+AMD_8K = "0000002488-26-000201"
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SECDatabase(str(tmp_path / "sec.db"))
+
+
+@pytest.fixture
+def blob_store(tmp_path):
+    return BlobStore(str(tmp_path / "blobs"))
+
+
+@pytest.fixture
+def discovery(db, blob_store):
+    return DailyIndexDiscovery(db=db, kind="form", index_dir=str(INDEX_DIR), blob_store=blob_store)
+
+
+def _insert_filing(db, accession_number, file_path):
+    with db.get_connection() as conn:
+        conn.execute(
+            """
+            INSERT INTO filings (ticker, cik, accession_number, form, filed_date, filing_entity, file_path, file_format)
+            VALUES ('NVDA', '0001045810', ?, '8-K', '2026-10-15', 'NVIDIA CORP', ?, 'htm')
+            """,
+            (accession_number, file_path),
+        )
+        conn.commit()
+
+
+def _accessions(filings):
+    return sorted(info["accession_number"] for info in filings)
+
+
+def test_discovers_tracked_ciks_across_days(discovery):
+    filings = discovery.discover(TRACKED, DAYS + [date(2026, 10, 19)])  # 19일자 인덱스는 없음
+
+    assert _accessions(filings) == sorted([ANNUAL, CURRENT, INSIDER, AMD_8K])
+    by_accession = {info["accession_number"]: info for info in filings}
+    assert by_accession[ANNUAL]["ticker"] == "NVDA"
+    assert by_accession[ANNUAL]["form"] == "10-Q"
+    assert by_accession[ANNUAL]["filed_date"] == "2026-10-15"
+    assert by_accession[AMD_8K]["cik"] == "0000002488"
+
+
+def test_form_filter(discovery):
+    filings = discovery.discover(TRACKED, DAYS, forms=["10-Q", "8-K"])
+    assert _accessions(filings) == sorted([ANNUAL, CURRENT, AMD_8K])
+
+
+def test_stored_filing_is_skipped(discovery, db, blob_store, tmp_path):
+    source = tmp_path / "doc.htm"
+    source.write_text("<html>8-K</html>")
+    _insert_filing(db, CURRENT, blob_store.put_file(source))
+
+    assert CURRENT not in _accessions(discovery.discover(TRACKED, DAYS))
+
+
+def test_metadata_only_row_is_rediscovered(discovery, db):
+    # 벌크 적재된 메타데이터 행(file_path='')은 원문이 없으므로 다운로드 대상
+    _insert_filing(db, CURRENT, "")
+
+    assert CURRENT in _accessions(discovery.discover(TRACKED, DAYS))
+
+
+def test_missing_blob_is_rediscovered(discovery, db, blob_store, tmp_path):
+    source = tmp_path / "doc.htm"
+    source.write_text("<html>8-K</html>")
+    ref = blob_store.put_file(source)
+    _insert_filing(db, CURRENT, ref)
+    blob_store.path_for(ref).unlink()
+
+    assert CURRENT in _accessions(discovery.discover(TRACKED, DAYS))
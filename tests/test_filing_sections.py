@@ -0,0 +1,74 @@
+from pathlib import Path
+
+import pytest
+
+from src.db import SECDatabase
+from src.filing_sections import FilingSectionIndex, locate_sections
+
+FIXTURE = Path(__file__).parent / "fixtures" / "filing-sections" / "10-Q-toc.txt"
+ACCESSION = "0001045810-26-000101"
+
+
+@pytest.fixture
+def text():
+    return FIXTURE.read_text(encoding="utf-8")
+
+
+@pytest.fixture
+def index(tmp_path, text):
+    db = SECDatabase(str(tmp_path / "sec.db"))
+    text_path = tmp_path / f"{ACCESSION}.clean.txt"
+    text_path.write_text(text, encoding="utf-8")
+    with db.get_connection() as conn:
+        conn.execute(
+            "INSERT INTO filing_texts (accession_number, text_path, text_length) VALUES (?, ?, ?)",
+            (ACCESSION, str(text_path), text_path.stat().st_size),
+        )
+        conn.commit()
+    db.save_filing_sections(ACCESSION, locate_sections(text, by_part=True))
+    return FilingSectionIndex(db)
+
+
+def test_toc_items_before_first_part_are_dropped(text):
+    sections = locate_sections(text, by_part=True)
+
+    assert all(section["part"] for section in sections)
+    assert [(s["part"], s["item"]) for s in sections] == [
+        ("I", "1"), ("I", "2"), ("II", "1"), ("II", "1A"), ("II", "2"),
+    ]
+
+
+def test_without_parts_items_are_kept(text):
+    body = "\n".join(line for line in text.splitlines() if not line.startswith("PART"))
+    sections = locate_sections(body, by_part=True)
+
+    assert {s["item"] for s in sections} == {"1", "1A", "2"}
+    assert {s["part"] for s in sections} == {""}
+
+
+@pytest.mark.parametrize("part", ["II", None])
+def test_risk_factors_section_is_body_not_toc(index, part):
+    section = index.get_section(ACCESSION, "1A", part=part)
+
+    assert section.startswith("Item 1A. Risk Factors\n")
+    assert "export controls" in section
+    assert "| 45" not in section
+
+
+class _RecordingSections:
+    def __init__(self):
+        self.calls = []
+
+    def get_section(self, accession_number, item, part=None, max_bytes=None):
+        self.calls.append((item, part))
+        return ""
+
+
+@pytest.mark.parametrize("form, part", [("10-Q", "II"), ("10-Q/A", "II"), ("10-K", None)])
+def test_risk_manager_reads_part_ii_for_10q(form, part):
+    risk_manager = pytest.importorskip("multiagent.agents.risk_manager")
+    sections = _RecordingSections()
+    agent = risk_manager.RiskManager(toolkit=None, sections=sections)
+
+    agent._risk_factors({"accession_number": ACCESSION, "form": form})
+    assert sections.calls == [("1A", part)]
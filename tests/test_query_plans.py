@@ -0,0 +1,29 @@
+"""
+자주 실행되는 조회의 EXPLAIN QUERY PLAN 회귀 테스트
+인덱스가 빠지거나 쿼리 모양이 바뀌어 테이블 전체 스캔으로 떨어지면 해당 조회 이름으로 실패합니다.
+"""
+
+import pytest
+
+from src.db import SECDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SECDatabase(str(tmp_path / "sec_filings.db"))
+
+
+@pytest.mark.parametrize("name", sorted(SECDatabase.hot_queries()))
+def test_hot_query_uses_index(db, name):
+    assert db.check_query_plans([name]) == {}
+
+
+def test_all_hot_queries_use_indexes(db):
+    assert db.check_query_plans() == {}
+
+
+def test_dropped_index_is_reported(db):
+    conn = db.get_connection()
+    for index in ("idx_filings_ticker_filed", "idx_filings_ticker_form_filed", "idx_filings_ticker_acceptance"):
+        conn.execute(f"DROP INDEX {index}")
+    assert "get_filings_by_ticker" in db.check_query_plans()
@@ -0,0 +1,84 @@
+"""
+전문 검색 인덱스 백필 테스트
+검색 기능(v8) 이전에 저장된 뉴스/기사/공시 정제 텍스트가 rebuild_search_index로 검색되는지 확인합니다.
+"""
+
+import pytest
+
+from src.db import SECDatabase
+
+
+@pytest.fixture
+def db(tmp_path):
+    return SECDatabase(str(tmp_path / "sec_filings.db"))
+
+
+def _insert_unindexed_rows(db, tmp_path):
+    """인덱싱 경로를 거치지 않고 예전 방식으로 저장된 데이터"""
+    text_path = tmp_path / "0001.clean.txt"
+    text_path.write_text("Item 1A. Risk Factors\nSupply chain disruption could harm our margins.", encoding="utf-8")
+    conn = db.get_connection()
+    conn.execute(
+        "INSERT INTO news (ticker, title, url, published_at, content) VALUES (?, ?, ?, ?, ?)",
+        ("GOOG", "Cloud growth", "https://example.com/a", "2026-01-02", "Cloud revenue accelerated sharply."),
+    )
+    conn.execute(
+        "INSERT INTO news_articles (pk, ticker, title, published_at, body) VALUES (?, ?, ?, ?, ?)",
+        ("pk-1", "GOOG", "Antitrust ruling", "2026-01-03", "<item><p>The antitrust remedy was narrow.</p></item>"),
+    )
+    conn.execute("INSERT INTO news_article_tickers (ticker, pk, published_at) VALUES ('GOOG', 'pk-1', '2026-01-03')")
+    conn.execute(
+        """
+        INSERT INTO filings (ticker, cik, accession_number, form, filed_date, filing_entity, file_path, file_format)
+        VALUES ('GOOG', '0001652044', '0001', '10-K', '2026-01-04', 'Alphabet', 'blob:abc', 'htm')
+        """
+    )
+    conn.execute(
+        "INSERT INTO filing_texts (accession_number, text_path, text_length) VALUES (?, ?, ?)",
+        ("0001", str(text_path), text_path.stat().st_size),
+    )
+    conn.commit()
+
+
+def test_existing_rows_are_not_searchable_before_rebuild(db, tmp_path):
+    _insert_unindexed_rows(db, tmp_path)
+    assert db.search("GOOG", "supply chain") == []
+
+
+def test_rebuild_indexes_news_articles_and_filing_texts(db, tmp_path):
+    _insert_unindexed_rows(db, tmp_path)
+
+    counts = db.rebuild_search_index()
+
+    assert counts == {"news": 1, "article": 1, "filing": 1}
+    assert [hit["kind"] for hit in db.search("GOOG", "cloud revenue")] == ["news"]
+    assert [(hit["kind"], hit["ref"]) for hit in db.search("GOOG", "antitrust remedy")] == [("article", "pk-1")]
+    assert [(hit["kind"], hit["ref"]) for hit in db.search("GOOG", "supply chain")] == [("filing", "0001")]
+
+
+def test_rebuild_is_idempotent(db, tmp_path):
+    _insert_unindexed_rows(db, tmp_path)
+    db.rebuild_search_index()
+    db.rebuild_search_index()
+    assert len(db.search("GOOG", "supply chain")) == 1
+
+
+def test_pending_backfill_runs_once_on_init(db, tmp_path):
+    _insert_unindexed_rows(db, tmp_path)
+    conn = db.get_connection()
+    conn.execute("INSERT INTO search_backfill_pending (id) VALUES (1)")
+    conn.commit()
+
+    db.init_db()
+
+    assert db.search("GOOG", "supply chain")
+    assert conn.execute("SELECT COUNT(*) FROM search_backfill_pending").fetchone()[0] == 0
+
+
+def test_linking_an_article_indexes_it_for_that_ticker(db):
+    db.save_news_articles([{"pk": "pk-2", "ticker": "NVDA", "title": "Chips", "body": "<p>Export controls tightened.</p>"}])
+    db.link_news_articles("NVDA", [{"pk": "pk-2", "published_at": "2026-01-05"}])
+    db.link_news_articles("AMD", [{"pk": "pk-2", "published_at": "2026-01-05"}])
+
+    assert [hit["ref"] for hit in db.search("NVDA", "export controls")] == ["pk-2"]
+    assert [hit["ref"] for hit in db.search("AMD", "export controls")] == ["pk-2"]
@@ -0,0 +1,106 @@
+from datetime import datetime
+
+import pytest
+
+from src.blob_store import BlobStore
+from src.db import SECDatabase
+from src.filing_text import FilingTextStore
+from src.sec_crawler import SECCrawler
+from src.sec_submissions import SubmissionsSnapshot
+from src.time_utils import KST
+
+CIK = "0000000001"
+WINDOW = (datetime(2026, 10, 16, tzinfo=KST), datetime(2026, 10, 18, tzinfo=KST))
+
+# recent는 최신순: 기간 내 8-K 2건 + 기간 밖 10-K 1건
+RECENT = [
+    ("8-K", "0000000001-26-000003", "2026-10-17T01:00:00.000Z"),
+    ("8-K", "0000000001-26-000002", "2026-10-16T12:00:00.000Z"),
+    ("10-K", "0000000001-26-000001", "2026-02-01T12:00:00.000Z"),
+]
+
+
+def _snapshot(etag="v1", not_modified=False):
+    recent = {
+        "form": [form for form, _, _ in RECENT],
+        "accessionNumber": [acc for _, acc, _ in RECENT],
+        "acceptanceDateTime": [ts for _, _, ts in RECENT],
+        "filingDate": [ts[:10] for _, _, ts in RECENT],
+        "primaryDocument": ["doc.htm"] * len(RECENT),
+    }
+    data = {"name": "TEST CORP", "filings": {"recent": recent}}
+    return SubmissionsSnapshot(CIK, data, etag=etag, not_modified=not_modified)
+
+
+@pytest.fixture
+def crawler(tmp_path, monkeypatch):
+    db = SECDatabase(str(tmp_path / "sec.db"))
+    crawler = SECCrawler(db=db)
+    crawler.blob_store = BlobStore(str(tmp_path / "blobs"))
+    monkeypatch.setattr(FilingTextStore, "TEXT_DIR", tmp_path / "texts")
+    crawler.downloads = []
+    crawler.failing = set()
+    crawler.snapshot = _snapshot()
+
+    def download(cik, accession_number, form, file_format="xml", primary_document=None):
+        crawler.downloads.append(accession_number)
+        if accession_number in crawler.failing:
+            return None
+        path = tmp_path / f"{accession_number}.htm"
+        path.write_text(f"<html><body>{form} {accession_number}</body></html>")
+        return path
+
+    monkeypatch.setattr(crawler, "get_cik_from_ticker", lambda ticker: CIK)
+    monkeypatch.setattr(crawler, "get_submissions", lambda cik: crawler.snapshot)
+    monkeypatch.setattr(crawler, "_get_crawl_window", lambda: WINDOW)
+    monkeypatch.setattr(crawler, "download_filing_file", download)
+    return crawler
+
+
+def _crawl(crawler, only_today=True):
+    crawler.downloads.clear()
+    return crawler.crawl_filings_in_window("TEST", db=crawler.db, only_today=only_today)
+
+
+def test_mark_advances_to_newest_processed_filing(crawler):
+    _crawl(crawler)
+    assert sorted(crawler.downloads) == sorted(acc for _, acc, _ in RECENT)
+
+    state = crawler.db.get_sec_fetch_state(CIK)
+    assert state["last_accession_number"] == RECENT[0][1]
+    assert state["last_acceptance_datetime"] == RECENT[0][2]
+    assert state["submissions_etag"] == "v1"
+
+
+def test_latest_only_run_does_not_move_mark_past_window_filings(crawler):
+    _crawl(crawler, only_today=False)
+    state = crawler.db.get_sec_fetch_state(CIK)
+    assert not (state and state.get("last_accession_number"))
+
+    # 다음 기간 크롤링은 최신 1건만 받은 실행 이후에도 더 오래된 기간 내 공시를 받아야 함
+    _crawl(crawler)
+    assert RECENT[1][1] in crawler.downloads
+
+
+def test_failed_download_keeps_mark_for_retry(crawler):
+    crawler.failing = {RECENT[1][1]}
+    _crawl(crawler)
+    assert crawler.db.get_sec_fetch_state(CIK) is None
+
+    crawler.failing = set()
+    _crawl(crawler)
+    assert crawler.downloads == [RECENT[1][1]]
+    assert crawler.db.get_sec_fetch_state(CIK)["last_accession_number"] == RECENT[0][1]
+
+
+def test_unchanged_submissions_still_check_annual_quarterly(crawler):
+    _crawl(crawler)
+
+    # 304 + 동일 ETag여도 지워진 10-K 원문은 다시 받아야 함
+    ref = crawler.db.get_filings_by_accessions([RECENT[2][1]])[RECENT[2][1]]["file_path"]
+    crawler.blob_store.path_for(ref).unlink()
+    crawler.snapshot = _snapshot(not_modified=True)
+
+    results = _crawl(crawler)
+    assert crawler.downloads == [RECENT[2][1]]
+    assert [info["accession_number"] for info, _ in results] == [RECENT[2][1]]
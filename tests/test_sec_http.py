@@ -0,0 +1,67 @@
+"""
+SEC 요청 제한(토큰 버킷) 테스트
+가짜 시계로 요청 시각을 기록해 어떤 1초 구간에서도 SEC_MAX_RPS를 넘지 않는지 확인합니다.
+"""
+
+import pytest
+
+from src.sec_http import TokenBucket
+
+
+class FakeClock:
+    """sleep하면 그만큼 시간이 흐르는 가짜 monotonic 시계"""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _max_in_any_window(times, window=1.0, eps=1e-9):
+    """[t, t + window) 구간에 들어간 최대 요청 수 (각 요청 시각에서 시작하는 구간이 최댓값을 가짐)"""
+    return max(sum(1 for other in times if start <= other < start + window - eps) for start in times)
+
+
+def _acquire_times(bucket: TokenBucket, clock: FakeClock, count: int, gaps=None):
+    times = []
+    for i in range(count):
+        if gaps:
+            clock.sleep(gaps[i % len(gaps)])
+        bucket.acquire()
+        times.append(clock())
+    return times
+
+
+@pytest.mark.parametrize("rate", [10, 4, 1])
+def test_back_to_back_requests_never_exceed_rate_in_any_second(rate):
+    clock = FakeClock()
+    bucket = TokenBucket(rate, clock=clock, sleep=clock.sleep)
+    times = _acquire_times(bucket, clock, 200)
+    assert _max_in_any_window(times) <= rate
+
+
+def test_idle_then_burst_does_not_exceed_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(10, clock=clock, sleep=clock.sleep)
+    # 오래 쉬었다가(버킷이 찰 시간) 몰아서 요청하는 패턴을 반복
+    times = _acquire_times(bucket, clock, 300, gaps=[5.0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0.05, 0.3])
+    assert _max_in_any_window(times) <= 10
+
+
+def test_sustained_throughput_matches_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(10, clock=clock, sleep=clock.sleep)
+    times = _acquire_times(bucket, clock, 101)
+    assert times[-1] - times[0] == pytest.approx(10.0)
+
+
+def test_burst_capacity_equal_to_rate_would_exceed_limit():
+    # 예전 기본값(capacity=rate)은 첫 1초에 한도를 넘음 → 기본값이 1이어야 하는 이유
+    clock = FakeClock()
+    bucket = TokenBucket(10, capacity=10, clock=clock, sleep=clock.sleep)
+    times = _acquire_times(bucket, clock, 50)
+    assert _max_in_any_window(times) > 10
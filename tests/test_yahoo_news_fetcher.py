@@ -0,0 +1,168 @@
+import pytest
+
+pytest.importorskip("moto")
+
+import boto3
+from moto import mock_aws
+
+from aws_fetchers.yahoo_news_fetcher import YahooNewsFetcher
+from src.db import SECDatabase
+
+REGION = "ap-northeast-2"
+TABLE = "news"
+INDEX_TABLE = "news-by-ticker"
+BUCKET = "news-bucket"
+
+
+def _news(i):
+    tickers = [["NVDA", "AMD"], ["NVDA"], ["AMD"]][i % 3]
+    return {
+        "pk": f"n{i:02d}",
+        "et_iso": f"2026-10-16T{i:02d}:00:00-04:00",
+        "path": "yahoo/2026/10/16/",
+        "title": f"headline {i}",
+        "source": "Yahoo Finance",
+        "tickers": tickers,
+    }
+
+
+NEWS = [_news(i) for i in range(12)]
+
+
+def _newest(ticker, limit, after=None):
+    """티커별 기대값: (et_iso, pk) 최신순 limit개의 pk"""
+    items = [item for item in NEWS if ticker in item["tickers"]]
+    if after:
+        items = [item for item in items if (item["et_iso"], item["pk"]) > after]
+    items.sort(key=lambda item: (item["et_iso"], item["pk"]), reverse=True)
+    return [item["pk"] for item in items[:limit]]
+
+
+@pytest.fixture
+def aws(monkeypatch):
+    for key, value in {
+        "AWS_ACCESS_KEY_ID": "testing",
+        "AWS_SECRET_ACCESS_KEY": "testing",
+        "AWS_DEFAULT_REGION": REGION,
+    }.items():
+        monkeypatch.setenv(key, value)
+    with mock_aws():
+        dynamodb = boto3.resource("dynamodb", region_name=REGION)
+        table = dynamodb.create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "pk", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "pk", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        s3 = boto3.client("s3", region_name=REGION)
+        s3.create_bucket(Bucket=BUCKET, CreateBucketConfiguration={"LocationConstraint": REGION})
+        for item in NEWS:
+            table.put_item(Item=item)
+            s3.put_object(
+                Bucket=BUCKET,
+                Key=f"{item['path']}{item['pk']}.xml",
+                Body=f"<html><body>{item['title']}</body></html>".encode(),
+            )
+        yield table
+
+
+def _fetcher(tmp_path, index_table_name=INDEX_TABLE):
+    return YahooNewsFetcher(
+        table_name=TABLE,
+        bucket_name=BUCKET,
+        region_name=REGION,
+        index_table_name=index_table_name,
+        endpoint_url=None,
+        db=SECDatabase(str(tmp_path / "sec.db")),
+    )
+
+
+def _no_scan(*args, **kwargs):
+    raise AssertionError("역색인이 있으면 원본 테이블을 Scan하지 않아야 함")
+
+
+def test_query_path_returns_newest_per_ticker(aws, tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path)
+    fetcher.create_ticker_index_table()
+    # 여러 티커에 걸린 기사는 티커마다 한 행
+    assert fetcher.backfill_ticker_index() == 16
+    monkeypatch.setattr(fetcher, "_scan_ticker", _no_scan)
+    monkeypatch.setattr(fetcher, "_scan_tickers", _no_scan)
+
+    results = fetcher.fetch_many(["nvda", "AMD"], limit=3)
+
+    assert [a["pk"] for a in results["NVDA"]] == _newest("NVDA", 3)
+    assert [a["pk"] for a in results["AMD"]] == _newest("AMD", 3)
+    assert results["NVDA"][0]["article_raw"] == "<html><body>headline 10</body></html>"
+    # 두 티커에 걸친 기사(n09)는 한 번만 다운로드
+    assert fetcher.get_download_metrics()["objects"] == len(set(_newest("NVDA", 3) + _newest("AMD", 3)))
+
+
+def test_query_path_reads_only_news_after_mark(aws, tmp_path, monkeypatch):
+    fetcher = _fetcher(tmp_path)
+    fetcher.create_ticker_index_table()
+    fetcher.backfill_ticker_index()
+    monkeypatch.setattr(fetcher, "_scan_ticker", _no_scan)
+    fetcher.fetch("NVDA", limit=3)
+    downloaded = fetcher.get_download_metrics()["objects"]
+
+    item = {**_news(12), "tickers": ["NVDA"]}
+    aws.put_item(Item=item)
+    boto3.client("s3", region_name=REGION).put_object(
+        Bucket=BUCKET, Key=f"{item['path']}{item['pk']}.xml", Body=b"<html>new</html>"
+    )
+    fetcher.index_news_item(item)
+
+    articles = fetcher.fetch("NVDA", limit=3)
+
+    assert [a["pk"] for a in articles] == ["n12"] + _newest("NVDA", 2)
+    assert fetcher.get_download_metrics()["objects"] == downloaded + 1
+
+
+def test_missing_index_table_falls_back_to_scan(aws, tmp_path):
+    fetcher = _fetcher(tmp_path)  # 역색인 테이블을 만들지 않음 → ResourceNotFound
+
+    results = fetcher.fetch_many(["NVDA", "AMD"], limit=2)
+
+    assert [a["pk"] for a in results["NVDA"]] == _newest("NVDA", 2)
+    assert [a["pk"] for a in results["AMD"]] == _newest("AMD", 2)
+
+
+@pytest.mark.parametrize("segments", [1, 4])
+def test_segmented_scan_merges_segments(aws, tmp_path, segments):
+    fetcher = _fetcher(tmp_path, index_table_name=None)
+    fetcher.SCAN_SEGMENTS = segments
+    after = (NEWS[5]["et_iso"], NEWS[5]["pk"])
+
+    buckets = fetcher._scan_tickers({"NVDA": None, "AMD": after, "TSLA": None}, limit=3)
+
+    # 구간별로 최신 limit개씩 모은 뒤 합치므로 티커별 후보는 최대 구간 수 × limit개
+    assert len(buckets["NVDA"]) <= segments * 3
+    assert len({item["pk"] for item in buckets["NVDA"]}) == len(buckets["NVDA"])
+    merged = YahooNewsFetcher._trim_new_items("NVDA", buckets["NVDA"], 3, None)
+    assert [item["pk"] for item in merged] == _newest("NVDA", 3)
+
+    assert all((item["et_iso"], item["pk"]) > after for item in buckets["AMD"])
+    merged = YahooNewsFetcher._trim_new_items("AMD", buckets["AMD"], 3, after)
+    assert [item["pk"] for item in merged] == _newest("AMD", 3, after)
+    assert buckets["TSLA"] == []
+
+
+def test_scan_segment_heap_ties_do_not_compare_items(aws):
+    # 정렬 키(et_iso, pk)가 같은 항목 (pk가 없는 원본 행) - 딕셔너리끼리 비교하면 TypeError
+    dynamodb = boto3.resource("dynamodb", region_name=REGION)
+    table = dynamodb.create_table(
+        TableName="news-without-pk",
+        KeySchema=[{"AttributeName": "id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    for i in range(4):
+        table.put_item(Item={"id": f"row{i}", "et_iso": "2026-10-16T09:00:00-04:00", "tickers": ["NVDA"]})
+    table.put_item(Item={"id": "newest", "et_iso": "2026-10-16T10:00:00-04:00", "tickers": ["NVDA"]})
+
+    result = YahooNewsFetcher._scan_segment(table, 0, 1, {"NVDA": None}, limit=3)
+
+    ids = [item["id"] for item in result["NVDA"]]
+    assert len(ids) == 3
+    assert "newest" in ids